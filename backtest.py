@@ -0,0 +1,228 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Rolling-cohort historical backtests: for every start period s of a return
+series, the outcome of the W-period window rates[s:s + W].
+
+Running variableInvestor (or the finallyRetired recurrence) once per window
+costs O(N * W). Here every cohort comes from shared prefix tables instead.
+The series is cut into blocks of W periods. Every window that starts in
+block b ends before block b + 2, so with prefix products A and prefix sums
+of their reciprocals Y, both anchored at the start of block b,
+
+    A_i = prod_{t_b <= j < i} (1 + r_j)        Y_i = sum_{t_b < k <= i} 1 / A_k
+
+the window [s, e) gives
+
+    growth       A_e / A_s
+    balance      (A_e / A_s) * P + c * A_e * (Y_e - Y_s)
+    withdrawals  B_m < 0  <=>  Y_{s+m} - Y_s > B / (E * A_s)
+
+Y is increasing, so each cohort's depletion year is a binary search. The
+tables have 2N entries and each cohort is O(1) (O(log W) for depletion).
+Anchoring per block keeps every product within 2W periods of growth, so it
+cannot overflow over a long history.
+
+Cohorts evaluated this way agree with the scalar recurrences to within
+financial_models.CLOSED_FORM_RTOL. Depletion years are identical, except when
+a year-end balance is within rounding of the 1e-6 threshold. Windows containing a rate <= -100%, a
+non-finite rate, or so much growth that Y_e - Y_s would lose precision use
+the year-by-year loop (vectorized across those cohorts) instead.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from batch_models import variableInvestor_batch
+from financial_models import CLOSED_FORM_RTOL, DEPLETION_THRESHOLD
+
+# Largest growth (or shrinkage) within a block pair before Y_e - Y_s can lose
+# more than ~1e6 * machine epsilon of relative accuracy.
+MAX_BLOCK_RANGE = CLOSED_FORM_RTOL / np.finfo(float).eps
+
+
+@dataclass
+class BacktestResult:
+    """Per-cohort outcomes; index i is the window starting at period i."""
+    window: int
+    final_balances: np.ndarray                  # balance at the end of the window (0 once depleted)
+    years_lasted: Optional[np.ndarray]          # retirement only: period of depletion, or window if never
+    depleted: Optional[np.ndarray]              # retirement only: depleted within the window
+    success_rate: Optional[float]               # share of cohorts that never depleted / reached the target
+
+    @property
+    def cohorts(self) -> int:
+        return self.final_balances.size
+
+
+# --- Prefix Tables ---
+
+class _CohortTables:
+    """Block-anchored prefix products A and reciprocal sums Y for every cohort of a series."""
+
+    def __init__(self, rates: np.ndarray, window: int):
+        n = rates.size
+        self.window = window
+        self.cohorts = n - window + 1
+        blocks = -(-self.cohorts // window)
+        span = 2 * window
+
+        # growth[b, j] = 1 + rates[b * W + j]; periods past the end grow by 1.
+        growth = np.ones(blocks * window + window)
+        np.add(rates, 1.0, out=growth[:n])
+        growth = np.lib.stride_tricks.as_strided(
+            growth, shape=(blocks, span), strides=(window * growth.strides[0], growth.strides[0]))
+
+        self.A = np.empty((blocks, span + 1))
+        self.Y = np.empty((blocks, span + 1))
+        self.A[:, 0] = 1.0
+        self.Y[:, 0] = 0.0
+        with np.errstate(over="ignore", under="ignore", divide="ignore", invalid="ignore"):
+            np.cumprod(growth, axis=1, out=self.A[:, 1:])
+            np.divide(1.0, self.A[:, 1:], out=self.Y[:, 1:])
+            np.cumsum(self.Y[:, 1:], axis=1, out=self.Y[:, 1:])
+
+        # Cohorts whose block the prefix formulas cannot handle accurately.
+        usable = (growth > 0).all(axis=1) & np.isfinite(self.A).all(axis=1) & np.isfinite(self.Y).all(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = self.A.max(axis=1) / self.A.min(axis=1)
+        usable &= spread <= MAX_BLOCK_RANGE
+
+        starts = np.arange(self.cohorts)
+        self.block = starts // window
+        self.offset = starts - self.block * window
+        self.fast = usable[self.block]
+
+    def at(self, table: np.ndarray, periods) -> np.ndarray:
+        """table value `periods` after each cohort's start."""
+        return table[self.block, self.offset + periods]
+
+
+# --- Backtests ---
+
+def accumulation_backtest(rates, window: int, principal: float, annual_contribution: float = 0.0,
+                          target: Optional[float] = None) -> BacktestResult:
+    """
+    variableInvestor(principal, rates[s:s + window], annual_contribution) for every start s.
+
+    Parameters:
+        rates (array_like): Historical return series (e.g. ReturnDataset.series()).
+        window (int): Periods per cohort.
+        principal (float): Starting principal.
+        annual_contribution (float): Amount added at the end of each period.
+        target (float, optional): Balance a cohort must reach to count as a success.
+
+    Returns:
+        BacktestResult: Final balance per cohort and the share reaching `target`.
+    """
+    rates = _as_series(rates, window)
+    tables = _CohortTables(rates, window)
+    final = np.empty(tables.cohorts)
+
+    fast = tables.fast
+    a_start, a_end = tables.at(tables.A, 0)[fast], tables.at(tables.A, window)[fast]
+    y_start, y_end = tables.at(tables.Y, 0)[fast], tables.at(tables.Y, window)[fast]
+    final[fast] = a_end / a_start * principal + annual_contribution * a_end * (y_end - y_start)
+
+    slow = np.flatnonzero(~fast)
+    if slow.size:
+        final[slow] = variableInvestor_batch(principal, _windows(rates, window)[slow], annual_contribution)
+
+    success = None if target is None else float(np.mean(final >= target))
+    return BacktestResult(window, final, None, None, success)
+
+
+def retirement_backtest(rates, window: int, balance: float, expense: float) -> BacktestResult:
+    """
+    The finallyRetired recurrence (balance * (1 + r) - expense each period) over
+    rates[s:s + window] for every start s, capped at the window length.
+
+    Returns:
+        BacktestResult: Depletion period per cohort (window if it never
+        depleted), end-of-window balances and the share that never depleted.
+    """
+    rates = _as_series(rates, window)
+    tables = _CohortTables(rates, window)
+    years = np.full(tables.cohorts, window, dtype=np.int64)
+    final = np.zeros(tables.cohorts)
+
+    fast = tables.fast if (balance > 0 and expense > 0) else np.zeros(tables.cohorts, dtype=bool)
+    idx = np.flatnonzero(fast)
+    if idx.size:
+        years[idx], final[idx] = _depletion_search(tables, idx, balance, expense)
+
+    slow = np.flatnonzero(~fast)
+    if slow.size:
+        years[slow], final[slow] = _retirement_loop(_windows(rates, window)[slow], balance, expense)
+
+    depleted = (years < window) | (final < DEPLETION_THRESHOLD)
+    final[depleted] = 0.0
+    return BacktestResult(window, final, years, depleted, float(np.mean(~depleted)))
+
+
+def _depletion_search(tables: _CohortTables, idx, balance: float, expense: float):
+    """First period whose balance falls below the threshold, by binary search on Y."""
+    window = tables.window
+    block, offset = tables.block[idx], tables.offset[idx]
+    A, Y = tables.A, tables.Y
+    a_start, y_start = A[block, offset], Y[block, offset]
+    limit = y_start + balance / (expense * a_start)
+
+    def balance_after(m):
+        a = A[block, offset + m]
+        return a / a_start * balance - expense * a * (Y[block, offset + m] - y_start)
+
+    # First m in [1, window] with Y_{s+m} >= limit (balance <= 0), window + 1 if none.
+    low = np.ones(idx.size, dtype=np.int64)
+    high = np.full(idx.size, window + 1, dtype=np.int64)
+    while True:
+        open_ = low < high
+        if not open_.any():
+            break
+        mid = (low + high) // 2
+        reached = np.zeros(idx.size, dtype=bool)
+        reached[open_] = Y[block[open_], offset[open_] + mid[open_]] >= limit[open_]
+        high = np.where(open_ & reached, mid, high)
+        low = np.where(open_ & ~reached, mid + 1, low)
+
+    # A balance can also end a period in (0, threshold) just before going negative.
+    years = np.minimum(low, window)
+    previous = np.maximum(low - 1, 1)
+    early = (low > 1) & (balance_after(previous) < DEPLETION_THRESHOLD)
+    years = np.where(early, previous, years)
+    return years, balance_after(years)
+
+
+def _retirement_loop(paths: np.ndarray, balance: float, expense: float):
+    """Year-by-year _finally_retired_loop over each row of `paths` (capped at its length)."""
+    n_cohorts, window = paths.shape
+    current = np.full(n_cohorts, float(balance))
+    years = np.zeros(n_cohorts, dtype=np.int64)
+    active = np.full(n_cohorts, balance > 0)
+    for period in range(window):
+        if not active.any():
+            break
+        current[active] = current[active] * (1 + paths[active, period]) - expense
+        years[active] += 1
+        active &= ~(current < DEPLETION_THRESHOLD)
+    return years, current
+
+
+def _as_series(rates, window: int) -> np.ndarray:
+    rates = np.asarray(rates, dtype=float)
+    if rates.ndim != 1:
+        raise ValueError("rates must be a 1-D series")
+    if not 0 < window <= rates.size:
+        raise ValueError(f"window must be between 1 and the series length ({rates.size})")
+    return rates
+
+
+def _windows(rates: np.ndarray, window: int) -> np.ndarray:
+    return np.lib.stride_tricks.sliding_window_view(rates, window)
+
+# End of backtest.py
@@ -0,0 +1,341 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Vectorized (NumPy) counterparts of the functions in financial_models.
+
+Every *_batch function takes arrays of scenarios (scalars broadcast) and
+evaluates them with array kernels instead of one Python call per scenario.
+The kernels apply exactly the same formulas, branch conditions and fallback
+loops as the scalar functions. Where the scalar version loops year by year,
+the batch version loops over years once for the whole batch and masks out
+scenarios whose (ragged) horizon has already ended.
+
+Element-wise agreement with the scalar functions:
+    - variableInvestor and every loop fallback: bit-for-bit identical.
+    - finallyRetired: identical year counts (the only exception is a year-end
+      balance within an ulp of the 1e-6 threshold).
+    - fixedInvestor closed form: NumPy's exp/log1p may differ from the C
+      library's by an ulp, so values agree to within
+      financial_models.CLOSED_FORM_RTOL rather than bit-for-bit.
+    - maximumExpensed: identical. The candidate may differ by an ulp, but both
+      versions then settle on the largest withdrawal the year-by-year rule
+      accepts.
+"""
+
+import numpy as np
+
+from financial_models import MAX_RETIREMENT_YEARS, DEPLETION_THRESHOLD
+
+# --- Input Helpers ---
+
+def broadcast_inputs(*arrays):
+    """Broadcasts the inputs against each other and returns writable float copies."""
+    return [np.array(a, dtype=float) for a in np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in arrays])]
+
+
+def as_years(years, shape) -> np.ndarray:
+    """Integer year counts broadcast to the batch shape."""
+    return np.broadcast_to(np.asarray(years), shape).astype(np.int64)
+
+
+# --- Batch Model Functions ---
+
+def fixedInvestor_batch(principal, rate, years, annual_contribution=0.0) -> np.ndarray:
+    """
+    Vectorized fixedInvestor over arrays of scenarios.
+
+    Parameters:
+        principal (array_like): Initial investment amounts.
+        rate (array_like): Annual interest rates as decimals.
+        years (array_like): Years invested per scenario (may differ per scenario).
+        annual_contribution (array_like): Amounts added at the end of each year.
+
+    Returns:
+        np.ndarray: Final balance per scenario.
+    """
+    principal, rate, contribution, _ = broadcast_inputs(principal, rate, annual_contribution, np.asarray(years, dtype=float))
+    years = as_years(years, principal.shape)
+    result = principal.copy()
+
+    finite = np.isfinite(principal) & np.isfinite(rate) & np.isfinite(contribution)
+    closed = (years > 0) & (rate != 0) & (rate > -1) & finite
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        log_growth = np.where(closed, years * np.log1p(np.where(closed, rate, 0.0)), 0.0)
+        growth = np.exp(log_growth)
+        closed &= np.isfinite(growth)
+        value = principal * growth + contribution * np.expm1(log_growth) / np.where(closed, rate, 1.0)
+    result[closed] = value[closed]
+
+    flat = (years > 0) & (rate == 0) & finite
+    result[flat] = principal[flat] + contribution[flat] * years[flat]
+
+    loop = (years > 0) & ~closed & ~flat
+    if loop.any():
+        result[loop] = _fixed_investor_loop_batch(principal[loop], rate[loop], years[loop], contribution[loop])
+    return result
+
+
+def variableInvestor_batch(principal, rate_paths, annual_contribution=0.0, lengths=None) -> np.ndarray:
+    """
+    Vectorized variableInvestor over a 2-D matrix of rate paths.
+
+    Parameters:
+        principal (array_like): Starting principal per scenario, shape (n,) or scalar.
+        rate_paths (array_like): Rates with shape (n, years); row i is scenario i's rateList.
+        annual_contribution (array_like): Contribution per scenario, shape (n,) or scalar.
+        lengths (array_like, optional): Number of leading rates to use per row, for
+            ragged horizons. Defaults to the full row.
+
+    Returns:
+        np.ndarray: Final balance per scenario, shape (n,).
+    """
+    rate_paths = np.atleast_2d(np.asarray(rate_paths, dtype=float))
+    n_paths, n_years = rate_paths.shape
+    balance = np.array(np.broadcast_to(np.asarray(principal, dtype=float), (n_paths,)))
+    contribution = np.broadcast_to(np.asarray(annual_contribution, dtype=float), (n_paths,))
+
+    if lengths is None:
+        for year in range(n_years):
+            balance = balance * (1 + rate_paths[:, year]) + contribution
+        return balance
+
+    lengths = np.broadcast_to(np.asarray(lengths), (n_paths,))
+    for year in range(min(n_years, int(lengths.max(initial=0)))):
+        active = lengths > year
+        balance = np.where(active, balance * (1 + rate_paths[:, year]) + contribution, balance)
+    return balance
+
+
+def finallyRetired_batch(balance, expense, rate) -> np.ndarray:
+    """
+    Vectorized finallyRetired over arrays of scenarios.
+
+    Returns:
+        np.ndarray: Years the funds last per scenario (int64, capped at 500).
+    """
+    balance, expense, rate = broadcast_inputs(balance, expense, rate)
+    years = np.zeros(balance.shape, dtype=np.int64)
+
+    positive = balance > 0
+    finite = np.isfinite(balance) & np.isfinite(expense) & np.isfinite(rate)
+    loop = positive & ((rate == 0) | (rate <= -1) | ~finite)
+    loop |= positive & ~loop & (expense <= balance * rate)
+    closed = positive & ~loop
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        x = rate * (DEPLETION_THRESHOLD - balance) / (balance * rate - expense)
+        exhausted = closed & (x <= -1)
+        years[exhausted] = np.where(rate[exhausted] > 0, 1, MAX_RETIREMENT_YEARS)
+
+        solve = closed & ~exhausted
+        bound = np.log1p(np.where(solve, x, 0.0)) / np.log1p(np.where(solve, rate, 1.0))
+    capped = solve & (bound >= MAX_RETIREMENT_YEARS)
+    first = solve & ~capped & (bound < 1)
+    rest = solve & ~capped & ~first
+    years[capped] = MAX_RETIREMENT_YEARS
+    years[first] = 1
+    years[rest] = np.floor(bound[rest]).astype(np.int64) + 1
+
+    if loop.any():
+        years[loop] = _finally_retired_loop_batch(balance[loop], expense[loop], rate[loop])
+    return years
+
+
+def maximumExpensed_batch(balance, rate, target_years=30, return_iterations: bool = False):
+    """
+    Vectorized maximumExpensed over arrays of scenarios.
+
+    Uses the same annuity-payment candidates, year-by-year verification and
+    bisection fallback as the scalar solver, each step applied to the whole
+    batch at once.
+
+    Returns:
+        np.ndarray: Maximum sustainable withdrawal per scenario, or
+        tuple[np.ndarray, np.ndarray]: (withdrawals, iterations) when
+        return_iterations is True.
+    """
+    balance, rate, _ = broadcast_inputs(balance, rate, np.asarray(target_years, dtype=float))
+    shape = balance.shape
+    target = as_years(target_years, shape).ravel()
+    balance, rate = balance.ravel(), rate.ravel()     # flat, so index arrays also work for scalars
+    expense = np.zeros(balance.shape)
+    iterations = np.zeros(balance.shape, dtype=np.int64)
+
+    analytic = (balance > 0) & (rate > -1) & np.isfinite(balance) & np.isfinite(rate)
+    bisect = ~analytic
+    too_long = analytic & (target > MAX_RETIREMENT_YEARS)
+    single = analytic & ~too_long & (target <= 1)
+    expense[single] = balance[single]
+    solve = analytic & ~too_long & ~single
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        log_q = np.log1p(np.where(solve, rate, 0.0))
+        candidate = np.full(balance.shape, np.inf)
+        for k in (np.ones_like(target), target - 1):
+            growth = np.exp(k * log_q)
+            overflow = solve & ~np.isfinite(growth)
+            bisect |= overflow
+            solve &= ~overflow
+            annuity = np.where(rate == 0, k.astype(float), np.expm1(k * log_q) / np.where(rate == 0, 1.0, rate))
+            candidate = np.minimum(candidate, (balance * growth - DEPLETION_THRESHOLD) / annuity)
+        candidate = np.minimum(candidate, balance)
+    candidate = np.where(candidate > 0, candidate, 0.0)
+    solve &= candidate > 0
+
+    # As in the scalar solver: bracket the largest withdrawal the year-by-year
+    # rule accepts with doubling ulp steps around the candidate, then bisect.
+    pending = np.flatnonzero(solve)
+    solved_balance, solved_rate, solved_target = balance[pending], rate[pending], target[pending]
+    expense[pending], iterations[pending], failed = largest_lasting_batch(
+        solved_balance, candidate[pending],
+        lambda probe, index: lasts_batch(solved_balance[index], probe, solved_rate[index], solved_target[index]))
+    bisect[pending[failed]] = True
+
+    if bisect.any():
+        expense[bisect], iterations[bisect] = _maximum_expensed_bisection_batch(
+            balance[bisect], rate[bisect], target[bisect])
+
+    if return_iterations:
+        return expense.reshape(shape), iterations.reshape(shape)
+    return expense.reshape(shape)
+
+
+# --- Vectorized Fallback Loops ---
+
+def _fixed_investor_loop_batch(principal, rate, years, contribution) -> np.ndarray:
+    balance = principal.copy()
+    with np.errstate(over="ignore", invalid="ignore"):
+        for year in range(int(years.max(initial=0))):
+            active = years > year
+            balance = np.where(active, balance * (1 + rate) + contribution, balance)
+    return balance
+
+
+def _finally_retired_loop_batch(balance, expense, rate) -> np.ndarray:
+    years = np.zeros(balance.shape, dtype=np.int64)
+    active = np.flatnonzero(balance > 0)
+    current_balance = balance[active]
+    expense, growth = expense[active], 1 + rate[active]
+
+    # Only scenarios still running are stepped; finished ones drop out of the arrays.
+    for year in range(1, MAX_RETIREMENT_YEARS + 1):
+        if active.size == 0:
+            break
+        with np.errstate(over="ignore", invalid="ignore"):
+            current_balance = current_balance * growth
+            current_balance -= expense
+        # Same stopping rules as the scalar loop: early exit, depletion and the cap.
+        running = current_balance >= DEPLETION_THRESHOLD
+        years[active[~running]] = year
+        active, current_balance = active[running], current_balance[running]
+        expense, growth = expense[running], growth[running]
+    years[active] = MAX_RETIREMENT_YEARS
+    return years
+
+
+def lasts_batch(balance, expense, rate, target) -> np.ndarray:
+    """financial_models.lasts for every scenario: the loop's depletion rule for target - 1 years."""
+    lasts = np.where((target > MAX_RETIREMENT_YEARS) | ~(balance > 0), target <= 0, True)
+    active = np.flatnonzero(lasts & (target > 1))
+    # Longest horizons first, so the scenarios still running in any year are a
+    # prefix and every step works on slices in place.
+    active = active[np.argsort(-target[active], kind="stable")]
+    remaining = target[active] - 1
+    current_balance = balance[active]
+    expense, growth = expense[active], 1 + rate[active]
+    failed = np.zeros(active.size, dtype=bool)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for year in range(1, int(remaining.max(initial=0)) + 1):
+            live = np.searchsorted(-remaining, -year, side="right")
+            current_balance[:live] *= growth[:live]
+            current_balance[:live] -= expense[:live]
+            failed[:live] |= ~(current_balance[:live] >= DEPLETION_THRESHOLD)
+    lasts[active[failed]] = False
+    return lasts
+
+
+def largest_lasting_batch(balance, candidate, lasts):
+    """
+    Largest withdrawal near `candidate` that a year-by-year rule accepts, per
+    scenario, capped at the balance. The boundary is bracketed with ulp steps
+    that double and then bisected down to adjacent floats.
+
+    Parameters:
+        balance (np.ndarray): Starting balance per scenario.
+        candidate (np.ndarray): Positive estimate of the withdrawal per scenario.
+        lasts (callable): lasts(withdrawals, index) -> whether the scenarios at
+            positions `index` last with those withdrawals (e.g. lasts_batch).
+
+    Returns:
+        tuple: (withdrawals, iterations, failed), where `failed` marks
+        scenarios not bracketed within 128 checks (left to the bisection).
+    """
+    n = balance.size
+    iterations = np.ones(n, dtype=np.int64)
+    ok = lasts(candidate, np.arange(n))
+    low = np.where(ok, candidate, np.nan)
+    high = np.where(ok, np.nan, candidate)
+    result = np.full(n, np.nan)
+    step = np.spacing(candidate)
+
+    # Expand until every scenario has a lasting `low` and a failing `high`.
+    for _ in range(127):
+        up = np.flatnonzero(np.isnan(high) & np.isnan(result))
+        down = np.flatnonzero(np.isnan(low))
+        if up.size == 0 and down.size == 0:
+            break
+        probe_up = np.minimum(low[up] + step[up], balance[up])
+        capped = probe_up == low[up]
+        result[up[capped]] = low[up[capped]]
+        up, probe_up = up[~capped], probe_up[~capped]
+        probe_down = np.maximum(high[down] - step[down], 0.0)
+        checked = np.concatenate((up, down))
+        probe = np.concatenate((probe_up, probe_down))
+        iterations[checked] += 1
+        ok = lasts(probe, checked)
+        low[checked[ok]] = probe[ok]
+        high[checked[~ok]] = probe[~ok]
+        zero = checked[~ok & (probe == 0.0)]
+        result[zero], low[zero] = 0.0, 0.0
+        step[checked] *= 2
+    failed = np.isnan(low) | (np.isnan(high) & np.isnan(result))
+
+    # Bisect each bracket down to adjacent floats.
+    active = np.flatnonzero(~failed & np.isnan(result))
+    while active.size:
+        middle = (low[active] + high[active]) / 2
+        moving = (middle != low[active]) & (middle != high[active])
+        active, middle = active[moving], middle[moving]
+        if active.size == 0:
+            break
+        iterations[active] += 1
+        ok = lasts(middle, active)
+        low[active[ok]] = middle[ok]
+        high[active[~ok]] = middle[~ok]
+    result = np.where(np.isnan(result), low, result)
+    return np.where(failed, 0.0, result), iterations, failed
+
+
+def _maximum_expensed_bisection_batch(balance, rate, target):
+    low_expense = np.zeros(balance.shape)
+    high_expense = balance.copy()
+    iterations = np.zeros(balance.shape, dtype=np.int64)
+    active = np.ones(balance.shape, dtype=bool)
+
+    for _ in range(100):
+        mid_expense = (low_expense + high_expense) / 2
+        active &= (mid_expense != low_expense) & (mid_expense != high_expense)
+        if not active.any():
+            break
+        iterations += active
+        feasible = lasts_batch(balance, mid_expense, rate, target)
+        low_expense = np.where(active & feasible, mid_expense, low_expense)
+        high_expense = np.where(active & ~feasible, mid_expense, high_expense)
+
+    return low_expense, iterations
+
+# End of batch_models.py
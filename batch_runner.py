@@ -0,0 +1,148 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Headless, streaming evaluation of a model over a CSV file of scenarios.
+
+The run is a chain of generators (read -> parse -> evaluate -> write), so one
+row is in flight at a time and memory stays constant however large the input
+is. CSV columns are matched to the model's parameter names (see
+model_registry); optional parameters may be omitted. Rows that cannot be
+parsed or evaluated are reported with their line number and skipped.
+
+With a results_store.ResultsStore, rows already stored are answered from it
+and newly computed rows are added to it.
+"""
+
+import csv
+import json
+import sys
+import time
+from typing import Callable, Iterator, NamedTuple, Optional, TextIO, Tuple
+
+from model_registry import ModelSpec, Param, get_model
+
+
+class BatchSummary(NamedTuple):
+    rows_ok: int
+    rows_bad: int
+    rows_stored: int = 0        # answered from the results store
+
+
+# --- Pipeline Stages ---
+
+def read_rows(source: TextIO) -> Iterator[Tuple[int, dict]]:
+    """Yields (line number, row dict) for each CSV record after the header."""
+    reader = csv.DictReader(source)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def parse_rows(rows, spec: ModelSpec, report: Callable[[int, str], None]) -> Iterator[Tuple[int, tuple]]:
+    """Converts rows to argument tuples, reporting and dropping bad rows."""
+    for line, row in rows:
+        try:
+            yield line, tuple(_parse_value(param, row.get(param.name)) for param in spec.params)
+        except ValueError as e:
+            report(line, str(e))
+
+
+def evaluate_rows(parsed, spec: ModelSpec, report: Callable[[int, str], None], store=None,
+                  model: Optional[str] = None,
+                  on_stored: Optional[Callable[[], None]] = None) -> Iterator[Tuple[int, tuple, object]]:
+    """Runs the model on each argument tuple (or reads it from `store`)."""
+    for line, args in parsed:
+        if store is not None:
+            value = store.get(model, args)
+            if value is not None:
+                on_stored()
+                yield line, args, value
+                continue
+        try:
+            started = time.perf_counter()
+            value = spec.function(*args)
+        except (ArithmeticError, ValueError) as e:
+            report(line, f"model error: {e}")
+            continue
+        if store is not None:
+            store.put(model, args, value, time.perf_counter() - started)
+        yield line, args, value
+
+
+def _parse_value(param: Param, text):
+    if text is None or text.strip() == "":
+        if param.default is None:
+            raise ValueError(f"missing value for '{param.name}'")
+        return param.default
+    try:
+        if param.type is int:
+            value = float(text)
+            if not value.is_integer():
+                raise ValueError
+            return int(value)
+        return param.type(text)
+    except ValueError:
+        raise ValueError(f"invalid {param.type.__name__} for '{param.name}': {text.strip()!r}") from None
+
+
+# --- Writers ---
+
+def _write_jsonl(results, spec: ModelSpec, model: str, sink: TextIO) -> int:
+    count = 0
+    for line, args, value in results:
+        record = {"line": line, **dict(zip(spec.param_names, args)), model: value}
+        sink.write(json.dumps(record) + "\n")
+        count += 1
+    return count
+
+
+def _write_csv(results, spec: ModelSpec, model: str, sink: TextIO) -> int:
+    writer = csv.writer(sink)
+    writer.writerow(["line", *spec.param_names, model])
+    count = 0
+    for line, args, value in results:
+        writer.writerow([line, *args, value])
+        count += 1
+    return count
+
+
+# --- Driver ---
+
+def run_batch(model: str, source: TextIO, sink: TextIO, errors: TextIO = sys.stderr,
+              output_format: str = "jsonl", store=None) -> BatchSummary:
+    """
+    Streams every row of `source` through `model`, writing results to `sink`.
+
+    Parameters:
+        model (str): Model name from model_registry.MODELS.
+        source (TextIO): CSV input with a header row naming the parameters.
+        sink (TextIO): Destination for results.
+        errors (TextIO): Destination for bad-row reports.
+        output_format (str): "jsonl" or "csv".
+        store (ResultsStore, optional): Reuse and record results.
+
+    Returns:
+        BatchSummary: Number of rows written, rows skipped and rows read from the store.
+    """
+    spec = get_model(model)
+    bad_rows = stored_rows = 0
+
+    def report(line: int, message: str):
+        nonlocal bad_rows
+        bad_rows += 1
+        print(f"line {line}: {message}", file=errors)
+
+    def count_stored():
+        nonlocal stored_rows
+        stored_rows += 1
+
+    results = evaluate_rows(parse_rows(read_rows(source), spec, report), spec, report, store, model, count_stored)
+    writer = _write_csv if output_format == "csv" else _write_jsonl
+    written = writer(results, spec, model, sink)
+    if store is not None:
+        store.flush()
+    return BatchSummary(written, bad_rows, stored_rows)
+
+# End of batch_runner.py
@@ -0,0 +1,191 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Benchmark suite for the four models in financial_models.
+
+Each case measures either latency (best-of-N time per call, in microseconds)
+or throughput (scenarios per second over a varied batch of inputs). Results
+are written as JSON and compared against a committed baseline; any case that
+is slower than the baseline by more than the threshold fails the run.
+
+    python benchmarks/bench_models.py                      # compare to baseline.json
+    python benchmarks/bench_models.py --out results.json   # also save the results
+    python benchmarks/bench_models.py --update-baseline    # record a new baseline
+
+Baselines are machine specific: regenerate baseline.json on the reference
+machine whenever the hardware changes or an intentional slowdown is accepted.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from financial_models import fixedInvestor, variableInvestor, finallyRetired, maximumExpensed
+
+try:
+    import numpy as np
+    import batch_models
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25        # fail when more than 25% slower than baseline
+REPEATS = 5
+BATCH_SCENARIOS = 20000
+
+# --- Case Definitions ---
+
+def latency_cases():
+    """(name, zero-argument callable) pairs timed per call."""
+    rng = random.Random(7)
+    rates_40 = [rng.gauss(0.06, 0.12) for _ in range(40)]
+    rates_720 = [rng.gauss(0.005, 0.04) for _ in range(720)]
+    rates_10k = [rng.gauss(0.005, 0.04) for _ in range(10000)]
+    return [
+        ("fixedInvestor/short_10y", lambda: fixedInvestor(10000, 0.05, 10, 1200)),
+        ("fixedInvestor/long_500y", lambda: fixedInvestor(10000, 0.05, 500, 1200)),
+        ("fixedInvestor/zero_rate_500y", lambda: fixedInvestor(10000, 0.0, 500, 1200)),
+        ("variableInvestor/40_rates", lambda: variableInvestor(10000, rates_40, 1200)),
+        ("variableInvestor/720_rates", lambda: variableInvestor(10000, rates_720, 100)),
+        ("variableInvestor/10k_rates", lambda: variableInvestor(10000, rates_10k, 100)),
+        ("finallyRetired/short_depletion", lambda: finallyRetired(100000, 30000, 0.04)),
+        ("finallyRetired/long_depletion", lambda: finallyRetired(1000000, 50001, 0.05)),
+        ("finallyRetired/near_perpetual_cap", lambda: finallyRetired(1000000, 49999, 0.05)),
+        ("finallyRetired/zero_rate", lambda: finallyRetired(1000000, 4000, 0.0)),
+        ("maximumExpensed/30y", lambda: maximumExpensed(1000000, 0.05, 30)),
+        ("maximumExpensed/500y", lambda: maximumExpensed(1000000, 0.05, 500)),
+        ("maximumExpensed/bisection_fallback", lambda: maximumExpensed(1000000, -1.0, 30)),
+    ]
+
+
+def scalar_batch(count):
+    """Varied scenarios so throughput is not dominated by one branch."""
+    rng = random.Random(11)
+    return [(rng.uniform(1e4, 2e6), rng.uniform(-0.05, 0.12), rng.randint(1, 60),
+             rng.uniform(0, 2e4), rng.uniform(1e3, 2e5)) for _ in range(count)]
+
+
+def throughput_cases():
+    """(name, scenario count, zero-argument callable) evaluated once per repeat."""
+    scenarios = scalar_batch(BATCH_SCENARIOS)
+    cases = [
+        ("throughput/fixedInvestor_scalar", len(scenarios),
+         lambda: [fixedInvestor(p, r, y, c) for p, r, y, c, _ in scenarios]),
+        ("throughput/finallyRetired_scalar", len(scenarios),
+         lambda: [finallyRetired(p, e, r) for p, r, _, _, e in scenarios]),
+        ("throughput/maximumExpensed_scalar", len(scenarios),
+         lambda: [maximumExpensed(p, r, y) for p, r, y, _, _ in scenarios]),
+    ]
+    if NUMPY_AVAILABLE:
+        p, r, y, c, e = (np.array(column) for column in zip(*scenarios))
+        paths = np.random.default_rng(3).normal(0.06, 0.12, size=(len(scenarios), 40))
+        cases += [
+            ("throughput/fixedInvestor_batch", len(scenarios), lambda: batch_models.fixedInvestor_batch(p, r, y, c)),
+            ("throughput/variableInvestor_batch_40y", len(scenarios),
+             lambda: batch_models.variableInvestor_batch(p, paths, c)),
+            ("throughput/finallyRetired_batch", len(scenarios), lambda: batch_models.finallyRetired_batch(p, e, r)),
+            ("throughput/maximumExpensed_batch", len(scenarios), lambda: batch_models.maximumExpensed_batch(p, r, y)),
+        ]
+    return cases
+
+
+# --- Measurement ---
+
+def measure_latency(function) -> float:
+    """Best-of-REPEATS microseconds per call."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEATS, number=number)) / number * 1e6
+
+
+def measure_throughput(count, function) -> float:
+    """Best-of-REPEATS scenarios per second."""
+    best = min(timeit.Timer(function).repeat(repeat=REPEATS, number=1))
+    return count / best
+
+
+def run_benchmarks(selected=None) -> dict:
+    results = {}
+    for name, function in latency_cases():
+        if selected is None or selected in name:
+            results[name] = {"metric": "us_per_call", "value": measure_latency(function)}
+            print(f"  {name:<45} {results[name]['value']:>12.3f} us/call", file=sys.stderr)
+    for name, count, function in throughput_cases():
+        if selected is None or selected in name:
+            results[name] = {"metric": "scenarios_per_sec", "value": measure_throughput(count, function)}
+            print(f"  {name:<45} {results[name]['value']:>12,.0f} scenarios/s", file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Returns (name, baseline, current, slowdown) for every case beyond the threshold."""
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None or reference["metric"] != current["metric"]:
+            continue
+        if current["metric"] == "us_per_call":
+            slowdown = current["value"] / reference["value"] - 1
+        else:
+            slowdown = reference["value"] / current["value"] - 1
+        if slowdown > threshold:
+            regressions.append((name, reference["value"], current["value"], slowdown))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark financial_models against a baseline")
+    parser.add_argument("--out", help="Write results JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--only", help="Run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    print("Running benchmarks...", file=sys.stderr)
+    results = run_benchmarks(args.only)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "numpy": NUMPY_AVAILABLE,
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first.", file=sys.stderr)
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as fh:
+        baseline = json.load(fh)["results"]
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after, slowdown in regressions:
+        print(f"[REGRESSION] {name}: {before:,.3f} -> {after:,.3f} ({slowdown:+.0%})", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# End of bench_models.py
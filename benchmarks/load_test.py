@@ -0,0 +1,154 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Load test for model_service.
+
+Opens `--concurrency` keep-alive connections and sends `--requests` POSTs in
+total, spread over the four models (or only `--model`), then reports latency
+percentiles and requests per second. With `--spawn` the service is started as
+a subprocess on a free port and stopped afterwards.
+
+    python benchmarks/load_test.py --spawn --requests 20000 --concurrency 64
+    python benchmarks/load_test.py --port 8080 --model maximumExpensed
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+SERVICE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "model_service.py")
+MODELS = ("fixedInvestor", "variableInvestor", "finallyRetired", "maximumExpensed")
+
+
+def make_body(model: str, rng: random.Random) -> dict:
+    if model == "fixedInvestor":
+        return {"principal": rng.uniform(1e4, 2e6), "rate": rng.uniform(-0.05, 0.12),
+                "years": rng.randint(1, 60), "annual_contribution": rng.uniform(0, 2e4)}
+    if model == "variableInvestor":
+        return {"principal": rng.uniform(1e4, 2e6), "rates": [rng.gauss(0.06, 0.12) for _ in range(rng.randint(10, 60))],
+                "annual_contribution": rng.uniform(0, 2e4)}
+    if model == "finallyRetired":
+        return {"balance": rng.uniform(1e4, 2e6), "expense": rng.uniform(1e3, 2e5), "rate": rng.uniform(-0.05, 0.12)}
+    return {"balance": rng.uniform(1e4, 2e6), "rate": rng.uniform(-0.05, 0.12), "target_years": rng.randint(1, 60)}
+
+
+def encode_request(host: str, model: str, body: dict) -> bytes:
+    payload = json.dumps(body).encode()
+    head = (f"POST /{model} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n")
+    return head.encode("latin-1") + payload
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    status = int((await reader.readline()).split(b" ", 2)[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host: str, port: int, requests, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for request in requests:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, models, total: int, concurrency: int, seed: int = 3):
+    rng = random.Random(seed)
+    requests = [encode_request(host, m, make_body(m, rng)) for m in (rng.choice(models) for _ in range(total))]
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests[i::concurrency], latencies, errors)
+                           for i in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(ordered, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_service(port: int, extra_args) -> subprocess.Popen:
+    process = subprocess.Popen([sys.executable, SERVICE_PATH, "--port", str(port), *extra_args],
+                               stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise SystemExit("[ERROR] model_service did not start")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test for model_service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--spawn", action="store_true", help="Start model_service on a free port for the run")
+    parser.add_argument("--service-args", default="", help="Extra arguments for the spawned service, e.g. '--window-ms 1'")
+    parser.add_argument("--model", choices=MODELS, help="Only call this model (default: a mix of all four)")
+    parser.add_argument("--requests", type=int, default=10000, help="Total requests")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent keep-alive connections")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.spawn:
+        args.host, args.port = "127.0.0.1", free_port()
+        process = spawn_service(args.port, args.service_args.split())
+    try:
+        models = (args.model,) if args.model else MODELS
+        latencies, errors, elapsed = asyncio.run(
+            run_load(args.host, args.port, models, args.requests, args.concurrency))
+    finally:
+        if process is not None:
+            process.terminate()     # model_service shuts its process pool down on SIGTERM
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    ordered = sorted(latencies)
+    print(f"{len(latencies):,} requests, concurrency {args.concurrency}, {len(errors)} errors")
+    print(f"  throughput  {len(latencies) / elapsed:10,.0f} req/s")
+    print(f"  p50         {percentile(ordered, 0.50) * 1000:10.2f} ms")
+    print(f"  p99         {percentile(ordered, 0.99) * 1000:10.2f} ms")
+    print(f"  max         {ordered[-1] * 1000 if ordered else 0.0:10.2f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# End of load_test.py
@@ -3,6 +3,9 @@
 # Date          :   November , 2025
 # Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
 
+import csv
+import sqlite3
+import sys
 from typing import List
 # Imports core logic functions
 from financial_models import fixedInvestor, variableInvestor, finallyRetired, maximumExpensed
@@ -141,4 +144,185 @@ def handle_maximum_expensed():
     print(f"(Verification: This withdrawal rate lasts for {check_years} years)")
     print("-----------------------------------------------------")
 
+
+def handle_lifecycle_plan():
+    """Menu 6: Accumulation and retirement in one plan, without retyping the balance."""
+    from lifecycle import plan_lifecycle
+
+    print("\n--- 6. Full Retirement Plan ---")
+
+    principal = get_valid_positive_numerical_input("   Enter Initial Principal ($): ", True, "float")
+    rate = get_annual_interest_rate("   Enter Annual Interest Rate Until Retirement (e.g., 0.05 for 5%): ")
+    annual_contribution = get_valid_positive_numerical_input("   Enter Annual Contribution ($): ", True, "float")
+    years = get_valid_positive_numerical_input("   Enter Years to Retirement: ", False, "int")
+    expense = get_valid_positive_numerical_input("   Enter Annual Retirement Expense in Today's Money ($): ", True, "float")
+    inflation = get_annual_interest_rate("   Enter Annual Inflation Until Retirement (e.g., 0.02): ")
+    retirement_rate = get_annual_interest_rate("   Enter Post-Retirement Growth Rate (e.g., 0.04): ")
+    target_years = get_valid_positive_numerical_input("   Enter Target Retirement Length (Years, e.g., 30): ", False, "int")
+
+    plan = plan_lifecycle(principal, years, rate, annual_contribution, expense, retirement_rate,
+                          target_years, inflation=inflation)
+    balance = float(plan.retirement_balance[0])
+    expense_at_retirement = float(plan.retirement_expense[0])
+    years_lasted = int(plan.years_lasted[0])
+
+    print("\n-----------------------------------------------------")
+    print(f"✅ BALANCE AT RETIREMENT (after {years} years): **${balance:,.2f}**")
+    print(f"   Expense at retirement (inflation-adjusted): ${expense_at_retirement:,.2f}")
+    if years_lasted >= 500:
+        print(f"✅ Funds are Perpetual! (Lasts for >{500} years)")
+    else:
+        print(f"{'✅' if years_lasted >= target_years else '❌'} FUNDS LAST FOR: **{years_lasted} years**")
+    print(f"✅ MAX SUSTAINABLE ANNUAL WITHDRAWAL (for {target_years} years): "
+          f"**${float(plan.sustainable_withdrawal[0]):,.2f}**")
+    print("-----------------------------------------------------")
+
+# --- Non-Interactive Command Handlers ---
+
+def _open_output(path: str):
+    """Opens `path` for writing, with '-' meaning stdout."""
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def _open_store(path):
+    """ResultsStore for a --store option, or None when it was not given."""
+    if path is None:
+        return None
+    from results_store import ResultsStore
+
+    try:
+        return ResultsStore(path)
+    except sqlite3.Error as e:
+        raise SystemExit(f"[ERROR] cannot open results store {path}: {e}")
+
+
+def handle_sweep(args):
+    """`sweep` subcommand: evaluates a parameter grid across worker processes."""
+    from parameter_sweep import ParameterSweep, SweepGrid, expand_values, load_grid_file
+
+    model, axes = args.model, {}
+    if args.grid:
+        file_model, axes = load_grid_file(args.grid)
+        model = model or file_model
+    for assignment in args.param or []:
+        name, _, spec = assignment.partition("=")
+        if not spec:
+            raise SystemExit(f"[ERROR] --param expects name=values, got '{assignment}'")
+        axes[name.strip()] = expand_values(spec)
+    if not model:
+        raise SystemExit("[ERROR] No model given (use --model or a grid file with a 'model' key).")
+
+    try:
+        grid = SweepGrid(model, axes)
+    except ValueError as e:
+        raise SystemExit(f"[ERROR] {e}")
+    store = _open_store(args.store)
+    sweep = ParameterSweep(grid, workers=args.workers, chunk_size=args.chunk_size, store=store)
+    print(f"Sweeping {grid.size:,} {model} scenarios on {sweep.workers} worker(s)...", file=sys.stderr)
+
+    out = _open_output(args.out)
+    try:
+        writer = csv.writer(out)
+        writer.writerow(list(grid.spec.param_names) + [model])
+        for params, value in sweep.results():
+            writer.writerow(list(params) + [value])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if store is not None:
+            store.close()
+
+    print(f"Done: {sweep.completed:,} scenarios in {sweep.elapsed:.2f}s "
+          f"({sweep.throughput:,.0f} scenarios/sec)", file=sys.stderr)
+    if store is not None:
+        print(f"  {sweep.stored:,} answered from {args.store}", file=sys.stderr)
+
+
+def handle_batch(args):
+    """`batch` subcommand: streams a CSV of scenarios through one model."""
+    from batch_runner import run_batch
+
+    output_format = args.format or ("csv" if args.out.lower().endswith(".csv") else "jsonl")
+    source = sys.stdin if args.input == "-" else open(args.input, "r", newline="", encoding="utf-8")
+    sink = _open_output(args.out)
+    store = _open_store(args.store)
+    try:
+        summary = run_batch(args.model, source, sink, sys.stderr, output_format, store)
+    except ValueError as e:
+        raise SystemExit(f"[ERROR] {e}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        if store is not None:
+            store.close()
+
+    print(f"Done: {summary.rows_ok:,} rows written, {summary.rows_bad:,} bad rows skipped", file=sys.stderr)
+    if store is not None:
+        print(f"  {summary.rows_stored:,} rows answered from {args.store}", file=sys.stderr)
+
+
+def handle_import_returns(args):
+    """`import-returns` subcommand: converts a CSV of returns to a memory-mappable dataset."""
+    from return_dataset import import_csv
+
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    try:
+        dataset = import_csv(args.input, args.out, args.index_column, columns,
+                             args.periods_per_year, 0.01 if args.percent else 1.0)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"[ERROR] {e}")
+
+    print(f"Wrote {args.out}: {dataset.rows:,} rows x {len(dataset.columns)} column(s) "
+          f"({', '.join(dataset.columns)})", file=sys.stderr)
+
+
+def handle_backtest(args):
+    """`backtest` subcommand: every rolling window of a historical return series."""
+    import numpy as np
+    from backtest import accumulation_backtest, retirement_backtest
+    from return_dataset import ReturnDataset
+
+    try:
+        dataset = ReturnDataset.open(args.dataset)
+        rates = dataset.series(args.column or dataset.columns[0])
+        if args.expense is not None:
+            result = retirement_backtest(rates, args.window, args.balance, args.expense)
+        else:
+            result = accumulation_backtest(rates, args.window, args.balance, args.contribution, args.target)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"[ERROR] {e}")
+
+    if args.out:
+        out = _open_output(args.out)
+        try:
+            writer = csv.writer(out)
+            if result.years_lasted is None:
+                writer.writerow(["start", "final_balance"])
+                writer.writerows(zip(range(result.cohorts), result.final_balances.tolist()))
+            else:
+                writer.writerow(["start", "years_lasted", "depleted", "final_balance"])
+                writer.writerows(zip(range(result.cohorts), result.years_lasted.tolist(),
+                                     result.depleted.astype(int).tolist(), result.final_balances.tolist()))
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    balances = result.final_balances
+    print(f"{result.cohorts:,} cohorts of {args.window} periods", file=sys.stderr)
+    print(f"  final balance: min ${balances.min():,.2f}  median ${float(np.median(balances)):,.2f}  "
+          f"max ${balances.max():,.2f}", file=sys.stderr)
+    if result.success_rate is not None:
+        print(f"  success rate: {result.success_rate:.1%}", file=sys.stderr)
+
+
+def handle_serve(args):
+    """`serve` subcommand: runs the HTTP/JSON model service until interrupted."""
+    from model_service import serve
+
+    serve(args)
+
 # End of cli_handlers.py
@@ -0,0 +1,194 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Fan-chart data for many simulated balance paths.
+
+Plotting every path of a Monte Carlo run as its own line costs one artist and
+one point per year per path, which is unusable at 100k paths. A fan chart
+instead shows percentile bands of the balance per year plus a few sample
+paths. The bands are computed on the fly, so no (paths x years) matrix is
+ever kept:
+
+    - Long horizons are downsampled to at most max_points plotted years,
+      evenly spaced and always including the last year. The other years are
+      still simulated but never stored.
+    - Each plotted year folds its balances into a quantiles.QuantileSketch,
+      one chunk of paths at a time. Band edges carry the sketch's relative
+      error (1% by default, below a pixel on a chart).
+    - A reservoir sample keeps max_samples paths, chosen uniformly from all
+      paths, for drawing as individual lines.
+
+Memory is therefore bounded by the chunk size, max_points and max_samples,
+whatever the number of paths.
+
+    fan = simulate_fan(10000, LognormalReturns.from_moments(0.06, 0.15), 40, 100000,
+                       annual_contribution=1200, seed=1)
+    fan.years, fan.band(5), fan.band(95), fan.samples
+"""
+
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from financial_models import DEPLETION_THRESHOLD
+from monte_carlo import DEFAULT_PERCENTILES, ReturnModel, iter_rate_chunks
+from quantiles import QuantileSketch
+
+DEFAULT_MAX_POINTS = 120        # plotted years; ample for a chart a few hundred pixels wide
+DEFAULT_MAX_SAMPLES = 50        # individual paths drawn on top of the bands
+FAN_RELATIVE_ACCURACY = 0.01    # band error; halves the sketch size of the 0.5% default
+FAN_CHUNK_PATHS = 16384         # paths per chunk: ~65 MB of rates at the 500-year cap
+
+
+@dataclass
+class FanData:
+    """Percentile bands and sample paths at the plotted years."""
+    years: np.ndarray               # plotted year numbers (1-based, increasing)
+    percentiles: Tuple[float, ...]
+    bands: np.ndarray               # (len(percentiles), len(years)) balances
+    samples: np.ndarray = field(repr=False)     # (at most max_samples, len(years)) individual paths
+    n_paths: int = 0
+
+    def band(self, percentile: float) -> np.ndarray:
+        """Balances of one percentile at every plotted year."""
+        return self.bands[self.percentiles.index(percentile)]
+
+
+def plotted_years(years: int, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """Year numbers 1..years, evenly thinned to at most max_points (the last year always kept)."""
+    if max_points < 2:
+        raise ValueError("max_points must be at least 2")
+    if years <= max_points:
+        return np.arange(1, years + 1)
+    return np.unique(np.round(np.linspace(1, years, max_points)).astype(np.int64))
+
+
+class FanAccumulator:
+    """
+    Reduces chunks of balance paths to fan-chart data.
+
+    Parameters:
+        years (int): Years per path.
+        percentiles (sequence of float): Percentiles (0-100) of the bands.
+        max_points (int): Most years plotted.
+        max_samples (int): Paths kept for drawing individually.
+        seed (int, optional): Seed of the path sample.
+        relative_accuracy (float): Relative error of the band edges.
+    """
+
+    def __init__(self, years: int, percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                 max_points: int = DEFAULT_MAX_POINTS, max_samples: int = DEFAULT_MAX_SAMPLES,
+                 seed=None, relative_accuracy: float = FAN_RELATIVE_ACCURACY):
+        self.n_years = years
+        self.years = plotted_years(years, max_points)
+        self.percentiles = tuple(sorted(percentiles))
+        self.n_paths = 0
+        self._sketches = [QuantileSketch(relative_accuracy) for _ in self.years]
+        self._samples = np.empty((max_samples, self.years.size))
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, balances) -> "FanAccumulator":
+        """
+        Adds a chunk of paths: (paths, years) year-end balances, or only the
+        plotted years' columns (paths, len(self.years)).
+        """
+        balances = np.atleast_2d(np.asarray(balances, dtype=float))
+        if balances.shape[1] != self.years.size:
+            if balances.shape[1] != self.n_years:
+                raise ValueError(f"expected {self.n_years} or {self.years.size} columns, got {balances.shape[1]}")
+            balances = balances[:, self.years - 1]
+        for sketch, column in zip(self._sketches, balances.T):
+            sketch.add(column)
+        self._sample(balances)
+        self.n_paths += len(balances)
+        return self
+
+    def _sample(self, balances: np.ndarray):
+        # Reservoir sampling (Algorithm R) for a whole chunk: path t replaces
+        # slot j ~ U{0..t} when j < capacity, later paths winning ties.
+        capacity = len(self._samples)
+        seen = self.n_paths
+        fill = min(max(capacity - seen, 0), len(balances))
+        self._samples[seen:seen + fill] = balances[:fill]
+        rest = np.arange(seen + fill, seen + len(balances))
+        if rest.size == 0 or capacity == 0:
+            return
+        slots = (self._rng.random(rest.size) * (rest + 1)).astype(np.int64)
+        rows = np.flatnonzero(slots < capacity)[::-1]
+        slots, last = np.unique(slots[rows], return_index=True)
+        self._samples[slots] = balances[fill + rows[last]]
+
+    def result(self) -> FanData:
+        bands = np.array([sketch.quantiles(np.asarray(self.percentiles) / 100) for sketch in self._sketches]).T
+        kept = min(self.n_paths, len(self._samples))
+        return FanData(self.years, self.percentiles, bands.reshape(len(self.percentiles), self.years.size),
+                       self._samples[:kept].copy(), self.n_paths)
+
+
+# --- Sources ---
+
+def fan_from_paths(balances, percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                   max_points: int = DEFAULT_MAX_POINTS, max_samples: int = DEFAULT_MAX_SAMPLES,
+                   seed=None, chunk_size: int = FAN_CHUNK_PATHS) -> FanData:
+    """Fan-chart data for an existing (paths, years) matrix of year-end balances."""
+    balances = np.atleast_2d(np.asarray(balances, dtype=float))
+    fan = FanAccumulator(balances.shape[1], percentiles, max_points, max_samples, seed)
+    for start in range(0, len(balances), chunk_size):
+        fan.add(balances[start:start + chunk_size])
+    return fan.result()
+
+
+def simulate_fan(principal: float, model: ReturnModel, years: int, n_paths: int, annual_contribution: float = 0.0,
+                 percentiles: Sequence[float] = DEFAULT_PERCENTILES, max_points: int = DEFAULT_MAX_POINTS,
+                 max_samples: int = DEFAULT_MAX_SAMPLES, seed=None,
+                 chunk_size: int = FAN_CHUNK_PATHS) -> FanData:
+    """
+    Fan-chart data for variableInvestor over `n_paths` stochastic rate paths.
+
+    A negative annual_contribution is a yearly withdrawal. A path is then
+    depleted, as in finallyRetired, once its balance falls below 1e-6, and it
+    stays at 0 from that year on.
+
+    Parameters:
+        principal (float): Starting principal.
+        model (ReturnModel): Return model the annual rates are drawn from.
+        years (int): Years per path.
+        n_paths (int): Number of simulated paths.
+        annual_contribution (float): Amount added (or, if negative, withdrawn) each year.
+        percentiles (sequence of float): Percentiles (0-100) of the bands.
+        max_points (int): Most years plotted.
+        max_samples (int): Paths kept for drawing individually.
+        seed (int | SeedSequence, optional): Seed for a reproducible run.
+        chunk_size (int): Paths simulated at once; bounds memory, not results.
+
+    Returns:
+        FanData: Bands and sample paths at the plotted years.
+    """
+    if years <= 0 or n_paths <= 0:
+        raise ValueError("years and n_paths must be positive")
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    fan = FanAccumulator(years, percentiles, max_points, max_samples, seed_seq.generate_state(2))
+    plotted = np.zeros(years + 1, dtype=bool)
+    plotted[fan.years] = True
+    withdrawing = annual_contribution < 0
+
+    for _, rates in iter_rate_chunks(model, years, n_paths, seed_seq, chunk_size):
+        balance = np.full(len(rates), float(principal))
+        columns = np.empty((len(rates), fan.years.size))
+        column = 0
+        with np.errstate(over="ignore", invalid="ignore"):
+            for year in range(years):
+                balance = balance * (1 + rates[:, year]) + annual_contribution
+                if withdrawing:
+                    balance[balance < DEPLETION_THRESHOLD] = 0.0
+                if plotted[year + 1]:
+                    columns[:, column] = balance
+                    column += 1
+        fan.add(columns)
+    return fan.result()
+
+# End of fan_chart.py
@@ -3,7 +3,17 @@
 # Date          :   November , 2025
 # Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
 
-from typing import List
+import math
+from typing import List, Tuple
+
+import instrumentation
+
+# --- Model Constants ---
+
+MAX_RETIREMENT_YEARS = 500      # finallyRetired stops counting here ("perpetual")
+DEPLETION_THRESHOLD = 1e-6      # balances below this count as depleted
+CLOSED_FORM_RTOL = 1e-9         # documented agreement between closed forms and loops
+MODEL_VERSION = 3               # bump whenever a model's results change (invalidates stored results)
 
 # --- Core Algorithmic Functions ---
 
@@ -17,6 +27,15 @@ def fixedInvestor(principal: float, rate: float, years: int, annual_contribution
     Equivalent to:
         balance = balance * (1 + rate) + annual_contribution
 
+    The recurrence has the closed (annuity) form
+
+        Y_n = P * (1 + r)^n + C * ((1 + r)^n - 1) / r
+
+    which is evaluated in O(1); at rate == 0 it reduces to Y_n = P + C * n.
+    The year-by-year loop is only used when neither applies (rate <= -1,
+    non-finite inputs or overflow). The two agree to within CLOSED_FORM_RTOL
+    relative to the size of the principal and contribution terms.
+
     Parameters:
         principal (float): Initial investment amount.
         rate (float): Annual interest rate as decimal.
@@ -26,10 +45,26 @@ def fixedInvestor(principal: float, rate: float, years: int, annual_contribution
     Returns:
         float: Final balance after compounding and contributions.
     """
-    balance = principal
-    for _ in range(years):
-        balance = balance * (1 + rate) + annual_contribution
-    return balance
+    if instrumentation.ENABLED:
+        return instrumentation.timed_call("fixedInvestor", _fixed_investor, principal, rate, years, annual_contribution)
+    return _fixed_investor(principal, rate, years, annual_contribution)
+
+
+def _fixed_investor(principal: float, rate: float, years: int, annual_contribution: float) -> float:
+    if years <= 0:
+        return principal
+    if rate <= -1 or not all_finite(principal, rate, annual_contribution):
+        return _fixed_investor_loop(principal, rate, years, annual_contribution)
+    if rate == 0:
+        return principal + annual_contribution * years
+
+    # expm1/log1p keep (1 + r)^n - 1 accurate for rates close to zero.
+    log_growth = years * math.log1p(rate)
+    try:
+        growth = math.exp(log_growth)
+    except OverflowError:
+        return _fixed_investor_loop(principal, rate, years, annual_contribution)
+    return principal * growth + annual_contribution * math.expm1(log_growth) / rate
 
 
 def variableInvestor(principal: float, rateList: List[float], annual_contribution: float = 0.0) -> float:
@@ -37,6 +72,13 @@ def variableInvestor(principal: float, rateList: List[float], annual_contributio
     Models the effect of varying annual interest rates sequentially, with optional
     annual contributions.
     """
+    if instrumentation.ENABLED:
+        instrumentation.count("variableInvestor", "loop_iterations", len(rateList))
+        return instrumentation.timed_call("variableInvestor", _variable_investor, principal, rateList, annual_contribution)
+    return _variable_investor(principal, rateList, annual_contribution)
+
+
+def _variable_investor(principal: float, rateList: List[float], annual_contribution: float) -> float:
     balance = principal
     for rate in rateList:
         balance = balance * (1 + rate) + annual_contribution
@@ -50,44 +92,345 @@ def finallyRetired(balance: float, expense: float, rate: float) -> int:
     Logic:
         balance = balance * (1 + rate) - expense
 
-    Caps at 500 years to prevent infinite loops.
+    Caps at 500 years to prevent infinite loops, and stops early once the
+    balance drops below 1e-6.
+
+    After k years the balance is
+
+        b_k = (B - E / r) * (1 + r)^k + E / r
+
+    so while it is strictly decreasing the answer is the smallest k >= 1 with
+    b_k < 1e-6, found with a logarithm in O(1). The loop is only used for the
+    edge cases (rate == 0, rate <= -1, expense <= growth i.e. the perpetual
+    case, non-finite inputs). Both give the same year count except when a
+    year-end balance lands within floating-point rounding of the 1e-6
+    threshold, where they may differ by one year.
+    """
+    if instrumentation.ENABLED:
+        years = instrumentation.timed_call("finallyRetired", _finally_retired, balance, expense, rate)
+        if years >= MAX_RETIREMENT_YEARS:
+            instrumentation.count("finallyRetired", "cap_hits")
+        return years
+    return _finally_retired(balance, expense, rate)
+
+
+def _finally_retired(balance: float, expense: float, rate: float) -> int:
+    if not balance > 0:
+        return 0
+    if rate == 0 or rate <= -1 or not all_finite(balance, expense, rate):
+        return _finally_retired_loop(balance, expense, rate)
+
+    if expense <= balance * rate:
+        # Expense covered by growth: the balance never falls (perpetual case).
+        return _finally_retired_loop(balance, expense, rate)
+
+    # b_k < threshold  <=>  (1 + rate)^k > t for growth, < t for decay, where
+    # t = (threshold - E/r) / (B - E/r). Both reduce to k > ln(t) / ln(1 + rate).
+    # t is formed as 1 + x so log1p stays accurate when the rate is tiny.
+    x = rate * (DEPLETION_THRESHOLD - balance) / (balance * rate - expense)
+    if x <= -1:
+        return 1 if rate > 0 else MAX_RETIREMENT_YEARS
+    bound = math.log1p(x) / math.log1p(rate)
+    if bound >= MAX_RETIREMENT_YEARS:
+        return MAX_RETIREMENT_YEARS
+    if bound < 1:
+        return 1
+    return math.floor(bound) + 1
+
+
+def maximumExpensed(balance: float, rate: float, target_years: int = 30, return_iterations: bool = False):
+    """
+    Determines the maximum sustainable annual withdrawal so that the funds last
+    at least `target_years` (i.e. finallyRetired(balance, result, rate) >= target_years).
+
+    finallyRetired stops at the first year whose balance is below 1e-6, and the
+    balance path is monotone in the year, so the funds last `target_years` exactly
+    when both the first-year and the (target_years - 1)th-year balances stay at or
+    above the threshold. Each of those is an annuity-payment equation,
+
+        E_k = (B * (1 + r)^k - 1e-6) / (((1 + r)^k - 1) / r)
+
+    and the answer is min(E_1, E_{target_years - 1}), capped at the balance. The
+    candidate is then checked against the year-by-year finallyRetired rule and
+    moved, usually by an ulp or two, to the largest withdrawal that rule accepts.
+
+    The original Successive Approximation (Binary Search) is kept for the cases
+    the formula does not cover (rate <= -1, non-finite inputs); it now stops as
+    soon as the bracket stops shrinking instead of always running 100 steps.
+
+    Parameters:
+        balance (float): Starting retirement balance.
+        rate (float): Annual growth rate as decimal.
+        target_years (int): Number of years the funds must last.
+        return_iterations (bool): Also return how many finallyRetired
+            evaluations the solve used.
+
+    Returns:
+        float: Maximum sustainable annual withdrawal, or
+        tuple[float, int]: (withdrawal, iterations) when return_iterations is True.
+    """
+    if instrumentation.ENABLED:
+        expense, iterations = instrumentation.timed_call("maximumExpensed", _maximum_expensed, balance, rate, target_years)
+        instrumentation.count("maximumExpensed", "solver_steps", iterations)
+    else:
+        expense, iterations = _maximum_expensed(balance, rate, target_years)
+    if return_iterations:
+        return expense, iterations
+    return expense
+
+
+def _maximum_expensed(balance: float, rate: float, target_years: int):
+    expense, iterations = _maximum_expensed_analytic(balance, rate, target_years)
+    if expense is None:
+        expense, iterations = _maximum_expensed_bisection(balance, rate, target_years)
+        if instrumentation.ENABLED:
+            instrumentation.count("maximumExpensed", "bisection_fallbacks")
+    return expense, iterations
+
+
+# --- Year-by-Year Trajectories (NumPy) ---
+
+def fixedTrajectory(principal: float, rate: float, years: int, annual_contribution: float = 0.0):
+    """
+    Year-end balances of fixedInvestor for years 1..years.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (balances, principal_only), where
+        principal_only is the principal plus contributions without interest.
+    """
+    np = require_numpy()
+    years = max(int(years), 0)
+    growth = np.empty(years)
+    growth.fill(1 + rate)
+    return _trajectory(principal, growth, annual_contribution)
+
+
+def variableTrajectory(principal: float, rateList: List[float], annual_contribution: float = 0.0):
     """
+    Year-end balances of variableInvestor, one per rate in rateList.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (balances, principal_only).
+    """
+    np = require_numpy()
+    growth = np.array(rateList, dtype=float)
+    growth += 1
+    return _trajectory(principal, growth, annual_contribution)
+
+
+def retirementTrajectory(balance: float, expense: float, rate: float):
+    """
+    Year-end balances of the finallyRetired depletion path, one per year the
+    funds last (so its length equals finallyRetired(balance, expense, rate)).
+
+    Returns:
+        np.ndarray: Balance after each year's growth and withdrawal.
+    """
+    np = require_numpy()
+    growth = np.empty(finallyRetired(balance, expense, rate))
+    growth.fill(1 + rate)
+    balances, _ = _trajectory(balance, growth, -expense)
+    return balances
+
+
+def require_numpy(feature: str = "Trajectories"):
+    """
+    Imports NumPy on first use, so code that never needs it does not pay for
+    it. `feature` names what needs NumPy in the ImportError.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"{feature} require NumPy. Install it with: pip install numpy") from None
+    return numpy
+
+
+def _trajectory(principal: float, growth, contribution: float) -> Tuple:
+    """
+    Solves b_k = b_{k-1} * g_k + c for every k in one pass.
+
+    With G_k the running product of growth factors,
+
+        b_k = G_k * (P + c * sum_{j<=k} 1 / G_j)
+
+    so the series is a cumulative product and a cumulative sum written into
+    preallocated arrays. The year-by-year loop is used instead when a growth
+    factor is not positive or the running product leaves float range.
+    """
+    np = require_numpy()
+    n = growth.size
+    balances = np.empty(n)
+    principal_only = np.arange(1, n + 1, dtype=float)
+    principal_only *= contribution
+    principal_only += principal
+
+    if n and growth.min() > 0:
+        scratch = np.empty(n)
+        with np.errstate(over="ignore", under="ignore", divide="ignore", invalid="ignore"):
+            np.cumprod(growth, out=balances)            # G_k
+            np.divide(1.0, balances, out=scratch)       # 1 / G_k
+            np.cumsum(scratch, out=scratch)             # sum_{j<=k} 1 / G_j
+            scratch *= contribution
+            scratch += principal
+            balances *= scratch
+        if np.isfinite(scratch).all() and np.isfinite(balances).all():
+            return balances, principal_only
+
+    balance = principal
+    for year, factor in enumerate(growth.tolist()):
+        balance = balance * factor + contribution
+        balances[year] = balance
+    return balances, principal_only
+
+
+# --- Iterative Reference Implementations ---
+
+def all_finite(*values: float) -> bool:
+    """True if no value is NaN or infinite."""
+    return all(math.isfinite(v) for v in values)
+
+
+def _fixed_investor_loop(principal: float, rate: float, years: int, annual_contribution: float) -> float:
+    """Year-by-year fixedInvestor, used where the annuity formula does not apply."""
+    if instrumentation.ENABLED:
+        instrumentation.count("fixedInvestor", "loop_fallbacks")
+        instrumentation.count("fixedInvestor", "loop_iterations", max(years, 0))
+    balance = principal
+    for _ in range(years):
+        balance = balance * (1 + rate) + annual_contribution
+    return balance
+
+
+def _finally_retired_loop(balance: float, expense: float, rate: float) -> int:
+    """Year-by-year finallyRetired, used where the logarithm solution does not apply."""
     years = 0
     current_balance = balance
 
-    while current_balance > 0 and years < 500:
+    while current_balance > 0 and years < MAX_RETIREMENT_YEARS:
         current_balance = current_balance * (1 + rate)
         current_balance -= expense
         years += 1
 
         # Early exit for extremely small balance
-        if current_balance < 1e-6:
+        if current_balance < DEPLETION_THRESHOLD:
             break
 
+    if instrumentation.ENABLED:
+        instrumentation.count("finallyRetired", "loop_fallbacks")
+        instrumentation.count("finallyRetired", "loop_iterations", years)
     return years
 
 
-def maximumExpensed(balance: float, rate: float, target_years: int = 30) -> float:
+def annuity_factor(rate: float, years: int) -> float:
+    """((1 + rate)^years - 1) / rate, i.e. the balance after `years` unit payments."""
+    if rate == 0:
+        return float(years)
+    return math.expm1(years * math.log1p(rate)) / rate
+
+
+def _maximum_expensed_analytic(balance: float, rate: float, target_years: int):
+    """Closed-form maximumExpensed. Returns (None, 0) when the formula does not apply."""
+    if not (balance > 0 and rate > -1 and all_finite(balance, rate)):
+        return None, 0
+    if target_years > MAX_RETIREMENT_YEARS:
+        return 0.0, 0
+    if target_years <= 1:
+        return balance, 0
+
+    candidates = []
+    for k in {1, target_years - 1}:
+        try:
+            growth = math.exp(k * math.log1p(rate))
+        except OverflowError:
+            return None, 0
+        candidates.append((balance * growth - DEPLETION_THRESHOLD) / annuity_factor(rate, k))
+    expense = min(min(candidates), balance)
+    if not expense > 0:
+        return 0.0, 0
+
+    # The formula ignores the loop's rounding, so the candidate can be a few
+    # ulps either side of the largest withdrawal that the year-by-year rule
+    # accepts. Bracket that boundary with ulp steps that double, then bisect
+    # it down to adjacent floats. The closed-form finallyRetired is not used
+    # for the check: the maximal withdrawal leaves a balance right at the 1e-6
+    # threshold, where it may differ from the loop by a year.
+    iterations = 1
+    if lasts(balance, expense, rate, target_years):
+        low, high = expense, None
+    else:
+        low, high = None, expense
+    step = math.ulp(expense)
+    while low is None or high is None:
+        if iterations >= 128:
+            return None, iterations
+        iterations += 1
+        if high is None:
+            probe = min(low + step, balance)
+            if probe == low:
+                return low, iterations          # capped at the balance
+            if lasts(balance, probe, rate, target_years):
+                low = probe
+            else:
+                high = probe
+        else:
+            probe = max(high - step, 0.0)
+            if lasts(balance, probe, rate, target_years):
+                low = probe
+            elif probe == 0.0:
+                return 0.0, iterations
+            else:
+                high = probe
+        step *= 2
+
+    while True:
+        middle = (low + high) / 2
+        if middle == low or middle == high:
+            return low, iterations
+        iterations += 1
+        if lasts(balance, middle, rate, target_years):
+            low = middle
+        else:
+            high = middle
+
+
+def lasts(balance: float, expense: float, rate: float, target_years: int) -> bool:
     """
-    Uses Successive Approximation (Binary Search) to determine the maximum
-    sustainable annual withdrawal so that the funds last at least `target_years`.
+    Whether the funds last target_years under the year-by-year finallyRetired
+    rule, i.e. _finally_retired_loop(balance, expense, rate) >= target_years,
+    stopping after target_years - 1 years instead of running on to depletion.
 
-    This function directly supports the Divide-and-Conquer requirement.
+    Solvers use it to verify closed-form answers that sit on the 1e-6
+    threshold, where the closed-form finallyRetired may be a year off.
     """
+    if target_years > MAX_RETIREMENT_YEARS or not balance > 0:
+        return target_years <= 0
+    for _ in range(target_years - 1):
+        balance = balance * (1 + rate)
+        balance -= expense
+        if not balance >= DEPLETION_THRESHOLD:
+            return False
+    return True
+
+
+def _maximum_expensed_bisection(balance: float, rate: float, target_years: int):
+    """Successive Approximation (Binary Search) over [0, balance]."""
     low_expense = 0.0
     high_expense = balance
     optimal_expense = 0.0
+    iterations = 0
 
     for _ in range(100):  # Ensures high precision
         mid_expense = (low_expense + high_expense) / 2
-        years_sustained = finallyRetired(balance, mid_expense, rate)
+        if mid_expense == low_expense or mid_expense == high_expense:
+            break  # Bracket can no longer shrink in floating point
+        iterations += 1
 
-        if years_sustained >= target_years:
+        if lasts(balance, mid_expense, rate, target_years):
             optimal_expense = mid_expense
             low_expense = mid_expense
         else:
             high_expense = mid_expense
 
-    return optimal_expense
+    return optimal_expense, iterations
 
 # End of financial_models.py
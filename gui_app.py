@@ -4,30 +4,68 @@
 # Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
 # GUI Version   :   Tkinter-based graphical interface
 
-import tkinter as tk
-from tkinter import ttk, messagebox
 import sys
 import os
+import threading
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from financial_models import fixedInvestor, variableInvestor, finallyRetired, maximumExpensed
+import startup_profile  # first, so the startup clock covers every other import
+
+import argparse
+import tkinter as tk
+from tkinter import ttk, messagebox
+from financial_models import (MAX_RETIREMENT_YEARS, fixedInvestor, finallyRetired, maximumExpensed,
+                              fixedTrajectory, variableTrajectory)
+from gui_worker import BackgroundWorker
+from affine_path import AffinePath
+
+startup_profile.mark("imports")
+
+# Optional plotting support; Matplotlib is only imported on the first plot request
+PLOTTING_AVAILABLE = None   # unknown until _plotting_available() runs
+GrowthChart = None
+FanChart = None
+
+LIVE_RECOMPUTE_MS = 150     # quiet period after the last keystroke before recalculating
+FIXED_CHART_TITLE = 'Fixed Growth Curve'
+VARIABLE_CHART_TITLE = 'Variable Growth Curve'
+FAN_CHART_TITLE = 'Variable Growth Fan Chart'
+FAN_PATHS = 100000          # simulated paths behind the fan chart
+
+
+def _plotting_available():
+    """Imports the chart module on first use; False if Matplotlib is missing."""
+    global PLOTTING_AVAILABLE, GrowthChart, FanChart
+    if PLOTTING_AVAILABLE is None:
+        try:
+            from gui_charts import GrowthChart, FanChart
+            PLOTTING_AVAILABLE = True
+        except Exception:
+            PLOTTING_AVAILABLE = False
+    return PLOTTING_AVAILABLE
 
-# Optional plotting support
-try:
-    import matplotlib
-    matplotlib.use('TkAgg')
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    PLOTTING_AVAILABLE = True
-except Exception:
-    PLOTTING_AVAILABLE = False
+
+def _plan_summary(principal, years, rate, contribution, expense, inflation, retirement_rate, target_years):
+    """Balance at retirement, inflated expense, years lasted and sustainable withdrawal of one plan."""
+    from lifecycle import plan_lifecycle
+    plan = plan_lifecycle(principal, years, rate, contribution, expense, retirement_rate, target_years,
+                          inflation=inflation)
+    return (float(plan.retirement_balance[0]), float(plan.retirement_expense[0]), int(plan.years_lasted[0]),
+            float(plan.sustainable_withdrawal[0]))
+
+
+def _simulate_variable_fan(principal, rates, contribution):
+    """Fan-chart data for FAN_PATHS paths whose yearly rates are resampled from `rates`."""
+    from fan_chart import simulate_fan
+    from monte_carlo import BootstrapReturns
+    return simulate_fan(principal, BootstrapReturns(rates), len(rates), FAN_PATHS, contribution)
 
 
 class RetirementOptimizerGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Retirement Optimization System")
-        self.root.geometry("600x550")
+        self.root.geometry("600x590")
         self.root.resizable(False, False)
         
         # Create header
@@ -50,6 +88,116 @@ class RetirementOptimizerGUI:
         self.create_variable_investor_tab()
         self.create_finally_retired_tab()
         self.create_maximum_expensed_tab()
+        self.create_lifecycle_plan_tab()
+
+        # Model calls run on a background worker so the window never freezes
+        self.create_status_bar()
+        self.worker = BackgroundWorker(root, on_busy_changed=self._set_busy)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # One persistent chart per growth tab, and live recalculation while typing
+        self._charts = {}
+        self._debounce = {}
+        self._watch_inputs()
+
+    def create_status_bar(self):
+        """Progress indicator and Cancel button shown while a calculation runs."""
+        self.status_frame = ttk.Frame(self.root, padding=(10, 0, 10, 8))
+        self.status_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        self.status_label = tk.Label(self.status_frame, text="", font=("Arial", 9), fg="gray")
+        self.status_label.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(self.status_frame, text="Cancel", command=self.cancel_calculation)
+        self.progress = ttk.Progressbar(self.status_frame, mode="indeterminate", length=160)
+        self._busy_after_id = None
+
+    def _set_busy(self, busy):
+        # Only show the indicator for jobs that take noticeable time (avoids flicker)
+        if busy and self._busy_after_id is None:
+            self._busy_after_id = self.root.after(200, self._show_progress)
+        elif not busy:
+            if self._busy_after_id is not None:
+                self.root.after_cancel(self._busy_after_id)
+                self._busy_after_id = None
+            self.progress.stop()
+            self.progress.pack_forget()
+            self.cancel_button.pack_forget()
+            self.status_label.config(text="")
+
+    def _show_progress(self):
+        self._busy_after_id = None
+        if not self.worker.busy:
+            return
+        self.status_label.config(text="Calculating...")
+        self.cancel_button.pack(side=tk.RIGHT)
+        self.progress.pack(side=tk.RIGHT, padx=8)
+        self.progress.start(15)
+
+    def cancel_calculation(self):
+        """Drops all running calculations and clears their pending results."""
+        self.worker.cancel()
+        for label in (self.fi_result, self.vi_result, self.fr_result, self.me_result, self.lp_result):
+            if label.cget("text") == "Calculating...":
+                label.config(text="Cancelled", fg="gray")
+
+    def _show_calculation_error(self, label, error, quiet=False):
+        # While live-editing, show the error on the result label instead of a dialog
+        if quiet:
+            label.config(text=f"Could not calculate: {error}", fg="#c0392b")
+            return
+        messagebox.showerror("Calculation Error", f"Could not calculate: {error}")
+        label.config(text="")
+
+    def _on_close(self):
+        for after_id in self._debounce.values():
+            self.root.after_cancel(after_id)
+        self._debounce.clear()
+        for chart in list(self._charts.values()):
+            chart.close()
+        self.worker.shutdown()
+        self.root.destroy()
+
+    # --- Live recalculation ---
+    def _watch_inputs(self):
+        """Recalculate a tab shortly after the user stops editing its inputs."""
+        self._calculators = {
+            "fixed": self.calculate_fixed_investor,
+            "variable": self.calculate_variable_investor,
+            "retired": self.calculate_finally_retired,
+            "expensed": self.calculate_maximum_expensed,
+            "plan": self.calculate_lifecycle_plan,
+        }
+        inputs = {
+            "fixed": (self.fi_principal, self.fi_rate, self.fi_contribution, self.fi_years),
+            "variable": (self.vi_principal, self.vi_rates, self.vi_contribution),
+            "retired": (self.fr_balance, self.fr_expense, self.fr_rate),
+            "expensed": (self.me_balance, self.me_rate, self.me_years),
+            "plan": (self.lp_principal, self.lp_rate, self.lp_contribution, self.lp_years, self.lp_expense,
+                     self.lp_inflation, self.lp_retirement_rate, self.lp_target_years),
+        }
+        for key, variables in inputs.items():
+            for var in variables:
+                var.trace_add("write", lambda *_, key=key: self._schedule_recompute(key))
+
+    def _schedule_recompute(self, key):
+        # Each keystroke restarts the timer, so a burst of edits gives one calculation
+        pending = self._debounce.pop(key, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._debounce[key] = self.root.after(LIVE_RECOMPUTE_MS, self._recompute, key)
+
+    def _recompute(self, key):
+        self._debounce.pop(key, None)
+        self._calculators[key](quiet=True)
+
+    def _input_error(self, label, error, quiet):
+        # Half-typed input while live-editing just clears the result
+        if not quiet:
+            messagebox.showerror("Input Error", f"Invalid input: {error}")
+        label.config(text="")
+
+    def _chart_open(self, title):
+        chart = self._charts.get(title)
+        return chart is not None and chart.alive
     
     def create_fixed_investor_tab(self):
         """Tab 1: Fixed Growth Simulation"""
@@ -119,11 +267,14 @@ class RetirementOptimizerGUI:
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(pady=15)
         ttk.Button(btn_frame, text="Calculate", command=self.calculate_variable_investor).pack(side=tk.LEFT, padx=(0, 8))
-        ttk.Button(btn_frame, text="Plot Growth", command=self.plot_variable_investor).pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Plot Growth", command=self.plot_variable_investor).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(btn_frame, text="Fan Chart", command=self.plot_variable_fan).pack(side=tk.LEFT)
         
         # Result
         self.vi_result = tk.Label(frame, text="", font=("Arial", 11, "bold"), fg="#27ae60")
         self.vi_result.pack(pady=10)
+        self._variable_path = None     # AffinePath of the last calculated inputs
+        self._variable_lock = threading.Lock()     # a cancelled update may still be running
     
     def create_finally_retired_tab(self):
         """Tab 3: Retirement Longevity"""
@@ -187,7 +338,45 @@ class RetirementOptimizerGUI:
         self.me_result = tk.Label(frame, text="", font=("Arial", 11, "bold"), fg="#27ae60")
         self.me_result.pack(pady=10)
     
-    def calculate_fixed_investor(self):
+    def create_lifecycle_plan_tab(self):
+        """Tab 5: Full Retirement Plan (accumulation + retirement)"""
+        frame = ttk.Frame(self.notebook, padding="20")
+        self.notebook.add(frame, text="Retirement Plan")
+
+        tk.Label(frame, text="Full Retirement Plan", font=("Arial", 12, "bold")).pack()
+        tk.Label(frame, text="Saves until retirement, then feeds that balance into the retirement models",
+                 font=("Arial", 9), fg="gray").pack()
+
+        # Two columns of inputs so the eight fields fit the window
+        form = ttk.Frame(frame)
+        form.pack(fill=tk.X)
+        form.columnconfigure((0, 1), weight=1, uniform="plan")
+        fields = [
+            ("Initial Principal ($):", "lp_principal", ""),
+            ("Annual Interest Rate Until Retirement:", "lp_rate", ""),
+            ("Annual Contribution ($):", "lp_contribution", ""),
+            ("Years to Retirement:", "lp_years", ""),
+            ("Annual Expense in Today's Money ($):", "lp_expense", ""),
+            ("Annual Inflation Until Retirement:", "lp_inflation", "0"),
+            ("Post-Retirement Growth Rate:", "lp_retirement_rate", ""),
+            ("Target Retirement Years:", "lp_target_years", "30"),
+        ]
+        for i, (text, name, default) in enumerate(fields):
+            row, column = divmod(i, 2)
+            var = tk.StringVar(value=default)
+            setattr(self, name, var)
+            padx = (0, 8) if column == 0 else (8, 0)
+            tk.Label(form, text=text, anchor="w").grid(row=2 * row, column=column, sticky="ew", padx=padx, pady=(10, 0))
+            ttk.Entry(form, textvariable=var).grid(row=2 * row + 1, column=column, sticky="ew", padx=padx)
+
+        # Button
+        ttk.Button(frame, text="Calculate", command=self.calculate_lifecycle_plan).pack(pady=15)
+
+        # Result
+        self.lp_result = tk.Label(frame, text="", font=("Arial", 11, "bold"), fg="#27ae60", justify=tk.LEFT)
+        self.lp_result.pack(pady=10)
+
+    def calculate_fixed_investor(self, quiet=False):
         """Calculate fixed investor model"""
         try:
             principal = float(self.fi_principal.get())
@@ -197,16 +386,22 @@ class RetirementOptimizerGUI:
             
             if years <= 0:
                 raise ValueError("Years must be positive")
-            
-            result = fixedInvestor(principal, rate, years, contribution)
-            self.fi_result.config(text=f"Final Balance: ${result:,.2f}")
+        except ValueError as e:
+            self._input_error(self.fi_result, e, quiet)
+            return
+
+        def show(result):
+            self.fi_result.config(text=f"Final Balance: ${result:,.2f}", fg="#27ae60")
             # store last computed series for plotting
             self._last_fixed = dict(principal=principal, rate=rate, contribution=contribution, years=years)
-        except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid input: {e}")
-            self.fi_result.config(text="")
+            if self._chart_open(FIXED_CHART_TITLE):
+                self.plot_fixed_investor(lift=False)
+
+        self.fi_result.config(text="Calculating...", fg="gray")
+        self.worker.submit("fixed", fixedInvestor, principal, rate, years, contribution, on_success=show,
+                           on_error=lambda e: self._show_calculation_error(self.fi_result, e, quiet))
     
-    def calculate_variable_investor(self):
+    def calculate_variable_investor(self, quiet=False):
         """Calculate variable investor model"""
         try:
             principal = float(self.vi_principal.get())
@@ -215,109 +410,101 @@ class RetirementOptimizerGUI:
             
             if not rates:
                 raise ValueError("Please provide at least one interest rate")
-            
-            result = variableInvestor(principal, rates, contribution)
-            self.vi_result.config(text=f"Final Balance: ${result:,.2f}")
+        except ValueError as e:
+            self._input_error(self.vi_result, e, quiet)
+            return
+
+        def show(result):
+            self.vi_result.config(text=f"Final Balance: ${result:,.2f}", fg="#27ae60")
             # store last computed series for plotting
             self._last_variable = dict(principal=principal, rates=rates, contribution=contribution)
-        except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid input: {e}")
-            self.vi_result.config(text="")
+            if self._chart_open(VARIABLE_CHART_TITLE):
+                self.plot_variable_investor(lift=False)
+
+        self.vi_result.config(text="Calculating...", fg="gray")
+        self.worker.submit("variable", self._update_variable_path, principal, rates, contribution, on_success=show,
+                           on_error=lambda e: self._show_calculation_error(self.vi_result, e, quiet))
+
+    def _update_variable_path(self, principal, rates, contribution):
+        # Runs in a worker thread. What-if edits to the rate list only
+        # recompute the years that changed.
+        with self._variable_lock:
+            if self._variable_path is None:
+                self._variable_path = AffinePath(principal, rates, contribution)
+            else:
+                self._variable_path.principal = principal
+                self._variable_path.update(rates, contribution)
+            return self._variable_path.final_balance
 
     # --- Plotting helpers ---
-    def _plot_window(self, title, years, balances, principal_only=None):
-        if not PLOTTING_AVAILABLE:
-            messagebox.showerror("Plotting Unavailable", "Matplotlib is not installed. Install it with: pip install matplotlib")
-            return
+    def _chart_window(self, title, chart_class, lift=True):
+        # Reuse the tab's chart window so repeated plots redraw in place
+        chart = self._charts.get(title)
+        if chart is None or not chart.alive:
+            chart = chart_class(self.root, title, on_export=self._export_plot,
+                                on_close=lambda c: self._charts.pop(c.title, None))
+            self._charts[title] = chart
+        elif lift:
+            chart.lift()
+        return chart
 
-        win = tk.Toplevel(self.root)
-        win.title(title)
-        win.geometry("700x550")
-        
-        fig, ax = plt.subplots(figsize=(7, 5), dpi=100)
-        ax.plot(years, balances, marker='o', linewidth=2, label='Total Balance (with interest/contributions)', color='#27ae60')
-        
-        # Plot principal-only comparison if provided
-        if principal_only is not None:
-            ax.plot(years, principal_only, marker='s', linewidth=2, label='Principal Only (no interest)', color='#e74c3c', linestyle='--')
-            ax.legend(loc='upper left')
-        
-        ax.set_xlabel('Year', fontsize=11)
-        ax.set_ylabel('Balance ($)', fontsize=11)
-        ax.set_title(title, fontsize=12, fontweight='bold')
-        ax.grid(True, linestyle='--', alpha=0.6)
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1000:.0f}K' if x >= 1000 else f'${x:.0f}'))
-
-        canvas = FigureCanvasTkAgg(fig, master=win)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Add toolbar
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-        toolbar = NavigationToolbar2Tk(canvas, win)
-        toolbar.update()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Add export button
-        btn_frame = ttk.Frame(win)
-        btn_frame.pack(fill=tk.X, padx=5, pady=5)
-        ttk.Button(btn_frame, text="Export as PNG", command=lambda: self._export_plot(fig, title)).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(btn_frame, text="Export as PDF", command=lambda: self._export_plot(fig, title, fmt='pdf')).pack(side=tk.LEFT)
-        
-        canvas.draw()
+    def _plot_window(self, title, years, balances, principal_only=None, lift=True):
+        self._chart_window(title, GrowthChart, lift).update(years, balances, principal_only)
+
+    def _plotting_unavailable(self):
+        messagebox.showerror("Plotting Unavailable", "Matplotlib is not installed. Install it with: pip install matplotlib")
 
-    def plot_fixed_investor(self):
-        # Build the yearly balances using the same logic as fixedInvestor
+    def plot_fixed_investor(self, lift=True):
+        # Year-by-year balances from the same recurrence as fixedInvestor
         info = getattr(self, '_last_fixed', None)
         if info is None:
             messagebox.showinfo('Plot Info', 'Run Calculate first to generate data to plot.')
             return
+        if not _plotting_available():
+            self._plotting_unavailable()
+            return
 
-        principal = info['principal']
-        rate = info['rate']
-        contribution = info['contribution']
-        years = info['years']
-
-        balances = []
-        principal_only = []
-        bal = principal
-        prin = principal
-        for y in range(1, years + 1):
-            bal = bal * (1 + rate) + contribution
-            prin = prin + contribution
-            balances.append(bal)
-            principal_only.append(prin)
-
-        yrs = list(range(1, years + 1))
-        self._plot_window('Fixed Growth Curve', yrs, balances, principal_only)
-
-    def plot_variable_investor(self):
+        yrs = list(range(1, info['years'] + 1))
+        self.worker.submit(
+            "fixed_plot", fixedTrajectory, info['principal'], info['rate'], info['years'], info['contribution'],
+            on_success=lambda series: self._plot_window(FIXED_CHART_TITLE, yrs, *series, lift=lift),
+            on_error=lambda e: messagebox.showerror("Plot Error", f"Could not build plot data: {e}"))
+
+    def plot_variable_investor(self, lift=True):
         info = getattr(self, '_last_variable', None)
         if info is None:
             messagebox.showinfo('Plot Info', 'Run Calculate first to generate data to plot.')
             return
+        if not _plotting_available():
+            self._plotting_unavailable()
+            return
 
-        principal = info['principal']
-        rates = info['rates']
-        contribution = info['contribution']
+        yrs = list(range(1, len(info['rates']) + 1))
+        self.worker.submit(
+            "variable_plot", variableTrajectory, info['principal'], info['rates'], info['contribution'],
+            on_success=lambda series: self._plot_window(VARIABLE_CHART_TITLE, yrs, *series, lift=lift),
+            on_error=lambda e: messagebox.showerror("Plot Error", f"Could not build plot data: {e}"))
 
-        balances = []
-        principal_only = []
-        bal = principal
-        prin = principal
-        for i, r in enumerate(rates, start=1):
-            bal = bal * (1 + r) + contribution
-            prin = prin + contribution
-            balances.append(bal)
-            principal_only.append(prin)
+    def plot_variable_fan(self):
+        # Percentile bands over many paths that resample the entered rates
+        info = getattr(self, '_last_variable', None)
+        if info is None:
+            messagebox.showinfo('Plot Info', 'Run Calculate first to generate data to plot.')
+            return
+        if not _plotting_available():
+            self._plotting_unavailable()
+            return
 
-        yrs = list(range(1, len(rates) + 1))
-        self._plot_window('Variable Growth Curve', yrs, balances, principal_only)
+        self.worker.submit(
+            "variable_fan", _simulate_variable_fan, info['principal'], info['rates'], info['contribution'],
+            on_success=lambda fan: self._chart_window(FAN_CHART_TITLE, FanChart).update(fan),
+            on_error=lambda e: messagebox.showerror("Plot Error", f"Could not build plot data: {e}"))
 
-    def _export_plot(self, fig, title, fmt='png'):
+    def _export_plot(self, chart, fmt='png'):
         """Export the plot to a file (PNG or PDF)."""
         from tkinter import filedialog
         file_ext = f".{fmt}"
-        default_name = title.replace(' ', '_').lower() + file_ext
+        default_name = chart.title.replace(' ', '_').lower() + file_ext
         file_path = filedialog.asksaveasfilename(
             defaultextension=file_ext,
             filetypes=[(f"{fmt.upper()} files", f"*{file_ext}"), ("All files", "*.*")],
@@ -325,25 +512,28 @@ class RetirementOptimizerGUI:
         )
         if file_path:
             try:
-                fig.savefig(file_path, format=fmt, dpi=150, bbox_inches='tight')
+                chart.save(file_path, fmt)
                 messagebox.showinfo("Export Successful", f"Plot exported to:\n{file_path}")
             except Exception as e:
                 messagebox.showerror("Export Failed", f"Could not export: {e}")
     
-    def calculate_finally_retired(self):
+    def calculate_finally_retired(self, quiet=False):
         """Calculate finally retired model"""
         try:
             balance = float(self.fr_balance.get())
             expense = float(self.fr_expense.get())
             rate = float(self.fr_rate.get())
-            
-            result = finallyRetired(balance, expense, rate)
-            self.fr_result.config(text=f"Retirement Duration: {result} years")
         except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid input: {e}")
-            self.fr_result.config(text="")
+            self._input_error(self.fr_result, e, quiet)
+            return
+
+        self.fr_result.config(text="Calculating...", fg="gray")
+        self.worker.submit(
+            "retired", finallyRetired, balance, expense, rate,
+            on_success=lambda result: self.fr_result.config(text=f"Retirement Duration: {result} years", fg="#27ae60"),
+            on_error=lambda e: self._show_calculation_error(self.fr_result, e, quiet))
     
-    def calculate_maximum_expensed(self):
+    def calculate_maximum_expensed(self, quiet=False):
         """Calculate maximum expensed model"""
         try:
             balance = float(self.me_balance.get())
@@ -352,15 +542,69 @@ class RetirementOptimizerGUI:
             
             if years <= 0:
                 raise ValueError("Years must be positive")
-            
-            result = maximumExpensed(balance, rate, years)
-            self.me_result.config(text=f"Max Annual Withdrawal: ${result:,.2f}")
         except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid input: {e}")
-            self.me_result.config(text="")
+            self._input_error(self.me_result, e, quiet)
+            return
 
+        self.me_result.config(text="Calculating...", fg="gray")
+        self.worker.submit(
+            "expensed", maximumExpensed, balance, rate, years,
+            on_success=lambda result: self.me_result.config(text=f"Max Annual Withdrawal: ${result:,.2f}", fg="#27ae60"),
+            on_error=lambda e: self._show_calculation_error(self.me_result, e, quiet))
+
+    def calculate_lifecycle_plan(self, quiet=False):
+        """Calculate the full retirement plan"""
+        try:
+            principal = float(self.lp_principal.get())
+            rate = float(self.lp_rate.get())
+            contribution = float(self.lp_contribution.get())
+            years = int(self.lp_years.get())
+            expense = float(self.lp_expense.get())
+            inflation = float(self.lp_inflation.get())
+            retirement_rate = float(self.lp_retirement_rate.get())
+            target_years = int(self.lp_target_years.get())
+
+            if years <= 0 or target_years <= 0:
+                raise ValueError("Years must be positive")
+        except ValueError as e:
+            self._input_error(self.lp_result, e, quiet)
+            return
+
+        def show(summary):
+            balance, expense_at_retirement, years_lasted, withdrawal = summary
+            lasted = f">{MAX_RETIREMENT_YEARS} years (perpetual)" if years_lasted >= MAX_RETIREMENT_YEARS \
+                else f"{years_lasted} years"
+            self.lp_result.config(
+                text=f"Balance at Retirement: ${balance:,.2f}\n"
+                     f"Expense at Retirement: ${expense_at_retirement:,.2f}\n"
+                     f"Funds Last: {lasted}\n"
+                     f"Max Annual Withdrawal: ${withdrawal:,.2f}",
+                fg="#27ae60" if years_lasted >= target_years else "#c0392b")
+
+        self.lp_result.config(text="Calculating...", fg="gray")
+        self.worker.submit(
+            "plan", _plan_summary, principal, years, rate, contribution, expense, inflation, retirement_rate,
+            target_years, on_success=show,
+            on_error=lambda e: self._show_calculation_error(self.lp_result, e, quiet))
+
+def _report_first_paint():
+    startup_profile.mark("first paint")
+    startup_profile.report()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Retirement Optimization System (GUI)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print import, window and first-paint times to stderr")
+    args = parser.parse_args(argv)
 
-if __name__ == "__main__":
     root = tk.Tk()
     app = RetirementOptimizerGUI(root)
+    startup_profile.mark("window built")
+    if args.startup_profile:
+        # Idle callbacks run in order, so this fires after Tk's pending redraws
+        root.after_idle(_report_first_paint)
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
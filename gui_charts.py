@@ -0,0 +1,232 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Persistent Matplotlib chart windows for the GUI.
+
+Each growth tab owns one GrowthChart. New data replaces the line data of the
+existing figure instead of building a new window, figure and canvas. When the
+new data still fits the current axes the lines are redrawn with blitting
+(restore the cached background, draw the lines, blit); otherwise the axes are
+rescaled with one full redraw. Figures are created with matplotlib.figure.Figure
+rather than pyplot, so nothing keeps them alive after their window is closed.
+
+FanChart shows Monte Carlo runs (see fan_chart): nested percentile bands
+drawn with fill_between, the median line, and the sample paths as a single
+LineCollection. The artist count is fixed and the point count is bounded by
+fan_chart.DEFAULT_MAX_POINTS, so drawing 100k paths costs the same as drawing
+100.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+import matplotlib
+matplotlib.use('TkAgg')
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
+
+AXIS_MARGIN = 0.05          # padding around the data when rescaling
+MIN_VIEW_FILL = 0.6         # rescale when the data shrinks below this share of the view
+FAN_COLOR = '#27ae60'
+FAN_BAND_ALPHAS = (0.18, 0.32, 0.46)     # outermost band first
+
+
+def _dollar_formatter(x, pos):
+    return f'${x/1000:.0f}K' if x >= 1000 else f'${x:.0f}'
+
+
+class ChartWindow:
+    """
+    A Toplevel window with one Matplotlib axes, a toolbar and export buttons.
+
+    Parameters:
+        root: Tk root the window belongs to.
+        title (str): Window and axes title.
+        on_export (callable): Called with (chart, fmt) by the export buttons.
+        on_close (callable): Called with the chart after its window is closed.
+    """
+
+    def __init__(self, root, title, on_export, on_close):
+        self.title = title
+        self._on_close = on_close
+        self.window = tk.Toplevel(root)
+        self.window.title(title)
+        self.window.geometry("700x550")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.figure = Figure(figsize=(7, 5), dpi=100)
+        self.ax = self.figure.add_subplot()
+        self.ax.set_xlabel('Year', fontsize=11)
+        self.ax.set_ylabel('Balance ($)', fontsize=11)
+        self.ax.set_title(title, fontsize=12, fontweight='bold')
+        self.ax.grid(True, linestyle='--', alpha=0.6)
+        self.ax.yaxis.set_major_formatter(FuncFormatter(_dollar_formatter))
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.window)
+        toolbar = NavigationToolbar2Tk(self.canvas, self.window)
+        toolbar.update()
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        btn_frame = ttk.Frame(self.window)
+        btn_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(btn_frame, text="Export as PNG", command=lambda: on_export(self, 'png')).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(btn_frame, text="Export as PDF", command=lambda: on_export(self, 'pdf')).pack(side=tk.LEFT)
+
+    @property
+    def alive(self) -> bool:
+        return self.window is not None and bool(self.window.winfo_exists())
+
+    def lift(self):
+        self.window.deiconify()
+        self.window.lift()
+
+    def save(self, path, fmt):
+        self.figure.savefig(path, format=fmt, dpi=150, bbox_inches='tight')
+
+    def close(self):
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+        self.figure.clear()
+        self._on_close(self)
+
+    @staticmethod
+    def _data_limits(years, balances, other=None):
+        if len(years) == 0:
+            return None
+        ys = np.asarray(balances, dtype=float)
+        if other is not None:
+            ys = np.concatenate([ys, np.asarray(other, dtype=float)])
+        ys = ys[np.isfinite(ys)]
+        if ys.size == 0:
+            return None
+        x0, x1 = float(np.min(years)), float(np.max(years))
+        y0, y1 = float(ys.min()), float(ys.max())
+        xpad = (x1 - x0) * AXIS_MARGIN or 0.5
+        ypad = (y1 - y0) * AXIS_MARGIN or max(abs(y1) * AXIS_MARGIN, 1.0)
+        return x0 - xpad, x1 + xpad, y0 - ypad, y1 + ypad
+
+
+class GrowthChart(ChartWindow):
+    """A chart window with a balance line and a principal-only line."""
+
+    def __init__(self, root, title, on_export, on_close):
+        super().__init__(root, title, on_export, on_close)
+        # Animated lines are left out of full redraws and drawn by _draw_lines.
+        self.balance_line, = self.ax.plot([], [], marker='o', linewidth=2, animated=True,
+                                          label='Total Balance (with interest/contributions)', color='#27ae60')
+        self.principal_line, = self.ax.plot([], [], marker='s', linewidth=2, animated=True,
+                                            label='Principal Only (no interest)', color='#e74c3c', linestyle='--')
+        self.ax.legend(loc='upper left')
+
+        self._background = None
+        # Every full redraw (resize, toolbar zoom/pan, rescale) refreshes the blit background.
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def update(self, years, balances, principal_only=None):
+        """Replaces the plotted series, blitting when the axes can stay as they are."""
+        self.balance_line.set_data(years, balances)
+        self.principal_line.set_visible(principal_only is not None)
+        if principal_only is not None:
+            self.principal_line.set_data(years, principal_only)
+
+        limits = self._data_limits(years, balances, principal_only)
+        if limits is not None and self._needs_rescale(limits):
+            self.ax.set_xlim(limits[0], limits[1])
+            self.ax.set_ylim(limits[2], limits[3])
+            self.canvas.draw_idle()
+        elif self._background is None:
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def save(self, path, fmt):
+        """Saves the figure; animated lines are made static for the export."""
+        lines = (self.balance_line, self.principal_line)
+        for line in lines:
+            line.set_animated(False)
+        try:
+            super().save(path, fmt)
+        finally:
+            for line in lines:
+                line.set_animated(True)
+            self.canvas.draw_idle()
+
+    def close(self):
+        self._background = None
+        super().close()
+
+    # --- Drawing ---
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        self.ax.draw_artist(self.balance_line)
+        if self.principal_line.get_visible():
+            self.ax.draw_artist(self.principal_line)
+
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.figure.bbox)
+
+    def _needs_rescale(self, limits) -> bool:
+        """Rescale when the data leaves the view or fills too little of it."""
+        vx0, vx1 = self.ax.get_xlim()
+        vy0, vy1 = self.ax.get_ylim()
+        x0, x1, y0, y1 = limits
+        if x0 < vx0 or x1 > vx1 or y0 < vy0 or y1 > vy1:
+            return True
+        return (x1 - x0) < MIN_VIEW_FILL * (vx1 - vx0) or (y1 - y0) < MIN_VIEW_FILL * (vy1 - vy0)
+
+
+class FanChart(ChartWindow):
+    """A chart window with percentile bands and sample paths (fan_chart.FanData)."""
+
+    def __init__(self, root, title, on_export, on_close):
+        super().__init__(root, title, on_export, on_close)
+        self.samples = LineCollection([], colors=FAN_COLOR, linewidths=0.6, alpha=0.25, label='Sample paths')
+        self.ax.add_collection(self.samples)
+        self.median_line, = self.ax.plot([], [], linewidth=2, color=FAN_COLOR, label='Median')
+        self._bands = []
+
+    def update(self, fan):
+        """Replaces the bands, median and sample paths, then rescales to them."""
+        for band in self._bands:
+            band.remove()
+        self._bands = []
+        # Percentiles pair up from the outside in: (5, 95), (25, 75), ...
+        percentiles = fan.percentiles
+        for i in range(len(percentiles) // 2):
+            low, high = percentiles[i], percentiles[-1 - i]
+            alpha = FAN_BAND_ALPHAS[min(i, len(FAN_BAND_ALPHAS) - 1)]
+            self._bands.append(self.ax.fill_between(
+                fan.years, fan.band(low), fan.band(high), color=FAN_COLOR, alpha=alpha, linewidth=0,
+                label=f'{low:g}th-{high:g}th percentile'))
+        if len(percentiles) % 2:
+            self.median_line.set_data(fan.years, fan.band(percentiles[len(percentiles) // 2]))
+        self.median_line.set_visible(len(percentiles) % 2 == 1)
+
+        segments = np.empty(fan.samples.shape + (2,))
+        segments[..., 0] = fan.years
+        segments[..., 1] = fan.samples
+        self.samples.set_segments(segments)
+        self.ax.set_title(f'{self.title} ({fan.n_paths:,} paths)', fontsize=12, fontweight='bold')
+        self.ax.legend(loc='upper left')
+
+        # Scaled to the bands; the outermost sample paths may leave the view
+        limits = self._data_limits(fan.years, fan.bands.ravel())
+        if limits is not None:
+            self.ax.set_xlim(limits[0], limits[1])
+            self.ax.set_ylim(limits[2], limits[3])
+        self.canvas.draw_idle()
+
+# End of gui_charts.py
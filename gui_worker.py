@@ -0,0 +1,123 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Runs model calls off the Tk event loop.
+
+Jobs execute on a small thread pool; the Tk thread polls for finished jobs
+with `after()` and delivers results to callbacks on the Tk thread, since Tk
+widgets must only be touched from there. Jobs are keyed (e.g. per tab) and a
+new job replaces any pending one with the same key. A running call cannot be
+interrupted, so cancelling a job marks it so that its result is discarded and
+the UI is released immediately.
+"""
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+POLL_INTERVAL_MS = 30
+MAX_WORKERS = 2     # lets a new job start while a cancelled one is still finishing
+
+
+class Job:
+    def __init__(self, job_id: int, key: str, future, on_success: Callable, on_error: Optional[Callable]):
+        self.id = job_id
+        self.key = key
+        self.future = future
+        self.on_success = on_success
+        self.on_error = on_error
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        self.future.cancel()    # only succeeds if the job has not started yet
+
+
+class BackgroundWorker:
+    """
+    Executes functions in worker threads and hands results back to Tk.
+
+    Parameters:
+        root: Tk root used for after() polling.
+        on_busy_changed (callable, optional): Called with True/False when the
+            worker starts or stops having outstanding jobs (to show progress).
+    """
+
+    def __init__(self, root, on_busy_changed: Optional[Callable[[bool], None]] = None):
+        self.root = root
+        self.on_busy_changed = on_busy_changed
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="model-worker")
+        self._jobs: Dict[str, Job] = {}
+        self._ids = itertools.count(1)
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._jobs)
+
+    def submit(self, key: str, function: Callable, *args, on_success: Callable,
+               on_error: Optional[Callable] = None) -> Job:
+        """Runs function(*args) in the background, replacing any job with the same key."""
+        previous = self._jobs.get(key)
+        if previous is not None:
+            previous.cancel()
+        was_busy = self.busy
+        job = Job(next(self._ids), key, self._executor.submit(function, *args), on_success, on_error)
+        self._jobs[key] = job
+        if not was_busy:
+            self._notify(True)
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+        return job
+
+    def cancel(self, key: Optional[str] = None):
+        """Cancels the job for `key`, or every outstanding job."""
+        keys = list(self._jobs) if key is None else [key]
+        for k in keys:
+            job = self._jobs.pop(k, None)
+            if job is not None:
+                job.cancel()
+        if not self.busy:
+            self._notify(False)
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        try:
+            for key, job in list(self._jobs.items()):
+                if not job.future.done() or self._jobs.get(key) is not job:
+                    continue
+                del self._jobs[key]
+                if not job.cancelled:
+                    self._deliver(job)
+        finally:
+            # A failing callback must not stop the polling of the other jobs
+            if self._jobs:
+                self.root.after(POLL_INTERVAL_MS, self._poll)
+            else:
+                self._polling = False
+                self._notify(False)
+
+    def _deliver(self, job: Job):
+        error = job.future.exception()
+        try:
+            if error is None:
+                job.on_success(job.future.result())
+            elif job.on_error is not None:
+                job.on_error(error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+        except Exception as e:
+            self.root.report_callback_exception(type(e), e, e.__traceback__)
+
+    def _notify(self, busy: bool):
+        if self.on_busy_changed is not None:
+            self.on_busy_changed(busy)
+
+# End of gui_worker.py
@@ -0,0 +1,154 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Lightweight, off-by-default instrumentation for the models in financial_models.
+
+When enabled, every model call records its wall time, and the models add
+algorithm-specific counters (loop iterations, fallbacks, 500-year cap hits,
+solver steps). When disabled the only cost is one module flag check per call:
+each model tests `instrumentation.ENABLED` itself rather than going through a
+generic wrapper, whose *args/**kwargs packing would cost more than the
+closed-form models do. Metrics can be read as a dict or as Prometheus text
+exposition.
+
+    import instrumentation
+    instrumentation.enable()
+    ...
+    print(instrumentation.to_prometheus())
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict
+
+ENABLED = False
+SAMPLE_WINDOW = 2048            # most recent call durations kept per model for percentiles
+PERCENTILES = (0.5, 0.9, 0.99)
+
+_lock = threading.Lock()
+
+
+class _ModelStats:
+    __slots__ = ("calls", "total_seconds", "max_seconds", "samples", "counters")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+        self.counters: Dict[str, int] = {}
+
+
+_stats: Dict[str, _ModelStats] = {}
+
+# --- Switches ---
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    """Drops all recorded metrics."""
+    with _lock:
+        _stats.clear()
+
+
+# --- Recording ---
+
+def _model(name: str) -> _ModelStats:
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = _ModelStats()
+    return stats
+
+
+def count(model: str, counter: str, amount: int = 1):
+    """Adds `amount` to an algorithm-specific counter. Callers check ENABLED first."""
+    with _lock:
+        counters = _model(model).counters
+        counters[counter] = counters.get(counter, 0) + amount
+
+
+def _record_call(model: str, seconds: float):
+    with _lock:
+        stats = _model(model)
+        stats.calls += 1
+        stats.total_seconds += seconds
+        if seconds > stats.max_seconds:
+            stats.max_seconds = seconds
+        stats.samples.append(seconds)
+
+
+def timed_call(model: str, function: Callable, *args, **kwargs):
+    """Calls function(*args, **kwargs) and records its wall time under `model`."""
+    start = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _record_call(model, time.perf_counter() - start)
+
+
+# --- Export ---
+
+def _percentile(ordered, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def snapshot() -> dict:
+    """All metrics as {model: {calls, total_seconds, mean_seconds, max_seconds, p50.., counters}}."""
+    with _lock:
+        result = {}
+        for name, stats in _stats.items():
+            ordered = sorted(stats.samples)
+            entry = {
+                "calls": stats.calls,
+                "total_seconds": stats.total_seconds,
+                "mean_seconds": stats.total_seconds / stats.calls if stats.calls else 0.0,
+                "max_seconds": stats.max_seconds,
+                "counters": dict(stats.counters),
+            }
+            for q in PERCENTILES:
+                entry[f"p{q * 100:g}_seconds"] = _percentile(ordered, q)
+            result[name] = entry
+        return result
+
+
+def to_prometheus(prefix: str = "retirement_model") -> str:
+    """Metrics in the Prometheus text exposition format."""
+    data = snapshot()
+    lines = [
+        f"# HELP {prefix}_calls_total Model calls recorded while instrumentation was enabled.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines += [f'{prefix}_calls_total{{model="{m}"}} {s["calls"]}' for m, s in data.items()]
+    lines += [
+        f"# HELP {prefix}_call_seconds Wall time per call over the last {SAMPLE_WINDOW} calls.",
+        f"# TYPE {prefix}_call_seconds summary",
+    ]
+    for m, s in data.items():
+        for q in PERCENTILES:
+            lines.append(f'{prefix}_call_seconds{{model="{m}",quantile="{q:g}"}} {s[f"p{q * 100:g}_seconds"]:.9g}')
+        lines.append(f'{prefix}_call_seconds_sum{{model="{m}"}} {s["total_seconds"]:.9g}')
+        lines.append(f'{prefix}_call_seconds_count{{model="{m}"}} {s["calls"]}')
+    lines += [
+        f"# HELP {prefix}_events_total Algorithm-specific counters (loop iterations, cap hits, solver steps).",
+        f"# TYPE {prefix}_events_total counter",
+    ]
+    for m, s in data.items():
+        for event, value in sorted(s["counters"].items()):
+            lines.append(f'{prefix}_events_total{{model="{m}",event="{event}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+# End of instrumentation.py
@@ -0,0 +1,216 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+End-to-end retirement plans: accumulation, the transition to retirement and
+decumulation, in one pass over batches of scenarios.
+
+The pipeline is a chain of generator stages, each taking and yielding
+LifecycleBatch objects:
+
+    accumulate    balance at retirement: fixedInvestor_batch for a constant
+                  rate, variableInvestor_batch when rate paths are given
+    transition    adds the lump sum at retirement and converts the expense
+                  from today's money into money at retirement (inflation)
+    decumulate    years the balance lasts at that expense (finallyRetired_batch)
+                  and the sustainable withdrawal for target_years
+                  (maximumExpensed_batch)
+    summarize     folds each batch into a LifecycleSummary
+
+Stages pull one batch at a time, so a batch goes through every stage before
+the next one is built. Only one batch's intermediate arrays exist at any
+moment, however many scenarios stream through.
+
+    result = plan_lifecycle(principal=10000, years=30, rate=0.06, annual_contribution=5000,
+                            expense=40000, retirement_rate=0.04, target_years=30)
+    result.retirement_balance, result.years_lasted, result.sustainable_withdrawal
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from batch_models import (finallyRetired_batch, fixedInvestor_batch, maximumExpensed_batch,
+                          variableInvestor_batch)
+from quantiles import QuantileSketch
+
+DEFAULT_BATCH_SIZE = 65536      # scenarios per batch pushed through the stages
+
+
+@dataclass
+class LifecycleBatch:
+    """A slice of scenarios, plus the outputs filled in by the stages."""
+    start: int                                  # index of the first scenario in the batch
+    principal: np.ndarray
+    annual_contribution: np.ndarray
+    years: np.ndarray                           # working years (int64)
+    rate: Optional[np.ndarray]                  # constant accumulation rate, or
+    rate_paths: Optional[np.ndarray]            # (scenarios, years) accumulation rates
+    expense: np.ndarray                         # annual expense in today's money
+    retirement_rate: np.ndarray
+    target_years: np.ndarray                    # (int64)
+    lump_sum: np.ndarray                        # added at retirement (negative for a payout)
+    inflation: np.ndarray
+    retirement_balance: Optional[np.ndarray] = None
+    retirement_expense: Optional[np.ndarray] = None
+    years_lasted: Optional[np.ndarray] = None
+    sustainable_withdrawal: Optional[np.ndarray] = None
+
+    @property
+    def size(self) -> int:
+        return self.principal.size
+
+
+@dataclass
+class LifecycleSummary:
+    """Running totals over every scenario that reached the summarize stage."""
+    scenarios: int = 0
+    funded: int = 0                             # scenarios whose funds last target_years
+    balances: QuantileSketch = field(default_factory=QuantileSketch, repr=False)
+    withdrawals: QuantileSketch = field(default_factory=QuantileSketch, repr=False)
+
+    @property
+    def funded_rate(self) -> float:
+        return self.funded / self.scenarios if self.scenarios else float("nan")
+
+
+@dataclass
+class LifecycleResult:
+    """Per-scenario outputs of plan_lifecycle, plus the summary."""
+    retirement_balance: np.ndarray
+    retirement_expense: np.ndarray              # the expense in money at retirement
+    years_lasted: np.ndarray
+    sustainable_withdrawal: np.ndarray
+    summary: LifecycleSummary
+
+
+# --- Scenario Batches ---
+
+def scenario_batches(principal, years, rate=None, annual_contribution=0.0, expense=0.0,
+                     retirement_rate=0.0, target_years=30, lump_sum=0.0, inflation=0.0,
+                     rate_paths=None, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[LifecycleBatch]:
+    """
+    Splits broadcast scenario inputs into LifecycleBatch slices.
+
+    Scalars broadcast against arrays; every array holds one value per scenario.
+    With `rate_paths` ((scenarios, n) or one shared path (n,)), each scenario
+    accumulates over the first `years` rates of its path instead of at `rate`.
+    """
+    if (rate is None) == (rate_paths is None):
+        raise ValueError("give exactly one of rate and rate_paths")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    columns = [np.asarray(v, dtype=float).ravel() for v in
+               (principal, annual_contribution, years, expense, retirement_rate, target_years, lump_sum,
+                inflation, 0.0 if rate is None else rate)]
+    paths = None if rate_paths is None else np.atleast_2d(np.asarray(rate_paths, dtype=float))
+    n = np.broadcast_shapes(*(c.shape for c in columns), () if paths is None else paths.shape[:1])
+    n = n[0] if n else 1
+    columns = [np.broadcast_to(c, (n,)) for c in columns]
+    if paths is not None:
+        paths = np.broadcast_to(paths, (n, paths.shape[1]))
+        if columns[2].max(initial=0) > paths.shape[1]:
+            raise ValueError(f"years exceeds the length of the rate paths ({paths.shape[1]})")
+
+    for start in range(0, n, batch_size):
+        part = slice(start, min(n, start + batch_size))
+        principal_, contribution, years_, expense_, retirement_rate_, target, lump, inflation_, rate_ = \
+            (c[part] for c in columns)
+        yield LifecycleBatch(
+            start=start, principal=principal_, annual_contribution=contribution, years=years_.astype(np.int64),
+            rate=None if rate is None else rate_, rate_paths=None if paths is None else paths[part],
+            expense=expense_, retirement_rate=retirement_rate_, target_years=target.astype(np.int64),
+            lump_sum=lump, inflation=inflation_,
+        )
+
+
+# --- Stages ---
+
+def accumulate(batches: Iterable[LifecycleBatch]) -> Iterator[LifecycleBatch]:
+    """Balance at retirement for every scenario of each batch."""
+    for batch in batches:
+        if batch.rate_paths is None:
+            batch.retirement_balance = fixedInvestor_batch(batch.principal, batch.rate, batch.years,
+                                                           batch.annual_contribution)
+        else:
+            batch.retirement_balance = variableInvestor_batch(batch.principal, batch.rate_paths,
+                                                              batch.annual_contribution, batch.years)
+        yield batch
+
+
+def transition(batches: Iterable[LifecycleBatch]) -> Iterator[LifecycleBatch]:
+    """Lump sum at retirement; the expense inflated over the working years."""
+    for batch in batches:
+        batch.retirement_balance = np.maximum(batch.retirement_balance + batch.lump_sum, 0.0)
+        with np.errstate(over="ignore"):
+            batch.retirement_expense = batch.expense * np.power(1 + batch.inflation, batch.years)
+        yield batch
+
+
+def decumulate(batches: Iterable[LifecycleBatch]) -> Iterator[LifecycleBatch]:
+    """Years lasted at the retirement expense and the sustainable withdrawal."""
+    for batch in batches:
+        batch.years_lasted = finallyRetired_batch(batch.retirement_balance, batch.retirement_expense,
+                                                  batch.retirement_rate)
+        batch.sustainable_withdrawal = maximumExpensed_batch(batch.retirement_balance, batch.retirement_rate,
+                                                             batch.target_years)
+        yield batch
+
+
+def summarize(batches: Iterable[LifecycleBatch], summary: LifecycleSummary) -> Iterator[LifecycleBatch]:
+    """Folds each batch into `summary` as it passes through."""
+    for batch in batches:
+        summary.scenarios += batch.size
+        summary.funded += int(np.count_nonzero(batch.years_lasted >= batch.target_years))
+        summary.balances.add(batch.retirement_balance)
+        summary.withdrawals.add(batch.sustainable_withdrawal)
+        yield batch
+
+
+def run_lifecycle(batches: Iterable[LifecycleBatch],
+                  summary: Optional[LifecycleSummary] = None) -> Iterator[LifecycleBatch]:
+    """Chains every stage over `batches`; yields each finished batch."""
+    return summarize(decumulate(transition(accumulate(batches))),
+                     LifecycleSummary() if summary is None else summary)
+
+
+# --- One-Call Plan ---
+
+def plan_lifecycle(principal, years, rate=None, annual_contribution=0.0, expense=0.0, retirement_rate=0.0,
+                   target_years=30, lump_sum=0.0, inflation=0.0, rate_paths=None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> LifecycleResult:
+    """
+    Runs the whole plan for every scenario.
+
+    Parameters:
+        principal (array_like): Starting principal.
+        years (array_like): Working years until retirement.
+        rate (array_like, optional): Constant accumulation rate.
+        annual_contribution (array_like): Amount added at the end of each working year.
+        expense (array_like): Annual retirement expense in today's money.
+        retirement_rate (array_like): Growth rate after retirement.
+        target_years (array_like): Years the funds should last.
+        lump_sum (array_like): Added to the balance at retirement (negative for a payout).
+        inflation (array_like): Annual inflation applied to the expense until retirement.
+        rate_paths (array_like, optional): Accumulation rate paths instead of `rate`.
+        batch_size (int): Scenarios per batch pushed through the stages.
+
+    Returns:
+        LifecycleResult: Balance and expense at retirement, years lasted and
+        sustainable withdrawal per scenario, and the summary.
+    """
+    summary = LifecycleSummary()
+    batches = scenario_batches(principal, years, rate, annual_contribution, expense, retirement_rate,
+                               target_years, lump_sum, inflation, rate_paths, batch_size)
+    outputs = [], [], [], []
+    for batch in run_lifecycle(batches, summary):
+        for out, values in zip(outputs, (batch.retirement_balance, batch.retirement_expense,
+                                         batch.years_lasted, batch.sustainable_withdrawal)):
+            out.append(values)
+    balance, expense_at_retirement, years_lasted, withdrawal = (np.concatenate(out) for out in outputs)
+    return LifecycleResult(balance, expense_at_retirement, years_lasted, withdrawal, summary)
+
+# End of lifecycle.py
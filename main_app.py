@@ -3,17 +3,23 @@
 # Date          :   November , 2025
 # Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
 
-import time
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import startup_profile  # first, so the startup clock covers every other import
+
+import argparse
 import cli_handlers 
 
-def main_menu():
+startup_profile.mark("imports")
+
+def main_menu(profile=False):
     """
-    Displays the welcome message, executes the 5-second delay, 
-    and then starts the interactive menu loop.
+    Displays the welcome message and then starts the interactive menu loop.
+
+    Parameters:
+        profile (bool): Print startup times once the menu is first shown.
     """
     
     # --- 1. Welcome Message ---
@@ -21,11 +27,7 @@ def main_menu():
     print("👋 Welcome to the CIT3003 Retirement Optimization System")
     print("=====================================================")
     
-    # --- 2. Delay for 5 seconds ---
-    print("\nSystem loading... please give us a moment...")
-    time.sleep(2)
-    
-    # --- 3. Main Menu Loop ---
+    # --- 2. Main Menu Loop ---
     while True:
         print("\n\n======================= MENU ========================")
         print("Please select the financial model you wish to execute:")
@@ -33,10 +35,16 @@ def main_menu():
         print("2. Variable Growth Simulation (variableInvestor)")
         print("3. Retirement Longevity (finallyRetired)")
         print("4. Optimal Withdrawal Calculation (maximumExpensed)")
+        print("6. Full Retirement Plan (accumulation + retirement)")
         print("5. Exit Application")
         print("=====================================================")
+
+        if profile:
+            startup_profile.mark("menu shown")
+            startup_profile.report()
+            profile = False
         
-        choice = input("Enter your choice (1-5): ").strip()
+        choice = input("Enter your choice (1-6): ").strip()
         
         if choice == '1':
             cli_handlers.handle_fixed_investor()
@@ -49,9 +57,79 @@ def main_menu():
         elif choice == '5':
             print("\nThank you for using the Retirement Optimizer. Goodbye! 👋\n")
             break
+        elif choice == '6':
+            cli_handlers.handle_lifecycle_plan()
         else:
-            print("\n[ERROR] Invalid selection. Please enter a number between 1 and 5.")
+            print("\n[ERROR] Invalid selection. Please enter a number between 1 and 6.")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line interface; with no subcommand the interactive menu runs."""
+    parser = argparse.ArgumentParser(description="CIT3003 Retirement Optimization System")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print import and time-to-menu (or time-to-command) to stderr")
+    subcommands = parser.add_subparsers(dest="command")
+
+    sweep = subcommands.add_parser("sweep", help="Evaluate a model over a parameter grid in parallel")
+    sweep.add_argument("--model", help="fixedInvestor, finallyRetired or maximumExpensed")
+    sweep.add_argument("--grid", help="JSON grid spec file")
+    sweep.add_argument("--param", action="append", metavar="NAME=VALUES",
+                       help="Grid axis as a,b,c or start:stop:step (repeatable)")
+    sweep.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    sweep.add_argument("--chunk-size", type=int, default=4096, help="Scenarios per worker task")
+    sweep.add_argument("--out", default="-", help="Output CSV file (default: stdout)")
+    sweep.add_argument("--store", help="SQLite results store: skip scenarios already in it, record new ones")
+    sweep.set_defaults(handler=cli_handlers.handle_sweep)
+
+    batch = subcommands.add_parser("batch", help="Stream a CSV of scenarios through a model")
+    batch.add_argument("--model", required=True, help="fixedInvestor, finallyRetired or maximumExpensed")
+    batch.add_argument("--in", dest="input", required=True, help="Input CSV with a header row ('-' for stdin)")
+    batch.add_argument("--out", default="-", help="Output file (default: stdout)")
+    batch.add_argument("--format", choices=("jsonl", "csv"), help="Output format (default: from --out extension, else jsonl)")
+    batch.add_argument("--store", help="SQLite results store: reuse stored rows, record new ones")
+    batch.set_defaults(handler=cli_handlers.handle_batch)
+
+    returns = subcommands.add_parser("import-returns", help="Convert a CSV of historical returns to a binary dataset")
+    returns.add_argument("--in", dest="input", required=True, help="CSV with a header row, one row per period")
+    returns.add_argument("--out", required=True, help="Dataset file to write (e.g. returns.rdat)")
+    returns.add_argument("--index-column", help="Date/label column (not imported as returns)")
+    returns.add_argument("--columns", help="Comma-separated return columns (default: all others)")
+    returns.add_argument("--periods-per-year", type=int, default=1, help="12 for monthly data (default: 1)")
+    returns.add_argument("--percent", action="store_true", help="Values are percentages (5 means 0.05)")
+    returns.set_defaults(handler=cli_handlers.handle_import_returns)
+
+    backtest = subcommands.add_parser("backtest", help="Run every rolling window of a historical return dataset")
+    backtest.add_argument("--dataset", required=True, help="Dataset file from import-returns")
+    backtest.add_argument("--column", help="Return series to use (default: the first)")
+    backtest.add_argument("--window", type=int, required=True, help="Periods per cohort")
+    backtest.add_argument("--balance", type=float, required=True, help="Starting principal / retirement balance")
+    backtest.add_argument("--contribution", type=float, default=0.0, help="Amount added each period (accumulation)")
+    backtest.add_argument("--target", type=float, help="Balance that counts as success (accumulation)")
+    backtest.add_argument("--expense", type=float, help="Withdrawal each period; switches to a retirement backtest")
+    backtest.add_argument("--out", help="Per-cohort CSV output ('-' for stdout)")
+    backtest.set_defaults(handler=cli_handlers.handle_backtest)
+
+    serve = subcommands.add_parser("serve", help="Serve the models over HTTP/JSON on localhost")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    serve.add_argument("--window-ms", type=float, default=2.0, help="Micro-batching window in milliseconds")
+    serve.add_argument("--max-batch", type=int, default=1024, help="Largest batch per kernel call")
+    serve.add_argument("--workers", type=int, default=None,
+                       help="Processes for maximumExpensed/variableInvestor (default: all cores)")
+    serve.set_defaults(handler=cli_handlers.handle_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        main_menu(profile=args.startup_profile)
+    else:
+        if args.startup_profile:
+            startup_profile.mark("arguments parsed")
+            startup_profile.report()
+        args.handler(args)
 
 # --- Application Entry Point ---
 if __name__ == "__main__":
-    main_menu()
\ No newline at end of file
+    main()
\ No newline at end of file
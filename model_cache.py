@@ -0,0 +1,169 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Opt-in memoization for the most expensive models, finallyRetired and
+maximumExpensed.
+
+Arguments are quantized before lookup: numbers are converted to the model's
+parameter type and floats rounded to `ndigits` decimal places, so 500000,
+500000.0 and 500000.0000001 share an entry. The model is evaluated on
+the quantized arguments, so a cached answer never depends on which caller
+filled the entry first. Entries live in a bounded in-memory LRU and,
+optionally, in a SQLite file that survives restarts. Disk keys include
+financial_models.MODEL_VERSION, so results persisted before a model change
+are not reused.
+
+    cache = ModelCache(maxsize=10000, path="model_cache.sqlite")
+    years = cache.finallyRetired(500000, 30000, 0.05)
+    print(cache.stats())
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from financial_models import MODEL_VERSION, finallyRetired, maximumExpensed
+from model_registry import MODELS
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_NDIGITS = 6
+DISK_COMMIT_EVERY = 256     # pending disk writes before an automatic commit
+
+
+class ModelCache:
+    """
+    Bounded LRU cache (with optional disk store) around model functions.
+
+    Parameters:
+        maxsize (int): Maximum in-memory entries; the least recently used is evicted.
+        ndigits (int): Decimal places floats are rounded to when forming keys.
+        path (str, optional): SQLite file for a persistent second-level store.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ndigits: int = DEFAULT_NDIGITS, path: Optional[str] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ndigits = ndigits
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._pending_writes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS model_cache (key TEXT PRIMARY KEY, value)")
+            self._db.commit()
+
+    # --- Cached Models ---
+
+    def finallyRetired(self, balance: float, expense: float, rate: float) -> int:
+        return self.call("finallyRetired", finallyRetired, balance, expense, rate)
+
+    def maximumExpensed(self, balance: float, rate: float, target_years: int = 30) -> float:
+        return self.call("maximumExpensed", maximumExpensed, balance, rate, target_years)
+
+    def call(self, name: str, function: Callable, *args):
+        """Returns function(*quantized args), from the cache when possible."""
+        spec = MODELS.get(name)
+        types = [p.type for p in spec.params] if spec is not None else [float] * len(args)
+        args = tuple(self._quantize(a, t) for a, t in zip(args, types))
+        key = (name,) + args
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            value = self._disk_get(key)
+            if value is None:
+                value = function(*args)
+                self._disk_put(key, value)
+            else:
+                self.disk_hits += 1
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return value
+
+    def _quantize(self, value, kind=float):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return value
+        if kind is int and float(value).is_integer():
+            return int(value)
+        # + 0.0 folds -0.0 into 0.0 so both hit the same entry.
+        return round(float(value), self.ndigits) + 0.0
+
+    # --- Disk Store ---
+
+    @staticmethod
+    def _disk_key(key) -> str:
+        return repr((MODEL_VERSION,) + key)
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value FROM model_cache WHERE key = ?", (self._disk_key(key),)).fetchone()
+        return None if row is None else row[0]
+
+    def _disk_put(self, key, value):
+        if self._db is None:
+            return
+        self._db.execute("INSERT OR REPLACE INTO model_cache (key, value) VALUES (?, ?)",
+                         (self._disk_key(key), value))
+        self._pending_writes += 1
+        if self._pending_writes >= DISK_COMMIT_EVERY:
+            self._db.commit()
+            self._pending_writes = 0
+
+    # --- Management ---
+
+    def stats(self) -> dict:
+        """Counters for sizing the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Empties the in-memory LRU and resets the counters (the disk store is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def flush(self):
+        """Commits pending disk writes."""
+        with self._lock:
+            if self._db is not None and self._pending_writes:
+                self._db.commit()
+                self._pending_writes = 0
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# End of model_cache.py
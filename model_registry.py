@@ -0,0 +1,61 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Name -> signature table for the scalar models, shared by the non-interactive
+front ends (parameter sweeps, batch files) so they agree on parameter names,
+types, defaults and order.
+"""
+
+from typing import Callable, NamedTuple, Tuple
+
+from financial_models import fixedInvestor, finallyRetired, maximumExpensed
+
+
+class Param(NamedTuple):
+    name: str
+    type: type
+    default: object = None      # None means the parameter is required
+
+
+class ModelSpec(NamedTuple):
+    function: Callable
+    params: Tuple[Param, ...]
+    result_type: type
+
+    @property
+    def param_names(self) -> Tuple[str, ...]:
+        return tuple(p.name for p in self.params)
+
+
+# variableInvestor takes a rate list rather than scalars, so it is not listed here.
+MODELS = {
+    "fixedInvestor": ModelSpec(
+        fixedInvestor,
+        (Param("principal", float), Param("rate", float), Param("years", int),
+         Param("annual_contribution", float, 0.0)),
+        float,
+    ),
+    "finallyRetired": ModelSpec(
+        finallyRetired,
+        (Param("balance", float), Param("expense", float), Param("rate", float)),
+        int,
+    ),
+    "maximumExpensed": ModelSpec(
+        maximumExpensed,
+        (Param("balance", float), Param("rate", float), Param("target_years", int, 30)),
+        float,
+    ),
+}
+
+
+def get_model(name: str) -> ModelSpec:
+    """Looks up a model by name, raising ValueError with the valid choices."""
+    try:
+        return MODELS[name]
+    except KeyError:
+        raise ValueError(f"Unknown model '{name}'. Choose from: {', '.join(MODELS)}") from None
+
+# End of model_registry.py
@@ -0,0 +1,496 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Local HTTP/JSON service for the four models (stdlib asyncio, no web framework).
+
+    POST /fixedInvestor     {"principal": 10000, "rate": 0.05, "years": 30, "annual_contribution": 1200}
+    POST /variableInvestor  {"principal": 10000, "rates": [0.05, 0.04, 0.06], "annual_contribution": 0}
+    POST /finallyRetired    {"balance": 500000, "expense": 30000, "rate": 0.05}
+    POST /maximumExpensed   {"balance": 500000, "rate": 0.05, "target_years": 30}
+    GET  /health            service and batching statistics
+
+    POST   /paths           {"principal": 10000, "rates": [...], "annual_contribution": 0}  -> {"id": 1, ...}
+    POST   /paths/<id>      {"set": [{"year": 3, "rate": -0.2}], "year": 10}
+    DELETE /paths/<id>
+
+Responses are {"result": value} or {"error": message} with status 400/404/413.
+JSON has no NaN or infinity, so non-finite results are sent as null.
+
+/paths keeps variable-rate paths on the server for what-if editing (see
+affine_path). Each edit sets the rate and/or contribution of a few years and
+returns the balance after `year` years (the final balance by default), in
+O(log n) per edited year rather than a full variableInvestor run. The oldest
+paths are dropped beyond MAX_PATH_SESSIONS.
+
+Requests for the same model that arrive within a short window (default 2 ms)
+are micro-batched into one call of the vectorized batch_models kernels.
+fixedInvestor and finallyRetired batches are cheap closed forms and run on
+the event loop; year counts are capped at MAX_REQUEST_YEARS so that their
+rare year-by-year fallbacks stay short. maximumExpensed (a solver) and
+variableInvestor (a loop over every rate) run in a process pool, so the event
+loop keeps accepting connections while they compute. Without NumPy each batch
+falls back to the scalar models. A batch that fails is retried one request
+at a time, so one bad request does not fail the others. Batch results agree
+with the scalar models to within financial_models.CLOSED_FORM_RTOL (see
+batch_models).
+
+    python model_service.py --port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from affine_path import AffinePath
+from financial_models import fixedInvestor, variableInvestor, finallyRetired, maximumExpensed
+from model_registry import MODELS, Param
+
+try:
+    import numpy as np
+    import batch_models
+except ImportError:
+    batch_models = None
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 1024
+MAX_BODY_BYTES = 1 << 20
+PAD_CELLS = 1 << 22         # rate-matrix cells per variableInvestor kernel call (32 MB)
+MAX_PATH_SESSIONS = 1024    # what-if paths held at once; the least recently used is dropped
+MAX_REQUEST_YEARS = 10000   # largest year count accepted; bounds the loop fallbacks run on the event loop
+
+PARAMS = {name: spec.params for name, spec in MODELS.items()}
+PARAMS["variableInvestor"] = (Param("principal", float), Param("rates", list),
+                              Param("annual_contribution", float, 0.0))
+OFFLOADED = frozenset(("variableInvestor", "maximumExpensed"))
+
+SCALAR_MODELS = {
+    "fixedInvestor": fixedInvestor,
+    "variableInvestor": variableInvestor,
+    "finallyRetired": finallyRetired,
+    "maximumExpensed": maximumExpensed,
+}
+
+_STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Request Parsing ---
+
+def parse_arguments(model: str, body: dict) -> tuple:
+    """Converts a JSON object to the model's positional arguments (ValueError if invalid)."""
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    params = PARAMS[model]
+    unknown = set(body) - {p.name for p in params}
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    args = tuple(_parse_value(param, body.get(param.name)) for param in params)
+    for param, value in zip(params, args):
+        if param.type is int and abs(value) > MAX_REQUEST_YEARS:
+            raise ValueError(f"'{param.name}' must be at most {MAX_REQUEST_YEARS}")
+    return args
+
+
+def _parse_value(param: Param, value):
+    if value is None:
+        if param.default is None:
+            raise ValueError(f"missing value for '{param.name}'")
+        return param.default
+    if param.type is list:
+        if not isinstance(value, list) or not all(_is_number(v) for v in value):
+            raise ValueError(f"'{param.name}' must be a list of numbers")
+        return [float(v) for v in value]
+    if not _is_number(value):
+        raise ValueError(f"invalid {param.type.__name__} for '{param.name}': {value!r}")
+    if param.type is int:
+        if not float(value).is_integer():
+            raise ValueError(f"invalid int for '{param.name}': {value!r}")
+        return int(value)
+    return float(value)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parse_path_edit(body: dict) -> tuple:
+    """
+    Converts a /paths/<id> body to (principal, [(year, rate, contribution)], year)
+    (ValueError if invalid). Omitted values are None.
+    """
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    unknown = set(body) - {"principal", "set", "year"}
+    if unknown:
+        raise ValueError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    principal = body.get("principal")
+    if principal is not None:
+        principal = _parse_value(Param("principal", float), principal)
+    year = body.get("year")
+    if year is not None:
+        year = _parse_value(Param("year", int), year)
+    edits = body.get("set", [])
+    if not isinstance(edits, list):
+        raise ValueError("'set' must be a list of {\"year\", \"rate\", \"contribution\"} objects")
+    parsed = []
+    for edit in edits:
+        if not isinstance(edit, dict) or "year" not in edit or set(edit) - {"year", "rate", "contribution"}:
+            raise ValueError("'set' must be a list of {\"year\", \"rate\", \"contribution\"} objects")
+        parsed.append(tuple(_parse_value(Param(name, int if name == "year" else float), edit[name])
+                            if name in edit else None for name in ("year", "rate", "contribution")))
+    return principal, parsed, year
+
+
+# --- Batch Evaluation ---
+
+def evaluate_batch(model: str, columns: Sequence[Sequence]) -> list:
+    """
+    Evaluates one model over column-wise arguments (one column per parameter).
+
+    Module-level so that it can run in a worker process.
+    """
+    if batch_models is None:
+        function = SCALAR_MODELS[model]
+        return [function(*args) for args in zip(*columns)]
+    if model == "variableInvestor":
+        return _variable_investor_batch(*columns)
+    if model == "fixedInvestor":
+        return batch_models.fixedInvestor_batch(*columns).tolist()
+    if model == "finallyRetired":
+        return batch_models.finallyRetired_batch(*columns).tolist()
+    return batch_models.maximumExpensed_batch(*columns).tolist()
+
+
+def _variable_investor_batch(principals, rate_lists, contributions) -> list:
+    # Ragged rate lists are padded into a matrix; rows are grouped by length so
+    # one long request does not inflate the matrix for the whole batch.
+    order = sorted(range(len(rate_lists)), key=lambda i: len(rate_lists[i]))
+    results = [0.0] * len(order)
+    start = 0
+    while start < len(order):
+        stop = start + 1
+        while stop < len(order) and (stop - start + 1) * max(len(rate_lists[order[stop]]), 1) <= PAD_CELLS:
+            stop += 1
+        rows = order[start:stop]
+        width = len(rate_lists[rows[-1]])
+        paths = np.zeros((len(rows), width))
+        lengths = np.empty(len(rows), dtype=np.int64)
+        for r, i in enumerate(rows):
+            lengths[r] = len(rate_lists[i])
+            paths[r, :lengths[r]] = rate_lists[i]
+        balances = batch_models.variableInvestor_batch(
+            [principals[i] for i in rows], paths, [contributions[i] for i in rows], lengths)
+        for i, value in zip(rows, balances.tolist()):
+            results[i] = value
+        start = stop
+    return results
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests for one model and evaluates them together.
+
+    A batch is flushed `window` seconds after its first request arrives, or as
+    soon as it holds `max_batch` requests.
+    """
+
+    def __init__(self, model: str, window: float, max_batch: int, executor: Optional[ProcessPoolExecutor] = None):
+        self.model = model
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+        self.batches = 0
+        self.requests = 0
+        self._pending: List[tuple] = []
+        self._timer = None
+        self._tasks = set()
+
+    def submit(self, args: tuple) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((args, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        self.batches += 1
+        self.requests += len(batch)
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        columns = [list(column) for column in zip(*(args for args, _ in batch))]
+        try:
+            if self.executor is None:
+                results = evaluate_batch(self.model, columns)
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, evaluate_batch, self.model, columns)
+        except Exception as e:
+            if len(batch) > 1:
+                # Retry one by one so only the request that failed gets the error
+                for item in batch:
+                    await self._run([item])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():     # the client may have disconnected
+                future.set_result(result)
+
+
+# --- HTTP Server ---
+
+class ModelService:
+    """
+    asyncio HTTP/1.1 server (keep-alive, JSON bodies) in front of MicroBatchers.
+
+    Parameters:
+        window_ms (float): Micro-batching window in milliseconds.
+        max_batch (int): Largest batch per kernel call.
+        workers (int, optional): Process pool size for offloaded models (default: all cores).
+    """
+
+    def __init__(self, window_ms: float = DEFAULT_WINDOW_MS, max_batch: int = DEFAULT_MAX_BATCH,
+                 workers: Optional[int] = None):
+        # Spawned (not forked) workers, so they never inherit open client sockets
+        # and keep a connection alive after the server has closed it.
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self.batchers: Dict[str, MicroBatcher] = {
+            model: MicroBatcher(model, window_ms / 1000.0, max_batch,
+                                self.executor if model in OFFLOADED else None)
+            for model in PARAMS
+        }
+        self.paths: "OrderedDict[int, AffinePath]" = OrderedDict()
+        self._next_path_id = 1
+        self.server = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        # Start a worker before accepting requests so the first client does not pay for it
+        await asyncio.get_running_loop().run_in_executor(
+            self.executor, evaluate_batch, "maximumExpensed", [[1.0], [0.0], [1]])
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        server = await self.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"Serving models on http://{address[0]}:{address[1]}/ (Ctrl+C to stop)", file=sys.stderr)
+        # SIGTERM (e.g. from a process manager) stops the server like Ctrl+C,
+        # so the process pool is still shut down.
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, stopped.set)
+        except NotImplementedError:      # no signal handlers on Windows
+            pass
+        try:
+            async with server:
+                await stopped.wait()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "vectorized": batch_models is not None,
+            "models": {
+                model: {"requests": b.requests, "batches": b.batches,
+                        "mean_batch_size": b.requests / b.batches if b.batches else 0.0}
+                for model, b in self.batchers.items()
+            },
+            "paths": len(self.paths),
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except RequestError as e:
+            _write_response(writer, e.status, {"error": str(e)}, False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes):
+        path = path.split("?", 1)[0].strip("/")
+        if path == "health":
+            return 200, self.health()
+        if path == "paths" or path.startswith("paths/"):
+            return self._dispatch_path(method, path, body)
+        if path not in self.batchers:
+            return 404, {"error": f"unknown endpoint '/{path}'. Models: {', '.join(self.batchers)}"}
+        if method != "POST":
+            return 405, {"error": "use POST with a JSON body"}
+        try:
+            args = parse_arguments(path, json.loads(body or b"{}"))
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        try:
+            return 200, {"result": await self.batchers[path].submit(args)}
+        except (ArithmeticError, ValueError) as e:
+            return 400, {"error": f"model error: {e}"}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+
+    def _dispatch_path(self, method: str, path: str, body: bytes):
+        # Path edits are O(log n) each, so they run on the event loop
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+        if path == "paths":
+            if method != "POST":
+                return 405, {"error": "use POST with a JSON body"}
+            try:
+                principal, rates, contribution = parse_arguments("variableInvestor", payload)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+            path_id, self._next_path_id = self._next_path_id, self._next_path_id + 1
+            self.paths[path_id] = affine = AffinePath(principal, rates, contribution)
+            if len(self.paths) > MAX_PATH_SESSIONS:
+                self.paths.popitem(last=False)
+            return 200, {"id": path_id, "years": len(affine), "result": affine.final_balance}
+
+        key = path.split("/", 1)[1]
+        affine = self.paths.get(int(key)) if key.isdigit() else None
+        if affine is None:
+            return 404, {"error": f"unknown path '{key}'"}
+        self.paths.move_to_end(int(key))
+        if method == "DELETE":
+            del self.paths[int(key)]
+            return 200, {"result": None}
+        if method != "POST":
+            return 405, {"error": "use POST to edit a path or DELETE to drop it"}
+        try:
+            principal, edits, year = parse_path_edit(payload)
+            if any(not 0 <= edit[0] < len(affine) for edit in edits) or not 0 <= (year or 0) <= len(affine):
+                raise IndexError(f"years must be within 0..{len(affine) - 1} (0..{len(affine)} for 'year')")
+            if principal is not None:
+                affine.principal = principal
+            for edit_year, rate, contribution in edits:
+                affine.set_year(edit_year, rate, contribution)
+            result = affine.final_balance if year is None else affine.balance_at(year)
+        except (IndexError, ValueError) as e:
+            return 400, {"error": str(e)}
+        return 200, {"years": len(affine), "result": result}
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """Reads one request; returns None when the client closed the connection."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise RequestError(400, "malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise RequestError(400, "invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, f"request body larger than {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool):
+    body = json.dumps(_finite_or_null(payload), allow_nan=False).encode()
+    head = (f"HTTP/1.1 {status} {_STATUS_TEXT.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode("latin-1") + body)
+
+
+def _finite_or_null(value):
+    """Replaces NaN and infinite floats with None, through dicts and lists."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_null(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_null(item) for item in value]
+    return value
+
+
+# --- Entry Point ---
+
+def build_parser() -> argparse.ArgumentParser:
+    """Same options as `main_app.py serve`."""
+    parser = argparse.ArgumentParser(description="Serve the retirement models over HTTP/JSON")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="Micro-batching window in milliseconds")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="Largest batch per kernel call")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes for maximumExpensed/variableInvestor (default: all cores)")
+    return parser
+
+
+def serve(args):
+    service = ModelService(args.window_ms, args.max_batch, args.workers)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nStopped.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    serve(build_parser().parse_args())
+
+# End of model_service.py
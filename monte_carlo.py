@@ -0,0 +1,215 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Monte Carlo simulation of variableInvestor over stochastic rate paths.
+
+Rate paths are drawn from a return model (normal, lognormal or a bootstrap of
+a supplied series) and pushed through batch_models.variableInvestor_batch in
+fixed-size chunks, so only `chunk_size x years` rates are ever held in memory.
+
+Random numbers are drawn per block of BLOCK_PATHS paths, each block from its
+own stream spawned from the run's seed. Chunks are whole numbers of blocks, so
+path i always sees the same rates and a seeded run reproduces exactly for any
+chunk size.
+
+With streaming=True the final balances are not kept at all: each chunk is
+folded into a quantiles.QuantileSketch (fixed-size and mergeable), so memory
+is bounded by the chunk size whatever the number of paths, and percentiles
+carry the sketch's relative error bound instead of being exact.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_models import variableInvestor_batch
+from quantiles import DEFAULT_RELATIVE_ACCURACY, QuantileSketch
+
+BLOCK_PATHS = 4096                # paths per random stream; the unit of reproducibility
+DEFAULT_CHUNK_PATHS = 65536       # paths simulated per chunk
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# --- Return Models ---
+
+class ReturnModel:
+    """Base class: draws an (n_paths, years) matrix of annual rates."""
+
+    def sample(self, rng: np.random.Generator, n_paths: int, years: int) -> np.ndarray:
+        raise NotImplementedError
+
+
+class NormalReturns(ReturnModel):
+    """Annual rates ~ Normal(mean, std)."""
+
+    def __init__(self, mean: float, std: float):
+        if std < 0:
+            raise ValueError("std must be non-negative")
+        self.mean = mean
+        self.std = std
+
+    def sample(self, rng, n_paths, years):
+        return rng.normal(self.mean, self.std, size=(n_paths, years))
+
+
+class LognormalReturns(ReturnModel):
+    """Growth factors 1 + rate ~ LogNormal(mu, sigma), so rates never fall below -100%."""
+
+    def __init__(self, mu: float, sigma: float):
+        if sigma < 0:
+            raise ValueError("sigma must be non-negative")
+        self.mu = mu
+        self.sigma = sigma
+
+    @classmethod
+    def from_moments(cls, mean: float, std: float) -> "LognormalReturns":
+        """Builds the model whose rates have the given arithmetic mean and standard deviation."""
+        growth = 1 + mean
+        if growth <= 0:
+            raise ValueError("mean rate must be greater than -100%")
+        sigma2 = np.log1p((std / growth) ** 2)
+        return cls(float(np.log(growth) - sigma2 / 2), float(np.sqrt(sigma2)))
+
+    def sample(self, rng, n_paths, years):
+        return np.expm1(rng.normal(self.mu, self.sigma, size=(n_paths, years)))
+
+
+class BootstrapReturns(ReturnModel):
+    """Rates resampled with replacement from a supplied historical series."""
+
+    def __init__(self, series: Sequence[float]):
+        self.series = np.asarray(series, dtype=float).ravel()
+        if self.series.size == 0:
+            raise ValueError("bootstrap series must not be empty")
+
+    def sample(self, rng, n_paths, years):
+        return self.series[rng.integers(0, self.series.size, size=(n_paths, years))]
+
+
+RETURN_MODELS = {
+    "normal": NormalReturns,
+    "lognormal": LognormalReturns,
+    "bootstrap": BootstrapReturns,
+}
+
+# --- Path Generation ---
+
+def iter_rate_chunks(model: ReturnModel, years: int, n_paths: int, seed=None,
+                     chunk_size: int = DEFAULT_CHUNK_PATHS) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yields (first_path_index, rates) chunks covering paths [0, n_paths).
+
+    `seed` may be an int, a np.random.SeedSequence or None (fresh entropy).
+    chunk_size is rounded to a whole number of BLOCK_PATHS blocks.
+    """
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    blocks_per_chunk = max(1, chunk_size // BLOCK_PATHS)
+
+    for chunk_start in range(0, n_paths, blocks_per_chunk * BLOCK_PATHS):
+        chunk_stop = min(n_paths, chunk_start + blocks_per_chunk * BLOCK_PATHS)
+        rates = np.empty((chunk_stop - chunk_start, years))
+        for block_start in range(chunk_start, chunk_stop, BLOCK_PATHS):
+            block_stop = min(chunk_stop, block_start + BLOCK_PATHS)
+            rng = _block_rng(seed_seq, block_start // BLOCK_PATHS)
+            rates[block_start - chunk_start:block_stop - chunk_start] = model.sample(rng, block_stop - block_start, years)
+        yield chunk_start, rates
+
+
+def _block_rng(seed_seq: np.random.SeedSequence, block: int) -> np.random.Generator:
+    """Independent stream for one block, addressed by index rather than by spawn order."""
+    child = np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (block,))
+    return np.random.default_rng(child)
+
+
+# --- Simulation ---
+
+@dataclass
+class MonteCarloResult:
+    """Summary of a Monte Carlo run of variableInvestor."""
+    n_paths: int
+    years: int
+    percentiles: Dict[float, float]
+    mean: float
+    probability_of_target: Optional[float]
+    seed_entropy: int
+    final_balances: Optional[np.ndarray] = field(default=None, repr=False)
+    sketch: Optional[QuantileSketch] = field(default=None, repr=False)     # streaming runs only
+
+
+def simulate_variable_investor(principal: float, model: ReturnModel, years: int, n_paths: int,
+                               annual_contribution: float = 0.0, target: Optional[float] = None,
+                               percentiles: Sequence[float] = DEFAULT_PERCENTILES, seed=None,
+                               chunk_size: int = DEFAULT_CHUNK_PATHS,
+                               keep_balances: bool = False, streaming: bool = False,
+                               relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> MonteCarloResult:
+    """
+    Runs variableInvestor over `n_paths` stochastic rate paths.
+
+    Parameters:
+        principal (float): Starting principal.
+        model (ReturnModel): Return model the annual rates are drawn from.
+        years (int): Years per path.
+        n_paths (int): Number of simulated paths.
+        annual_contribution (float): Amount added at the end of each year.
+        target (float, optional): Balance whose probability of being reached is reported.
+        percentiles (sequence of float): Percentiles (0-100) of the final balance to report.
+        seed (int | SeedSequence, optional): Seed for a reproducible run.
+        chunk_size (int): Paths simulated at once; bounds memory, not results.
+        keep_balances (bool): Attach the array of final balances to the result.
+        streaming (bool): Summarize each chunk into a QuantileSketch instead of
+            storing the final balances (memory independent of n_paths).
+        relative_accuracy (float): Percentile accuracy of the streaming sketch.
+
+    Returns:
+        MonteCarloResult: Percentiles, mean and probability of reaching the target.
+    """
+    if years < 0 or n_paths <= 0:
+        raise ValueError("years must be non-negative and n_paths positive")
+    if streaming and keep_balances:
+        raise ValueError("keep_balances needs the final balances, which streaming does not store")
+    seed_seq = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    if streaming:
+        return _simulate_streaming(principal, model, years, n_paths, annual_contribution, target,
+                                   percentiles, seed_seq, chunk_size, relative_accuracy)
+
+    # 8 bytes per path for the summary; the rate matrix only ever exists per chunk.
+    final_balances = np.empty(n_paths)
+    for start, rates in iter_rate_chunks(model, years, n_paths, seed_seq, chunk_size):
+        final_balances[start:start + len(rates)] = variableInvestor_batch(principal, rates, annual_contribution)
+
+    values = np.percentile(final_balances, list(percentiles))
+    return MonteCarloResult(
+        n_paths=n_paths,
+        years=years,
+        percentiles={p: float(v) for p, v in zip(percentiles, values)},
+        mean=float(final_balances.mean()),
+        probability_of_target=None if target is None else float(np.mean(final_balances >= target)),
+        seed_entropy=seed_seq.entropy,
+        final_balances=final_balances if keep_balances else None,
+    )
+
+
+def _simulate_streaming(principal, model, years, n_paths, annual_contribution, target,
+                        percentiles, seed_seq, chunk_size, relative_accuracy) -> MonteCarloResult:
+    sketch = QuantileSketch(relative_accuracy)
+    reached = 0
+    for _, rates in iter_rate_chunks(model, years, n_paths, seed_seq, chunk_size):
+        balances = variableInvestor_batch(principal, rates, annual_contribution)
+        sketch.add(balances)
+        if target is not None:
+            reached += int(np.count_nonzero(balances >= target))
+
+    return MonteCarloResult(
+        n_paths=n_paths,
+        years=years,
+        percentiles=sketch.percentiles(percentiles),
+        mean=sketch.mean,
+        probability_of_target=None if target is None else reached / n_paths,
+        seed_entropy=seed_seq.entropy,
+        sketch=sketch,
+    )
+
+# End of monte_carlo.py
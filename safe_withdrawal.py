@@ -0,0 +1,244 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Largest withdrawal that lasts `target_years` in at least a given share of
+stochastic return paths.
+
+Bisecting on the withdrawal around a Monte Carlo run re-simulates every path
+at every step. Here the paths are drawn once and shared by every candidate
+withdrawal (common random numbers). On a path with growth factors q_j, the
+balance after year k at withdrawal E is linear in E,
+
+    b_k = B A_k - E S_k,    A_k = q_1 ... q_k,    S_k = S_{k-1} q_k + 1
+
+and, as in maximumExpensed, the funds last target_years exactly when
+b_1 .. b_{T-1} all stay at or above 1e-6. So each path survives precisely the
+withdrawals up to its critical withdrawal
+
+    E*_i = min_{k < T} (B A_k - 1e-6) / S_k
+
+(capped at the balance like maximumExpensed). One pass over the years
+computes E*_i for every path. The formula ignores the loop's rounding, so
+each E*_i is then moved, usually by an ulp or two, to the largest withdrawal
+that the year-by-year finallyRetired rule accepts on that path, exactly as
+maximumExpensed does. That pass costs the same as simulating the
+paths once, and it answers every candidate at once: the success rate at any E
+is the share of paths with E*_i >= E. The safe withdrawal is the order
+statistic of E* at rank n - ceil(p n).
+
+The confidence interval treats the paths as a random sample. The number of
+E*_i below the true quantile is binomial, so the order statistics at ranks
+n(1 - p) -/+ z sqrt(n p (1 - p)) bracket the true safe withdrawal with the
+requested confidence (normal approximation, no assumption on the return
+distribution).
+
+A path that does not last target_years even without withdrawals (e.g. its
+growth factor is <= 0 in some year before year T, a rate of -100% or worse)
+cannot sustain any non-negative withdrawal, so its E*_i is -inf.
+"""
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Tuple
+
+import numpy as np
+
+from batch_models import largest_lasting_batch
+from financial_models import DEPLETION_THRESHOLD, MAX_RETIREMENT_YEARS
+from monte_carlo import DEFAULT_CHUNK_PATHS, ReturnModel, iter_rate_chunks
+
+
+@dataclass
+class SafeWithdrawalResult:
+    """The safe withdrawal, its confidence interval and every path's critical withdrawal."""
+    withdrawal: float
+    confidence_interval: Tuple[float, float]
+    success_probability: float
+    confidence: float
+    target_years: int
+    critical_withdrawals: np.ndarray = field(repr=False)     # sorted, one per path
+
+    @property
+    def n_paths(self) -> int:
+        return self.critical_withdrawals.size
+
+    def success_rate(self, withdrawals) -> np.ndarray:
+        """Share of paths on which each candidate withdrawal lasts target_years."""
+        withdrawals = np.asarray(withdrawals, dtype=float)
+        failing = np.searchsorted(self.critical_withdrawals, withdrawals, side="left")
+        return 1.0 - failing / self.n_paths
+
+
+# --- Critical Withdrawals ---
+
+def critical_withdrawals(balance: float, rate_paths, target_years: int) -> np.ndarray:
+    """
+    Largest withdrawal each path sustains for target_years under
+    finallyRetired's year-by-year depletion rule applied to the path's rates.
+
+    Parameters:
+        balance (float): Starting retirement balance.
+        rate_paths (array_like): (paths, years) annual rates, years >= target_years - 1.
+        target_years (int): Number of years the funds must last.
+
+    Returns:
+        np.ndarray: E*_i per path (-inf where no non-negative withdrawal lasts).
+    """
+    rate_paths = np.atleast_2d(np.asarray(rate_paths, dtype=float))
+    n_paths, n_years = rate_paths.shape
+    if target_years > MAX_RETIREMENT_YEARS or balance <= 0:
+        return np.zeros(n_paths)
+    horizon = max(target_years - 1, 0)
+    if n_years < horizon:
+        raise ValueError(f"rate paths cover {n_years} years; target_years={target_years} needs {horizon}")
+
+    critical = np.full(n_paths, float(balance))
+    growth = np.ones(n_paths)
+    annuity = np.zeros(n_paths)
+    alive = np.ones(n_paths, dtype=bool)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for year in range(horizon):
+            factor = 1 + rate_paths[:, year]
+            alive &= factor > 0
+            growth *= factor
+            annuity *= factor
+            annuity += 1
+            np.fmin(critical, (balance * growth - DEPLETION_THRESHOLD) / annuity, out=critical)
+    critical[~alive] = -np.inf
+    if horizon > 0:
+        _refine(critical, balance, 1 + rate_paths[:, :horizon])
+    return critical
+
+
+def _refine(critical: np.ndarray, balance: float, growth: np.ndarray):
+    # The formula value can be a few ulps either side of the largest
+    # withdrawal that the loop accepts, which decides the order statistic.
+    # Positive values are moved to that withdrawal (bisecting where no
+    # bracket is found); the others become 0 or -inf depending on whether
+    # the path lasts without withdrawals.
+    positive = np.flatnonzero(critical > 0)
+    positive_growth = growth[positive]
+
+    def lasts(withdrawals, index):
+        return _lasts_on_paths(balance, withdrawals, positive_growth[index])
+
+    balances = np.full(positive.size, float(balance))
+    critical[positive], _, failed = largest_lasting_batch(balances, critical[positive], lasts)
+    failed = positive[failed]
+    if failed.size:
+        critical[failed] = _bisect_withdrawals(balance, growth[failed])
+
+    rest = np.flatnonzero(np.isfinite(critical) & ~(critical > 0))
+    rest = np.concatenate((rest, failed[critical[failed] == 0.0]))
+    idle = _lasts_on_paths(balance, np.zeros(rest.size), growth[rest])
+    critical[rest] = np.where(idle, 0.0, -np.inf)
+
+
+def _lasts_on_paths(balance: float, withdrawals: np.ndarray, growth: np.ndarray) -> np.ndarray:
+    """finallyRetired's loop rule on each path: every balance before year T stays >= 1e-6."""
+    current = np.full(withdrawals.shape, float(balance))
+    lasts = np.ones(withdrawals.shape, dtype=bool)
+    with np.errstate(over="ignore", invalid="ignore"):
+        for year in range(growth.shape[1]):
+            current *= growth[:, year]
+            current -= withdrawals
+            lasts &= current >= DEPLETION_THRESHOLD
+    return lasts
+
+
+def _bisect_withdrawals(balance: float, growth: np.ndarray) -> np.ndarray:
+    """Largest lasting withdrawal in [0, balance] per path, by bisection (0 if none lasts)."""
+    low = np.zeros(len(growth))
+    high = np.full(len(growth), float(balance))
+    active = np.ones(len(growth), dtype=bool)
+    while active.any():
+        middle = (low + high) / 2
+        active &= (middle != low) & (middle != high)
+        lasts = _lasts_on_paths(balance, middle, growth)
+        low = np.where(active & lasts, middle, low)
+        high = np.where(active & ~lasts, middle, high)
+    return low
+
+
+# --- Solver ---
+
+def safe_withdrawal_from_paths(balance: float, rate_paths, target_years: int = 30,
+                               success_probability: float = 0.95,
+                               confidence: float = 0.95) -> SafeWithdrawalResult:
+    """
+    Largest withdrawal lasting target_years on at least success_probability of the given paths.
+
+    Parameters:
+        balance (float): Starting retirement balance.
+        rate_paths (array_like): (paths, years) annual rates, e.g. Monte Carlo
+            draws or ReturnDataset.windows().
+        target_years (int): Number of years the funds must last.
+        success_probability (float): Required share of paths, 0 < p <= 1.
+        confidence (float): Coverage of the confidence interval.
+
+    Returns:
+        SafeWithdrawalResult: Withdrawal (never below 0), confidence interval
+        and the per-path critical withdrawals.
+    """
+    return _summarize(critical_withdrawals(balance, rate_paths, target_years), target_years,
+                      success_probability, confidence)
+
+
+def safe_withdrawal(balance: float, model: ReturnModel, target_years: int = 30, success_probability: float = 0.95,
+                    n_paths: int = 100000, seed=None, confidence: float = 0.95,
+                    chunk_size: int = DEFAULT_CHUNK_PATHS) -> SafeWithdrawalResult:
+    """
+    Monte Carlo safe withdrawal: paths from `model` are generated once, in
+    chunks, and reduced to their critical withdrawals (8 bytes per path).
+
+    Parameters:
+        balance (float): Starting retirement balance.
+        model (ReturnModel): Return model the annual rates are drawn from.
+        target_years (int): Number of years the funds must last.
+        success_probability (float): Required share of paths, 0 < p <= 1.
+        n_paths (int): Number of simulated paths.
+        seed (int | SeedSequence, optional): Seed for a reproducible run.
+        confidence (float): Coverage of the confidence interval.
+        chunk_size (int): Paths simulated at once; bounds memory, not results.
+
+    Returns:
+        SafeWithdrawalResult: As safe_withdrawal_from_paths.
+    """
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive")
+    critical = np.empty(n_paths)
+    years = max(min(target_years, MAX_RETIREMENT_YEARS + 1) - 1, 0)
+    for start, rates in iter_rate_chunks(model, years, n_paths, seed, chunk_size):
+        critical[start:start + len(rates)] = critical_withdrawals(balance, rates, target_years)
+    return _summarize(critical, target_years, success_probability, confidence)
+
+
+def _summarize(critical: np.ndarray, target_years: int, success_probability: float,
+               confidence: float) -> SafeWithdrawalResult:
+    if not 0 < success_probability <= 1:
+        raise ValueError("success_probability must be in (0, 1]")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    critical = np.sort(critical)
+    n = critical.size
+    if n == 0:
+        raise ValueError("no rate paths")
+
+    # At least ceil(p n) paths must have E*_i >= E; rounding guards p * n landing an ulp above an integer.
+    rank = n - math.ceil(round(success_probability * n, 9))
+    failure = 1 - success_probability
+    spread = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(n * failure * success_probability)
+    low = min(max(math.floor(n * failure - spread), 0), rank)
+    high = max(min(math.ceil(n * failure + spread), n - 1), rank)
+
+    def value(i):
+        return max(float(critical[i]), 0.0)
+
+    return SafeWithdrawalResult(value(rank), (value(low), value(high)), success_probability, confidence,
+                                target_years, critical)
+
+# End of safe_withdrawal.py
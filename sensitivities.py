@@ -0,0 +1,207 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Analytic sensitivities of fixedInvestor, variableInvestor and maximumExpensed,
+vectorized across scenarios like batch_models.
+
+Each function returns the model value together with its partial derivatives,
+computed in the same pass as the value instead of by re-running the model
+with bumped inputs (finite differences cost 2 extra evaluations per
+parameter). The derivatives used, with q = 1 + r, G = q^n and the annuity
+factor S(r, n) = (G - 1) / r:
+
+    fixedInvestor    F = P G + c S
+        dF/dP = G        dF/dc = S        dF/dr = P n q^(n-1) + c dS/dr
+        dF/dn = G ln(q) (P + c / r)
+
+    variableInvestor (forward pass for the value, backward pass for the rates)
+        dF/dP = prod(q_j)   dF/dc = sum_k prod_{j>k} q_j
+        dF/dr_k = b_{k-1} prod_{j>k} q_j
+
+    maximumExpensed  E = (B q^K - 1e-6) / S(r, K) for the binding year K
+        (1 or target_years - 1, see financial_models.maximumExpensed)
+
+Horizons are integers in the models; d_years is the derivative of the
+closed form in a continuous horizon (the change for one more year of
+fixedInvestor is exactly r F + c). maximumExpensed is piecewise constant
+between year boundaries in finallyRetired, so its derivatives are those of
+the annuity solution it lands on. Derivatives are NaN where the closed forms
+do not apply (rate <= -100%, overflow, maximumExpensed's bisection
+fallback).
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from batch_models import as_years, broadcast_inputs, maximumExpensed_batch
+from financial_models import CLOSED_FORM_RTOL, DEPLETION_THRESHOLD, MAX_RETIREMENT_YEARS
+
+# Below this |n * r| the annuity-factor derivative is taken from its Taylor
+# series, where the closed form (n q^(n-1) r - (G - 1)) / r^2 cancels.
+SERIES_CUTOFF = 1e-2
+SERIES_TERMS = 6
+
+
+@dataclass
+class Sensitivities:
+    """A model value and its partial derivatives (arrays shaped like the scenarios)."""
+    value: np.ndarray
+    d_principal: np.ndarray                     # w.r.t. principal / starting balance
+    d_rate: np.ndarray                          # w.r.t. the rate (a parallel shift of every rate)
+    d_contribution: Optional[np.ndarray] = None
+    d_years: Optional[np.ndarray] = None        # continuous-horizon derivative
+    d_rates: Optional[np.ndarray] = None        # variableInvestor: one column per year
+
+
+# --- Annuity Factor ---
+
+def _growth_terms(rate: np.ndarray, years: np.ndarray):
+    """G = q^n, S = (G - 1) / r, dS/dr and ln(q) / r, accurate for tiny rates."""
+    q = 1 + rate
+    n = years.astype(float)
+    with np.errstate(over="ignore", under="ignore", divide="ignore", invalid="ignore"):
+        log_q = np.where(q > 0, np.log1p(np.where(q > 0, rate, 0.0)), np.nan)
+        g_minus_1 = np.where(q > 0, np.expm1(n * log_q), np.power(q, n) - 1)
+        growth = g_minus_1 + 1
+        zero = rate == 0
+        safe_rate = np.where(zero, 1.0, rate)
+        annuity = np.where(zero, n, g_minus_1 / safe_rate)
+        log_q_over_r = np.where(zero, 1.0, log_q / safe_rate)
+
+        d_annuity = np.asarray((n * growth / q * rate - g_minus_1) / (safe_rate * safe_rate))
+        # dS/dr = sum_{k>=2} C(n, k) (k - 1) r^(k - 2)
+        small = np.abs(n * rate) < SERIES_CUTOFF
+        if small.any():
+            ns, rs = n[small], rate[small]
+            term = ns * (ns - 1) / 2            # C(n, 2)
+            series = term.copy()
+            power = np.ones_like(rs)
+            for k in range(3, 3 + SERIES_TERMS):
+                term = term * (ns - k + 1) / k  # C(n, k)
+                power = power * rs
+                series += term * (k - 1) * power
+            d_annuity[small] = series
+    return growth, annuity, d_annuity, log_q, log_q_over_r
+
+
+# --- Sensitivity Functions ---
+
+def fixedInvestor_sensitivities(principal, rate, years, annual_contribution=0.0) -> Sensitivities:
+    """
+    fixedInvestor and its derivatives w.r.t. principal, rate, contribution and years.
+
+    Returns:
+        Sensitivities: value, d_principal, d_rate, d_contribution, d_years.
+    """
+    principal, rate, contribution, _ = broadcast_inputs(principal, rate, annual_contribution, np.asarray(years, dtype=float))
+    years = np.maximum(as_years(years, principal.shape), 0)
+    growth, annuity, d_annuity, log_q, log_q_over_r = _growth_terms(rate, years)
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        value = principal * growth + contribution * annuity
+        d_rate = principal * years * growth / (1 + rate) + contribution * d_annuity
+        d_years = growth * (principal * log_q + contribution * log_q_over_r)
+    return Sensitivities(value, growth, d_rate, annuity, d_years)
+
+
+def variableInvestor_sensitivities(principal, rate_paths, annual_contribution=0.0,
+                                   per_year: bool = False) -> Sensitivities:
+    """
+    variableInvestor over each row of `rate_paths` with its derivatives.
+
+    The value comes from the same year-by-year recurrence as variableInvestor
+    (bit-identical), with the derivatives w.r.t. principal, contribution and a
+    parallel shift of every rate carried along as forward-mode tangents. With
+    per_year=True a backward pass adds the derivative w.r.t. each year's rate.
+
+    Returns:
+        Sensitivities: value, d_principal, d_rate (parallel shift of all rates),
+        d_contribution and, with per_year, d_rates (n_paths, years).
+    """
+    rate_paths = np.atleast_2d(np.asarray(rate_paths, dtype=float))
+    n_paths, n_years = rate_paths.shape
+    balance = np.array(np.broadcast_to(np.asarray(principal, dtype=float), (n_paths,)))
+    contribution = np.broadcast_to(np.asarray(annual_contribution, dtype=float), (n_paths,))
+
+    # b_k = b_{k-1} q_k + c and its tangents; b_{k-1} is kept for the backward pass.
+    # Year-major copies keep each year's column contiguous for the two passes.
+    growths = np.ascontiguousarray(rate_paths.T) + 1
+    before = np.empty((n_years, n_paths)) if per_year else None
+    d_principal = np.ones(n_paths)
+    d_contribution = np.zeros(n_paths)
+    d_shift = np.zeros(n_paths)
+    for year in range(n_years):
+        growth = growths[year]
+        if per_year:
+            before[year] = balance
+        d_shift = d_shift * growth + balance
+        d_principal = d_principal * growth
+        d_contribution = d_contribution * growth + 1
+        balance = balance * growth + contribution
+
+    d_rates = None
+    if per_year:
+        # dF/dr_k = b_{k-1} * prod_{j>k} q_j
+        later = np.ones(n_paths)
+        for year in range(n_years - 1, -1, -1):
+            before[year] *= later
+            later *= growths[year]
+        d_rates = before.T
+    return Sensitivities(balance, d_principal, d_shift, d_contribution, None, d_rates)
+
+
+def maximumExpensed_sensitivities(balance, rate, target_years=30) -> Sensitivities:
+    """
+    maximumExpensed and its derivatives w.r.t. balance, rate and target_years.
+
+    Returns:
+        Sensitivities: value (from maximumExpensed_batch), d_principal (w.r.t.
+        the balance), d_rate and d_years.
+    """
+    balance, rate, _ = broadcast_inputs(balance, rate, np.asarray(target_years, dtype=float))
+    target = as_years(target_years, balance.shape)
+    value = maximumExpensed_batch(balance, rate, target)
+
+    d_balance = np.zeros(balance.shape)
+    d_rate = np.zeros(balance.shape)
+    d_years = np.zeros(balance.shape)
+
+    analytic = (balance > 0) & (rate > -1) & np.isfinite(balance) & np.isfinite(rate)
+    d_balance[~analytic] = d_rate[~analytic] = d_years[~analytic] = np.nan
+    solve = analytic & (target > 1) & (target <= MAX_RETIREMENT_YEARS) & (value > 0)
+    d_balance[analytic & (target <= 1)] = 1.0           # the whole balance in year one
+
+    # The binding candidate: k = 1, k = target - 1, or the balance cap.
+    best = np.full(balance.shape, np.inf)
+    overflow = np.zeros(balance.shape, dtype=bool)
+    for k in (np.ones_like(target), target - 1):
+        growth, annuity, d_annuity, log_q, log_q_over_r = _growth_terms(rate, k)
+        overflow |= solve & ~np.isfinite(growth)
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            excess = balance * growth - DEPLETION_THRESHOLD
+            candidate = excess / annuity
+            binding = solve & (candidate < best)
+            best = np.where(binding, candidate, best)
+            d_balance = np.where(binding, growth / annuity, d_balance)
+            d_rate = np.where(binding, (balance * k * growth / (1 + rate) * annuity - excess * d_annuity)
+                              / (annuity * annuity), d_rate)
+            # d/dK of the annuity factor is G ln(q) / r; k = 1 does not move with the target.
+            d_k = growth * (balance * log_q * annuity - excess * log_q_over_r) / (annuity * annuity)
+            d_years = np.where(binding, np.where(k == target - 1, d_k, 0.0), d_years)
+    capped = solve & (best > balance)
+    d_balance[capped], d_rate[capped], d_years[capped] = 1.0, 0.0, 0.0
+
+    # Where the annuity formula overflowed, or the value is not the annuity
+    # solution (maximumExpensed_batch fell back to its bisection), there is
+    # no closed form to differentiate.
+    with np.errstate(invalid="ignore"):
+        fallback = overflow | (solve & ~np.isclose(value, np.minimum(best, balance), rtol=CLOSED_FORM_RTOL, atol=0.0))
+    d_balance[fallback] = d_rate[fallback] = d_years[fallback] = np.nan
+    return Sensitivities(value, d_balance, d_rate, None, d_years)
+
+# End of sensitivities.py
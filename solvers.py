@@ -0,0 +1,605 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Inverse solves ("what input reaches this output?") built on the models.
+
+Two general root finders, both bracketing and stopping on a tolerance on the
+root (|error| <= xtol + rtol * |x|) rather than after a fixed step count:
+
+    brent(f, low, high)              scalar Brent's method: inverse quadratic /
+                                     secant steps, falling back to bisection
+                                     whenever they would leave the bracket.
+    chandrupatla_batch(f, low, high) the same idea vectorized (Chandrupatla's
+                                     method): every scenario takes its step in
+                                     one array operation, and scenarios drop
+                                     out as they converge.
+
+and three planners with batch variants:
+
+    requiredContribution(principal, rate, years, target)
+        Annual contribution that makes fixedInvestor reach `target`.
+        fixedInvestor is linear in the contribution, so a single Newton step
+        from zero is exact: c = (target - F(0)) / S, where the slope S is
+        fixedInvestor(0, rate, years, 1).
+
+    requiredRate(principal, years, target, annual_contribution)
+        Constant rate that makes fixedInvestor reach `target`. fixedInvestor
+        is increasing in the rate above -100% (for a non-negative principal
+        and contribution), so the root is bracketed between -1 and an upper
+        bound doubled until it overshoots, then found with Brent's method.
+
+    requiredPrincipal(expense, rate, target_years)
+        Smallest starting balance with finallyRetired(balance, expense, rate)
+        >= target_years. By the same argument as maximumExpensed, the funds
+        last that long exactly when the balances after year 1 and after year
+        target_years - 1 stay at or above 1e-6. Each is linear in the balance,
+
+            B_k = (1e-6 + E * ((1 + r)^k - 1) / r) / (1 + r)^k
+
+        so the answer is max(B_1, B_{target_years - 1}). As in
+        maximumExpensed, the candidate is then checked against the
+        year-by-year finallyRetired rule (financial_models.lasts) and moved,
+        usually by an ulp or two, to the smallest balance that rule accepts.
+        Where the formula does not apply, a bisection over the same rule
+        takes over.
+
+Scenarios without a solution give NaN (inf for a principal no balance can
+reach, e.g. target_years > 500). The batch functions need NumPy; the scalar
+ones do not.
+"""
+
+import math
+from typing import Callable, Tuple
+
+from financial_models import (DEPLETION_THRESHOLD, MAX_RETIREMENT_YEARS, all_finite, annuity_factor,
+                              fixedInvestor, lasts, require_numpy)
+
+DEFAULT_XTOL = 1e-12            # absolute tolerance on the root
+DEFAULT_RTOL = 4 * 2.0 ** -52   # relative tolerance on the root
+DEFAULT_MAXITER = 100
+MAX_BRACKET_DOUBLINGS = 64      # upper rate bound tried up to 2^64 (the models overflow well before)
+
+
+# --- Scalar Root Finding ---
+
+def brent(f: Callable[[float], float], low: float, high: float, xtol: float = DEFAULT_XTOL,
+          rtol: float = DEFAULT_RTOL, maxiter: int = DEFAULT_MAXITER) -> Tuple[float, int]:
+    """
+    Finds a root of f in [low, high] with Brent's method.
+
+    Parameters:
+        f (callable): Continuous function with f(low) and f(high) of opposite sign.
+        low, high (float): The bracket.
+        xtol, rtol (float): Stop once the root is known to within xtol + rtol * |root|.
+        maxiter (int): Maximum number of evaluations of f after the endpoints.
+
+    Returns:
+        tuple[float, int]: (root, evaluations of f).
+    """
+    x_prev, x_cur = float(low), float(high)
+    f_prev, f_cur = f(x_prev), f(x_cur)
+    if f_prev == 0:
+        return x_prev, 0
+    if f_cur == 0:
+        return x_cur, 0
+    if (f_prev < 0) == (f_cur < 0):
+        raise ValueError(f"f({x_prev}) and f({x_cur}) must have opposite signs")
+
+    # x_cur is the best estimate, x_prev the previous one, x_blk the other end of the bracket.
+    x_blk = f_blk = 0.0
+    s_prev = s_cur = 0.0
+    for iterations in range(maxiter):
+        if f_prev != 0 and f_cur != 0 and (f_prev < 0) != (f_cur < 0):
+            x_blk, f_blk = x_prev, f_prev
+            s_prev = s_cur = x_cur - x_prev
+        if abs(f_blk) < abs(f_cur):
+            x_prev, x_cur, x_blk = x_cur, x_blk, x_cur
+            f_prev, f_cur, f_blk = f_cur, f_blk, f_cur
+
+        delta = (xtol + rtol * abs(x_cur)) / 2
+        s_bisect = (x_blk - x_cur) / 2
+        if f_cur == 0 or abs(s_bisect) < delta:
+            return x_cur, iterations
+
+        if abs(s_prev) > delta and abs(f_cur) < abs(f_prev):
+            if x_prev == x_blk:
+                # Secant step.
+                s_try = -f_cur * (x_cur - x_prev) / (f_cur - f_prev)
+            else:
+                # Inverse quadratic interpolation.
+                d_prev = (f_prev - f_cur) / (x_prev - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_prev * d_prev) / (d_blk * d_prev * (f_blk - f_prev))
+            # Accept it only if it shrinks faster than bisection would (False for NaN steps).
+            if 2 * abs(s_try) < min(abs(s_prev), 3 * abs(s_bisect) - delta):
+                s_prev, s_cur = s_cur, s_try
+            else:
+                s_prev = s_cur = s_bisect
+        else:
+            s_prev = s_cur = s_bisect
+
+        x_prev, f_prev = x_cur, f_cur
+        x_cur += s_cur if abs(s_cur) > delta else math.copysign(delta, s_bisect)
+        f_cur = f(x_cur)
+    return x_cur, maxiter
+
+
+def _bracket_above(f: Callable[[float], float], low: float, high: float) -> Tuple[float, float]:
+    """Doubles the distance of `high` from `low` until f changes sign; NaN bound if it never does."""
+    anchor, f_low = low, f(low)
+    if f_low == 0:
+        return low, low
+    for _ in range(MAX_BRACKET_DOUBLINGS):
+        f_high = f(high)
+        if (f_high < 0) != (f_low < 0) or f_high == 0:
+            return low, high
+        if not math.isfinite(f_high):
+            break
+        low, f_low, high = high, f_high, anchor + 2 * (high - anchor)
+    return low, math.nan
+
+
+# --- Planners ---
+
+def requiredContribution(principal: float, rate: float, years: int, target: float) -> float:
+    """
+    Annual contribution c with fixedInvestor(principal, rate, years, c) == target.
+
+    Parameters:
+        principal (float): Initial investment amount.
+        rate (float): Annual interest rate as decimal.
+        years (int): Number of years invested.
+        target (float): Balance to reach.
+
+    Returns:
+        float: Required contribution (negative if the principal alone
+        overshoots), or NaN if no contribution can change the result.
+    """
+    slope = fixedInvestor(0.0, rate, years, 1.0)
+    if years <= 0 or not (slope != 0 and math.isfinite(slope)):
+        return math.nan
+    return (target - fixedInvestor(principal, rate, years, 0.0)) / slope
+
+
+def requiredRate(principal: float, years: int, target: float, annual_contribution: float = 0.0,
+                 xtol: float = DEFAULT_XTOL, return_iterations: bool = False):
+    """
+    Constant annual rate r with fixedInvestor(principal, r, years, annual_contribution) == target.
+
+    Parameters:
+        principal (float): Initial investment amount.
+        years (int): Number of years invested.
+        target (float): Balance to reach.
+        annual_contribution (float): Amount added at the end of each year.
+        xtol (float): Absolute tolerance on the rate.
+        return_iterations (bool): Also return how many fixedInvestor
+            evaluations the solve used.
+
+    Returns:
+        float: Required rate (> -1), or NaN if no rate reaches the target, or
+        tuple[float, int]: (rate, iterations) when return_iterations is True.
+    """
+    rate, iterations = _required_rate(principal, years, target, annual_contribution, xtol)
+    if return_iterations:
+        return rate, iterations
+    return rate
+
+
+def _required_rate(principal, years, target, contribution, xtol):
+    if years <= 0 or not all_finite(principal, target, contribution):
+        return math.nan, 0
+    evaluations = [0]
+
+    def shortfall(rate):
+        evaluations[0] += 1
+        return fixedInvestor(principal, rate, years, contribution) - target
+
+    low, high = _bracket_above(shortfall, -1.0, 1.0)
+    if math.isnan(high):
+        return math.nan, evaluations[0]
+    rate, _ = brent(shortfall, low, high, xtol=xtol)
+    return rate, evaluations[0]
+
+
+def requiredPrincipal(expense: float, rate: float, target_years: int = 30, return_iterations: bool = False):
+    """
+    Smallest starting balance B whose funds last target_years under the
+    year-by-year finallyRetired rule, i.e. finallyRetired(B, expense, rate)
+    >= target_years with the loop's rounding.
+
+    Parameters:
+        expense (float): Annual withdrawal.
+        rate (float): Annual growth rate as decimal.
+        target_years (int): Number of years the funds must last.
+        return_iterations (bool): Also return how many finallyRetired
+            evaluations the solve used.
+
+    Returns:
+        float: Required balance (0.0 if any positive balance lasts, inf if none
+        does), or tuple[float, int]: (balance, iterations) when
+        return_iterations is True.
+    """
+    balance, iterations = _required_principal(expense, rate, target_years)
+    if return_iterations:
+        return balance, iterations
+    return balance
+
+
+def _required_principal(expense: float, rate: float, target_years: int):
+    if not all_finite(expense, rate):
+        return math.nan, 0
+    if target_years <= 1:
+        return 0.0, 0
+    if target_years > MAX_RETIREMENT_YEARS or rate <= -1:
+        return math.inf, 0
+
+    candidates = []
+    for k in {1, target_years - 1}:
+        try:
+            growth = math.exp(k * math.log1p(rate))
+        except OverflowError:
+            return _required_principal_bisection(expense, rate, target_years)
+        candidates.append((DEPLETION_THRESHOLD + expense * annuity_factor(rate, k)) / growth)
+    balance = max(candidates)
+    if not balance > 0:
+        return 0.0, 0
+
+    # The formula ignores the loop's rounding, and the minimal balance leaves
+    # a year-end balance right at the 1e-6 threshold, where the closed-form
+    # finallyRetired may be a year off. So the candidate is checked with the
+    # loop rule and moved to the smallest balance it accepts.
+    balance, iterations = _smallest_lasting(expense, rate, target_years, balance)
+    if balance is None:
+        balance, more = _required_principal_bisection(expense, rate, target_years)
+        return balance, iterations + more
+    return balance, iterations
+
+
+def _smallest_lasting(expense: float, rate: float, target_years: int, candidate: float):
+    """
+    Smallest balance near `candidate` that lasts target_years, found by
+    bracketing with ulp steps that double and bisecting to adjacent floats.
+    Returns (None, iterations) if no bracket is found within 128 checks.
+    """
+    iterations = 1
+    if lasts(candidate, expense, rate, target_years):
+        low, high = None, candidate
+    else:
+        low, high = candidate, None
+    step = math.ulp(candidate)
+    while low is None or high is None:
+        if iterations >= 128:
+            return None, iterations
+        iterations += 1
+        probe = low + step if high is None else max(high - step, 0.0)
+        if lasts(probe, expense, rate, target_years):
+            high = probe
+        else:
+            low = probe
+        step *= 2
+
+    while True:
+        middle = (low + high) / 2
+        if middle == low or middle == high:
+            return high, iterations
+        iterations += 1
+        if lasts(middle, expense, rate, target_years):
+            high = middle
+        else:
+            low = middle
+
+
+def _required_principal_bisection(expense: float, rate: float, target_years: int):
+    """Bisection on the year-by-year rule, for when the annuity formula overflows."""
+    low, high = 0.0, max(expense, DEPLETION_THRESHOLD)
+    iterations = 0
+    while not lasts(high, expense, rate, target_years):
+        iterations += 1
+        low, high = high, high * 2
+        if not math.isfinite(high):
+            return math.inf, iterations
+    while True:
+        mid = (low + high) / 2
+        if mid in (low, high):
+            return high, iterations
+        iterations += 1
+        if lasts(mid, expense, rate, target_years):
+            high = mid
+        else:
+            low = mid
+
+
+# --- Vectorized Root Finding ---
+
+def chandrupatla_batch(f, low, high, xtol: float = DEFAULT_XTOL, rtol: float = DEFAULT_RTOL,
+                       maxiter: int = DEFAULT_MAXITER):
+    """
+    Finds one root per scenario with Chandrupatla's method, all scenarios at once.
+
+    Each iteration evaluates f once for every scenario still running, takes an
+    inverse quadratic step where the local shape allows it and a bisection step
+    otherwise, and retires scenarios whose bracket is within tolerance.
+
+    Parameters:
+        f (callable): f(x, index) -> residuals, where `index` holds the
+            positions (into the flattened batch) of the scenarios in x.
+        low, high (array_like): Brackets with a sign change of f.
+        xtol, rtol (float): Stop once the root is known to within xtol + rtol * |root|.
+        maxiter (int): Maximum number of iterations.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (roots, evaluations of f per scenario);
+        NaN roots where the bracket had no sign change.
+    """
+    np = require_numpy("The batch solvers")
+    low, high = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float))
+    shape = low.shape
+    a, b = low.ravel().copy(), high.ravel().copy()
+    index = np.arange(a.size)
+    with np.errstate(over="ignore", invalid="ignore"):
+        fa, fb = np.asarray(f(a, index), dtype=float), np.asarray(f(b, index), dtype=float)
+    roots = np.full(a.size, np.nan)
+    iterations = np.zeros(a.size, dtype=np.int64)
+
+    # Endpoints that are roots already, and brackets without a sign change.
+    roots[fb == 0] = b[fb == 0]
+    roots[fa == 0] = a[fa == 0]
+    running = (fa != 0) & (fb != 0) & (np.signbit(fa) != np.signbit(fb))
+    a, b, fa, fb, index = a[running], b[running], fa[running], fb[running], index[running]
+    c, fc = a.copy(), fa.copy()
+    t = np.full(a.size, 0.5)
+
+    for _ in range(maxiter):
+        if index.size == 0:
+            break
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            x = a + t * (b - a)
+            fx = np.asarray(f(x, index), dtype=float)
+            iterations[index] += 1
+
+            # Keep [a, b] bracketing the root: x replaces a, and the old a or b becomes c.
+            same = np.signbit(fx) == np.signbit(fa)
+            c, fc = np.where(same, a, b), np.where(same, fa, fb)
+            b, fb = np.where(same, b, a), np.where(same, fb, fa)
+            a, fa = x, fx
+
+            best = np.where(np.abs(fa) < np.abs(fb), a, b)
+            tol = xtol + rtol * np.abs(best)
+            limit = 0.5 * tol / np.abs(b - a)
+            done = (limit > 0.5) | (fa == 0) | ~np.isfinite(limit)
+            roots[index[done]] = np.where(fa[done] == 0, a[done], best[done])
+
+            # Inverse quadratic interpolation when it is safe, bisection otherwise.
+            xi = (a - b) / (c - b)
+            phi = (fa - fb) / (fc - fb)
+            quadratic = (phi * phi < xi) & ((1 - phi) * (1 - phi) < 1 - xi)
+            t_quad = (fa / (fb - fa) * fc / (fb - fc)
+                      + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb))
+            t = np.where(quadratic & np.isfinite(t_quad), t_quad, 0.5)
+            t = np.clip(t, limit, 1 - limit)
+
+        keep = ~done
+        a, b, c, fa, fb, fc, t, index = (v[keep] for v in (a, b, c, fa, fb, fc, t, index))
+
+    # Out of iterations: the midpoint of what is left.
+    roots[index] = (a + b) / 2
+    return roots.reshape(shape), iterations.reshape(shape)
+
+
+# --- Batch Planners ---
+
+def requiredContribution_batch(principal, rate, years, target):
+    """
+    Vectorized requiredContribution over arrays of scenarios.
+
+    Returns:
+        np.ndarray: Required contribution per scenario (NaN where undefined).
+    """
+    np = require_numpy("The batch solvers")
+    from batch_models import as_years, broadcast_inputs, fixedInvestor_batch
+
+    principal, rate, target, _ = broadcast_inputs(principal, rate, target, np.asarray(years, dtype=float))
+    years = as_years(years, principal.shape)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        slope = fixedInvestor_batch(0.0, rate, years, 1.0)
+        contribution = (target - fixedInvestor_batch(principal, rate, years, 0.0)) / slope
+    undefined = (years <= 0) | (slope == 0) | ~np.isfinite(slope)
+    return np.where(undefined, np.nan, contribution)
+
+
+def requiredRate_batch(principal, years, target, annual_contribution=0.0, xtol: float = DEFAULT_XTOL,
+                       return_iterations: bool = False):
+    """
+    Vectorized requiredRate over arrays of scenarios.
+
+    The upper bounds are doubled for the whole batch at once, then every
+    scenario is solved by chandrupatla_batch in the same array iterations.
+
+    Returns:
+        np.ndarray: Required rate per scenario (NaN where no rate reaches the
+        target), or tuple[np.ndarray, np.ndarray]: (rates, iterations) when
+        return_iterations is True.
+    """
+    np = require_numpy("The batch solvers")
+    from batch_models import as_years, broadcast_inputs, fixedInvestor_batch
+
+    principal, target, contribution, _ = broadcast_inputs(principal, target, annual_contribution,
+                                                    np.asarray(years, dtype=float))
+    shape = principal.shape
+    years = as_years(years, shape).ravel()
+    principal, target, contribution = principal.ravel(), target.ravel(), contribution.ravel()
+    iterations = np.zeros(principal.size, dtype=np.int64)
+
+    def shortfall(rate, index):
+        return fixedInvestor_batch(principal[index], rate, years[index], contribution[index]) - target[index]
+
+    # Bracket: double the upper bound of every scenario that has not overshot yet.
+    valid = (years > 0) & np.isfinite(principal) & np.isfinite(target) & np.isfinite(contribution)
+    everything = np.arange(principal.size)
+    low = np.full(principal.size, -1.0)
+    high = np.ones(principal.size)
+    with np.errstate(over="ignore", invalid="ignore"):
+        f_low = shortfall(low, everything)
+        iterations[valid] += 1
+        pending = np.flatnonzero(valid)
+        for _ in range(MAX_BRACKET_DOUBLINGS):
+            if pending.size == 0:
+                break
+            f_high = shortfall(high[pending], pending)
+            iterations[pending] += 1
+            closed = (np.signbit(f_high) != np.signbit(f_low[pending])) | (f_high == 0) | (f_low[pending] == 0)
+            stuck = ~closed & ~np.isfinite(f_high)
+            valid[pending[stuck]] = False
+            keep = ~closed & ~stuck
+            pending = pending[keep]
+            low[pending], f_low[pending] = high[pending], f_high[keep]
+            high[pending] = 2 * high[pending] + 1      # doubles the distance from -1
+        valid[pending] = False
+
+    rate = np.full(principal.size, np.nan)
+    solve = np.flatnonzero(valid)
+    if solve.size:
+        rate[solve], evaluations = chandrupatla_batch(lambda x, i: shortfall(x, solve[i]),
+                                                      low[solve], high[solve], xtol=xtol)
+        iterations[solve] += evaluations + 2
+    if return_iterations:
+        return rate.reshape(shape), iterations.reshape(shape)
+    return rate.reshape(shape)
+
+
+def requiredPrincipal_batch(expense, rate, target_years=30, return_iterations: bool = False):
+    """
+    Vectorized requiredPrincipal over arrays of scenarios.
+
+    Uses the same two linear candidates, year-by-year verification and
+    bisection fallback as the scalar solver, each step applied to the whole
+    batch at once, so the results are identical.
+
+    Returns:
+        np.ndarray: Required balance per scenario, or
+        tuple[np.ndarray, np.ndarray]: (balances, iterations) when
+        return_iterations is True.
+    """
+    np = require_numpy("The batch solvers")
+    from batch_models import as_years, broadcast_inputs
+
+    expense, rate, _ = broadcast_inputs(expense, rate, np.asarray(target_years, dtype=float))
+    shape = expense.shape
+    target = as_years(target_years, shape).ravel()
+    expense, rate = expense.ravel(), rate.ravel()
+    balance = np.zeros(expense.size)
+    iterations = np.zeros(expense.size, dtype=np.int64)
+
+    finite = np.isfinite(expense) & np.isfinite(rate)
+    balance[~finite] = np.nan
+    impossible = finite & (target > 1) & ((target > MAX_RETIREMENT_YEARS) | (rate <= -1))
+    balance[impossible] = np.inf
+    solve = finite & (target > 1) & ~impossible
+    bisect = np.zeros(expense.size, dtype=bool)
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        log_q = np.log1p(np.where(solve, rate, 0.0))
+        candidate = np.full(expense.size, -np.inf)
+        for k in (np.ones_like(target), target - 1):
+            growth = np.exp(k * log_q)
+            overflow = solve & ~np.isfinite(growth)
+            bisect |= overflow
+            solve &= ~overflow
+            annuity = np.where(rate == 0, k.astype(float), np.expm1(k * log_q) / np.where(rate == 0, 1.0, rate))
+            candidate = np.maximum(candidate, (DEPLETION_THRESHOLD + expense * annuity) / growth)
+    solve &= candidate > 0
+
+    # As in the scalar solver: bracket the smallest balance the year-by-year
+    # rule accepts with doubling ulp steps around the candidate, then bisect.
+    pending = np.flatnonzero(solve)
+    balance[pending], iterations[pending], failed = _smallest_lasting_batch(
+        expense[pending], rate[pending], target[pending], candidate[pending])
+    bisect[pending[failed]] = True
+
+    if bisect.any():
+        balance[bisect], more = _required_principal_bisection_batch(expense[bisect], rate[bisect], target[bisect])
+        iterations[bisect] += more
+
+    if return_iterations:
+        return balance.reshape(shape), iterations.reshape(shape)
+    return balance.reshape(shape)
+
+
+def _smallest_lasting_batch(expense, rate, target, candidate):
+    """
+    Smallest balance near `candidate` that lasts_batch accepts, per scenario.
+
+    Returns:
+        tuple: (balances, iterations, failed), where `failed` marks
+        scenarios not bracketed within 128 checks (left to the bisection).
+    """
+    np = require_numpy("The batch solvers")
+    from batch_models import lasts_batch
+
+    iterations = np.ones(expense.size, dtype=np.int64)
+    ok = lasts_batch(candidate, expense, rate, target)
+    low = np.where(ok, np.nan, candidate)
+    high = np.where(ok, candidate, np.nan)
+    step = np.spacing(candidate)
+
+    # Expand until every scenario has a failing `low` and a lasting `high`.
+    for _ in range(127):
+        up = np.flatnonzero(np.isnan(high))
+        down = np.flatnonzero(np.isnan(low))
+        if up.size == 0 and down.size == 0:
+            break
+        checked = np.concatenate((up, down))
+        probe = np.concatenate((low[up] + step[up], np.maximum(high[down] - step[down], 0.0)))
+        iterations[checked] += 1
+        ok = lasts_batch(probe, expense[checked], rate[checked], target[checked])
+        high[checked[ok]] = probe[ok]
+        low[checked[~ok]] = probe[~ok]
+        step[checked] *= 2
+    failed = np.isnan(low) | np.isnan(high)
+
+    # Bisect each bracket down to adjacent floats.
+    active = np.flatnonzero(~failed)
+    while active.size:
+        middle = (low[active] + high[active]) / 2
+        moving = (middle != low[active]) & (middle != high[active])
+        active, middle = active[moving], middle[moving]
+        if active.size == 0:
+            break
+        iterations[active] += 1
+        ok = lasts_batch(middle, expense[active], rate[active], target[active])
+        high[active[ok]] = middle[ok]
+        low[active[~ok]] = middle[~ok]
+    return np.where(failed, np.nan, high), iterations, failed
+
+
+def _required_principal_bisection_batch(expense, rate, target):
+    np = require_numpy("The batch solvers")
+    from batch_models import lasts_batch
+
+    iterations = np.zeros(expense.shape, dtype=np.int64)
+    low = np.zeros(expense.shape)
+    high = np.maximum(expense, DEPLETION_THRESHOLD)
+    short = ~lasts_batch(high, expense, rate, target)
+    while short.any():
+        iterations += short
+        low, high = np.where(short, high, low), np.where(short, high * 2, high)
+        short &= np.isfinite(high)
+        short[short] = ~lasts_batch(high[short], expense[short], rate[short], target[short])
+
+    active = np.isfinite(high)
+    while True:
+        mid = (low + high) / 2
+        active &= (mid != low) & (mid != high)
+        if not active.any():
+            break
+        iterations += active
+        lasts = lasts_batch(mid, expense, rate, target)
+        high = np.where(active & lasts, mid, high)
+        low = np.where(active & ~lasts, mid, low)
+    return high, iterations
+
+
+# End of solvers.py
@@ -0,0 +1,39 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Startup timing for the `--startup-profile` option of gui_app and main_app.
+
+Entry points import this module before anything else, so the clock starts as
+close to the top of the program as possible, then call `mark()` at each stage
+(imports done, window built, first paint / menu shown). `report()` prints the
+elapsed time of every stage. Marks are cheap, so entry points record them
+unconditionally and only report when the option is given. For a per-module
+breakdown of the import stage use `python -X importtime`.
+"""
+
+import sys
+import time
+from typing import List, Tuple
+
+_START = time.perf_counter()
+_marks: List[Tuple[str, float]] = []
+
+
+def mark(stage: str):
+    """Records that `stage` finished now."""
+    _marks.append((stage, time.perf_counter()))
+
+
+def report(stream=None):
+    """Prints each stage's duration and the running total (milliseconds)."""
+    stream = sys.stderr if stream is None else stream
+    print("Startup profile (ms):", file=stream)
+    previous = _START
+    for name, at in _marks:
+        print(f"  {name:<24} {(at - previous) * 1000.0:9.1f}   total {(at - _START) * 1000.0:9.1f}", file=stream)
+        previous = at
+
+# End of startup_profile.py
@@ -0,0 +1,123 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""Request parsing, micro-batching and HTTP responses of model_service."""
+
+import asyncio
+import json
+
+import pytest
+
+from financial_models import fixedInvestor, maximumExpensed
+from model_service import MAX_REQUEST_YEARS, MicroBatcher, ModelService, _write_response, parse_arguments
+
+
+# --- Request Parsing ---
+
+def test_parse_arguments_fills_defaults_and_converts_types():
+    assert parse_arguments("fixedInvestor", {"principal": 1000, "rate": 0.05, "years": 30.0}) == (1000.0, 0.05, 30, 0.0)
+    assert parse_arguments("variableInvestor", {"principal": 1, "rates": [0, 0.1]}) == (1.0, [0.0, 0.1], 0.0)
+
+
+@pytest.mark.parametrize("body", [
+    {"principal": 1000, "rate": 0.05},                              # missing years
+    {"principal": 1000, "rate": 0.05, "years": 30, "extra": 1},     # unknown parameter
+    {"principal": "1000", "rate": 0.05, "years": 30},               # not a number
+    {"principal": 1000, "rate": 0.05, "years": 2.5},                # not an int
+    {"principal": 1000, "rate": True, "years": 30},                 # bools are not numbers
+    {"principal": 1000, "rate": 0, "years": MAX_REQUEST_YEARS + 1},
+    {"principal": 1000, "rate": 0, "years": 10 ** 20},
+    [1000, 0.05, 30],
+])
+def test_parse_arguments_rejects_invalid_bodies(body):
+    with pytest.raises(ValueError):
+        parse_arguments("fixedInvestor", body)
+
+
+# --- Micro-Batching ---
+
+def test_micro_batcher_isolates_a_failing_request():
+    async def run():
+        batcher = MicroBatcher("fixedInvestor", 0.002, 1024)
+        futures = [batcher.submit((1000.0, 0.05, 30, 0.0)),
+                   batcher.submit((1000.0, 0.05, 10 ** 20, 0.0)),     # overflows the year kernel
+                   batcher.submit((1000.0, 0.0, 3, 1.0))]
+        return await asyncio.gather(*futures, return_exceptions=True), batcher.batches
+
+    (good, bad, flat), batches = asyncio.run(run())
+    assert batches == 1
+    assert good == pytest.approx(fixedInvestor(1000.0, 0.05, 30))
+    assert isinstance(bad, ArithmeticError)
+    assert flat == 1003.0
+
+
+def test_micro_batcher_batches_concurrent_requests():
+    async def run():
+        batcher = MicroBatcher("maximumExpensed", 0.002, 4)
+        futures = [batcher.submit((1e6, rate, 30)) for rate in (0.03, 0.04, 0.05, 0.06, 0.07)]
+        return await asyncio.gather(*futures), batcher.batches
+
+    results, batches = asyncio.run(run())
+    assert batches == 2        # one full batch of 4, then the window flushes the fifth
+    assert results == [maximumExpensed(1e6, rate, 30) for rate in (0.03, 0.04, 0.05, 0.06, 0.07)]
+
+
+# --- HTTP ---
+
+class _Writer:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+
+def test_non_finite_results_are_sent_as_null():
+    writer = _Writer()
+    _write_response(writer, 200, {"result": float("inf"), "models": {"a": [float("nan"), 1.5]}}, True)
+    head, _, body = writer.data.partition(b"\r\n\r\n")
+    assert b"Content-Length: %d" % len(body) in head
+    assert json.loads(body, parse_constant=pytest.fail) == {"result": None, "models": {"a": [None, 1.5]}}
+
+
+def test_service_end_to_end():
+    async def request(port, method, path, body=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = json.dumps(body).encode() if body is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+                     + data)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        status = int(response.split(b" ", 2)[1])
+        return status, json.loads(response.partition(b"\r\n\r\n")[2])
+
+    async def run():
+        service = ModelService(workers=1)
+        try:
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            results = await asyncio.gather(
+                request(port, "POST", "/fixedInvestor", {"principal": 10000, "rate": 0.05, "years": 30}),
+                request(port, "POST", "/maximumExpensed", {"balance": 500000, "rate": 0.05, "target_years": 30}),
+                request(port, "POST", "/fixedInvestor", {"principal": 1e308, "rate": 1.0, "years": 10}),
+                request(port, "POST", "/fixedInvestor", {"principal": 1, "rate": 0, "years": 2000000}),
+                request(port, "GET", "/nowhere"),
+                request(port, "POST", "/paths", {"principal": 100, "rates": [0.1, 0.1]}))
+            server.close()
+            await server.wait_closed()
+            return results
+        finally:
+            service.executor.shutdown(cancel_futures=True)
+
+    fixed, withdrawal, overflow, too_long, missing, path = asyncio.run(run())
+    assert fixed == (200, {"result": pytest.approx(fixedInvestor(10000, 0.05, 30))})
+    assert withdrawal == (200, {"result": maximumExpensed(500000, 0.05, 30)})
+    assert overflow == (200, {"result": None})
+    assert too_long[0] == 400 and "years" in too_long[1]["error"]
+    assert missing[0] == 404
+    assert path[0] == 200 and path[1]["result"] == pytest.approx(121.0)
+
+# End of test_model_service.py
@@ -0,0 +1,77 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""Safe withdrawals checked path by path against finallyRetired's loop rule."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from financial_models import _finally_retired_loop, maximumExpensed
+from monte_carlo import LognormalReturns
+from safe_withdrawal import critical_withdrawals, safe_withdrawal, safe_withdrawal_from_paths
+
+
+def _years_lasted(balance, withdrawal, path, target_years):
+    # finallyRetired's loop on one path's own rates, stopped at target_years
+    current, years = balance, 0
+    while current > 0 and years < target_years:
+        current = current * (1 + path[years])
+        current -= withdrawal
+        years += 1
+        if current < 1e-6:
+            break
+    return years
+
+
+def _lasts(balance, withdrawal, rates, target_years):
+    return np.array([_years_lasted(balance, withdrawal, path, target_years) >= target_years for path in rates])
+
+
+def _paths(seed, n_paths=200, years=30):
+    return np.random.default_rng(seed).lognormal(np.log(1.05), 0.15, (n_paths, years)) - 1
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_success_rate_at_safe_withdrawal_is_at_least_p(seed):
+    rates = _paths(seed)
+    result = safe_withdrawal_from_paths(1e6, rates, target_years=30, success_probability=0.9)
+    assert _lasts(1e6, result.withdrawal, rates, 30).mean() >= 0.9
+
+
+def test_monte_carlo_success_rate_is_at_least_p():
+    model = LognormalReturns.from_moments(0.05, 0.15)
+    result = safe_withdrawal(1e6, model, target_years=30, success_probability=0.9, n_paths=400, seed=3)
+    assert result.success_rate(result.withdrawal) >= 0.9
+    assert result.confidence_interval[0] <= result.withdrawal <= result.confidence_interval[1]
+
+
+def test_critical_withdrawals_are_the_largest_lasting():
+    rates = np.random.default_rng(7).normal(0.05, 0.3, (300, 30))
+    critical = critical_withdrawals(1e5, rates, 30)
+    for path, withdrawal in zip(rates, critical):
+        if withdrawal > 0:
+            assert _lasts(1e5, withdrawal, [path], 30)[0]
+            if withdrawal < 1e5:
+                assert not _lasts(1e5, np.nextafter(withdrawal, np.inf), [path], 30)[0]
+        else:
+            assert withdrawal == -np.inf and not _lasts(1e5, 0.0, [path], 30)[0]
+
+
+def test_constant_rate_paths_match_maximum_expensed():
+    rates = np.full((3, 30), 0.04)
+    critical = critical_withdrawals(500000.0, rates, 30)
+    assert np.all(critical == maximumExpensed(500000.0, 0.04, 30))
+    assert _finally_retired_loop(500000.0, float(critical[0]), 0.04) >= 30
+
+
+def test_invalid_arguments():
+    rates = _paths(0, n_paths=10)
+    with pytest.raises(ValueError):
+        safe_withdrawal_from_paths(1e6, rates, 30, success_probability=0.0)
+    with pytest.raises(ValueError):
+        critical_withdrawals(1e6, rates, 40)
+
+# End of test_safe_withdrawal.py
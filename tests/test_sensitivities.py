@@ -0,0 +1,47 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""Analytic sensitivities against central finite differences."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sensitivities import fixedInvestor_sensitivities, maximumExpensed_sensitivities
+
+
+def _central(f, x, h):
+    return (f(x + h) - f(x - h)) / (2 * h)
+
+
+def test_fixed_investor_derivatives():
+    s = fixedInvestor_sensitivities(10000.0, 0.05, 30, 1200.0)
+    assert float(s.d_principal) == pytest.approx(
+        _central(lambda p: float(fixedInvestor_sensitivities(p, 0.05, 30, 1200.0).value), 10000.0, 1.0), rel=1e-6)
+    assert float(s.d_rate) == pytest.approx(
+        _central(lambda r: float(fixedInvestor_sensitivities(10000.0, r, 30, 1200.0).value), 0.05, 1e-6), rel=1e-6)
+
+
+def test_maximum_expensed_derivatives():
+    s = maximumExpensed_sensitivities(1e6, 0.05, 30)
+    assert float(s.d_principal) == pytest.approx(
+        _central(lambda b: float(maximumExpensed_sensitivities(b, 0.05, 30).value), 1e6, 1.0), rel=1e-6)
+    assert float(s.d_rate) == pytest.approx(
+        _central(lambda r: float(maximumExpensed_sensitivities(1e6, r, 30).value), 0.05, 1e-6), rel=1e-6)
+
+
+def test_maximum_expensed_derivatives_are_nan_without_a_closed_form():
+    s = maximumExpensed_sensitivities([1e6, 1e6, -5.0], [5.0, -1.5, 0.05], [500, 30, 30])
+    for derivative in (s.d_principal, s.d_rate, s.d_years):
+        assert all(math.isnan(d) for d in derivative)
+
+
+def test_maximum_expensed_derivatives_outside_the_horizon_are_zero():
+    s = maximumExpensed_sensitivities(1e6, 0.05, 600)
+    assert float(s.value) == 0.0 and float(s.d_principal) == 0.0 and float(s.d_rate) == 0.0
+
+# End of test_sensitivities.py
@@ -0,0 +1,91 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""Behaviour of the inverse solvers against the year-by-year model rules."""
+
+import math
+import random
+
+import pytest
+
+from financial_models import _finally_retired_loop, fixedInvestor, lasts, maximumExpensed
+from solvers import (brent, requiredContribution, requiredContribution_batch, requiredPrincipal,
+                     requiredPrincipal_batch, requiredRate, requiredRate_batch)
+
+np = pytest.importorskip("numpy")
+
+
+def _principal_cases(count=1000, seed=0):
+    rng = random.Random(seed)
+    return [(rng.uniform(100, 1e5), rng.uniform(-0.1, 0.15), rng.randint(2, 60)) for _ in range(count)]
+
+
+def test_required_principal_lasts_under_the_loop_rule():
+    for expense, rate, target in _principal_cases():
+        balance = requiredPrincipal(expense, rate, target)
+        assert _finally_retired_loop(balance, expense, rate) >= target, (expense, rate, target)
+
+
+def test_required_principal_is_minimal():
+    for expense, rate, target in _principal_cases():
+        balance = requiredPrincipal(expense, rate, target)
+        assert not lasts(math.nextafter(balance, 0.0), expense, rate, target), (expense, rate, target)
+
+
+def test_required_principal_is_consistent_with_maximum_expensed():
+    # maximumExpensed never withdraws more than the balance itself
+    for expense, rate, target in _principal_cases():
+        balance = requiredPrincipal(expense, rate, target)
+        assert maximumExpensed(balance, rate, target) >= min(expense, balance), (expense, rate, target)
+
+
+def test_required_principal_reported_cases():
+    for expense, rate, target in [(2997.622305533112, -0.037032070967663144, 33),
+                                  (64932.55785837873, 0.11531517211271791, 16)]:
+        for balance in (requiredPrincipal(expense, rate, target),
+                        float(requiredPrincipal_batch(expense, rate, target))):
+            assert _finally_retired_loop(balance, expense, rate) >= target
+
+
+def test_required_principal_batch_matches_scalar_exactly():
+    cases = _principal_cases(2000, seed=1)
+    expense, rate, target = (np.array(column) for column in zip(*cases))
+    batch = requiredPrincipal_batch(expense, rate, target)
+    scalar = np.array([requiredPrincipal(*case) for case in cases])
+    assert np.array_equal(batch, scalar)
+
+
+def test_required_principal_edge_cases():
+    assert requiredPrincipal(1000.0, 0.05, 1) == 0.0
+    assert requiredPrincipal(1000.0, 0.05, 501) == math.inf
+    assert requiredPrincipal(1000.0, -1.0, 5) == math.inf
+    assert math.isnan(requiredPrincipal(math.nan, 0.05, 5))
+    batch = requiredPrincipal_batch([1000.0, 1000.0, 1000.0, math.nan], [0.05, 0.05, -1.0, 0.05], [1, 501, 5, 5])
+    assert batch[0] == 0.0 and batch[1] == math.inf and batch[2] == math.inf and math.isnan(batch[3])
+
+
+def test_required_contribution_reaches_target():
+    contribution = requiredContribution(10000.0, 0.05, 30, 500000.0)
+    assert fixedInvestor(10000.0, 0.05, 30, contribution) == pytest.approx(500000.0, rel=1e-12)
+    batch = requiredContribution_batch([10000.0, 0.0], [0.05, 0.0], [30, 10], [500000.0, 1000.0])
+    assert batch[0] == pytest.approx(contribution, rel=1e-12)
+    assert batch[1] == pytest.approx(100.0)
+
+
+def test_required_rate_reaches_target():
+    rate = requiredRate(10000.0, 30, 100000.0, 1200.0)
+    assert fixedInvestor(10000.0, rate, 30, 1200.0) == pytest.approx(100000.0, rel=1e-9)
+    batch = requiredRate_batch([10000.0, 10000.0], [30, 30], [100000.0, -1.0], [1200.0, 0.0])
+    assert batch[0] == pytest.approx(rate, abs=1e-10)
+    assert math.isnan(batch[1])
+
+
+def test_brent_finds_root_and_rejects_bad_bracket():
+    root, _ = brent(lambda x: x * x - 2, 0.0, 2.0)
+    assert root == pytest.approx(math.sqrt(2), rel=1e-12)
+    with pytest.raises(ValueError):
+        brent(lambda x: x * x + 1, 0.0, 2.0)
+
+# End of test_solvers.py
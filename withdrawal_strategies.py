@@ -0,0 +1,237 @@
+# Project       :   Analysis of Algorithms
+# Instructor    :   Oral Robinson
+# Date          :   November , 2025
+# Authors       :   Desrine Harripaul, Rackeel Brooks, Giomar Griffiths and Zemario Pascoe
+
+"""
+Decumulation with pluggable withdrawal strategies, vectorized across scenarios.
+
+finallyRetired withdraws a constant nominal expense at a fixed rate. Here
+each year of every scenario follows the same recurrence,
+
+    grown   = balance * (1 + r_y)
+    balance = grown - w_y
+
+with the withdrawal w_y chosen by a strategy. As in finallyRetired, a
+scenario is depleted in the first year its balance falls below 1e-6, and that
+year counts as lasted. The loop runs once over the years for the whole batch,
+and each strategy is an array kernel evaluated for every scenario in one call.
+The cost is O(scenarios x years) in array operations, with no Python work per
+scenario.
+
+Strategies (amounts are nominal; `price` is the cumulative inflation index,
+1 in the first year):
+
+    ConstantWithdrawal(expense)             w = expense (finallyRetired)
+    InflationIndexedWithdrawal(expense)     w = expense * price
+    PercentageWithdrawal(percent)           w = percent * grown
+    FloorCeilingWithdrawal(percent, floor, ceiling)
+                                            w = percent * grown, clipped to
+                                            [floor, ceiling] * price
+    GuardrailsWithdrawal(initial_rate, band, adjustment)
+                                            Guyton-Klinger: last year's amount
+                                            plus inflation (skipped after a
+                                            losing year when the withdrawal rate
+                                            is above its initial value), cut by
+                                            `adjustment` when the rate drifts
+                                            above initial_rate * (1 + band) and
+                                            raised when it drifts below
+                                            initial_rate * (1 - band)
+
+A withdrawal is capped at what is left in the year the scenario depletes.
+Depleted scenarios withdraw nothing afterwards.
+
+    result = simulate_withdrawals(1e6, rate_paths, GuardrailsWithdrawal(0.05), inflation=0.025)
+    result.years_lasted, result.depleted, result.withdrawals
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from financial_models import DEPLETION_THRESHOLD
+
+
+@dataclass
+class WithdrawalResult:
+    """Per-scenario outcomes of simulate_withdrawals."""
+    years_lasted: np.ndarray        # years with a withdrawal, including the depleting one (horizon if never)
+    depleted: np.ndarray            # balance fell below the threshold within the horizon
+    final_balances: np.ndarray      # balance at the end of the horizon (0 once depleted)
+    withdrawals: np.ndarray         # (scenarios, years) amounts actually withdrawn
+
+    @property
+    def success_rate(self) -> float:
+        """Share of scenarios that never depleted."""
+        return float(np.mean(~self.depleted))
+
+
+# --- Withdrawal Strategies ---
+
+class WithdrawalStrategy:
+    """
+    Base class: chooses every scenario's withdrawal for one year at a time.
+
+    start() is called once with the starting balances and returns the
+    strategy's per-scenario state; withdraw() is then called for each year.
+    """
+
+    def start(self, balance: np.ndarray) -> Dict[str, np.ndarray]:
+        return {}
+
+    def withdraw(self, year: int, grown: np.ndarray, rate: np.ndarray, price: np.ndarray,
+                 state: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Parameters:
+            year (int): 0-based year index.
+            grown (np.ndarray): Balances after this year's growth.
+            rate (np.ndarray): This year's rates.
+            price (np.ndarray): Cumulative inflation index (1 in year 0).
+            state (dict): The arrays returned by start(), updated in place.
+
+        Returns:
+            np.ndarray: Planned withdrawal per scenario.
+        """
+        raise NotImplementedError
+
+
+class ConstantWithdrawal(WithdrawalStrategy):
+    """The same nominal amount every year, like finallyRetired."""
+
+    def __init__(self, expense: float):
+        self.expense = expense
+
+    def withdraw(self, year, grown, rate, price, state):
+        return np.full(grown.shape, float(self.expense))
+
+
+class InflationIndexedWithdrawal(WithdrawalStrategy):
+    """A constant real amount: `expense` in first-year money, grown with inflation."""
+
+    def __init__(self, expense: float):
+        self.expense = expense
+
+    def withdraw(self, year, grown, rate, price, state):
+        return self.expense * price
+
+
+class PercentageWithdrawal(WithdrawalStrategy):
+    """A fixed share of the portfolio each year."""
+
+    def __init__(self, percent: float):
+        if not 0 <= percent <= 1:
+            raise ValueError("percent must be between 0 and 1")
+        self.percent = percent
+
+    def withdraw(self, year, grown, rate, price, state):
+        return self.percent * np.maximum(grown, 0.0)
+
+
+class FloorCeilingWithdrawal(WithdrawalStrategy):
+    """A share of the portfolio, kept between a real floor and a real ceiling."""
+
+    def __init__(self, percent: float, floor: float, ceiling: float):
+        if not 0 <= percent <= 1:
+            raise ValueError("percent must be between 0 and 1")
+        if not 0 <= floor <= ceiling:
+            raise ValueError("floor must be non-negative and at most the ceiling")
+        self.percent = percent
+        self.floor = floor
+        self.ceiling = ceiling
+
+    def withdraw(self, year, grown, rate, price, state):
+        return np.clip(self.percent * np.maximum(grown, 0.0), self.floor * price, self.ceiling * price)
+
+
+class GuardrailsWithdrawal(WithdrawalStrategy):
+    """Guyton-Klinger decision rules around an initial withdrawal rate."""
+
+    def __init__(self, initial_rate: float, band: float = 0.20, adjustment: float = 0.10,
+                 skip_inflation_after_loss: bool = True):
+        if not 0 < initial_rate <= 1:
+            raise ValueError("initial_rate must be between 0 and 1")
+        if not (0 <= band < 1 and 0 <= adjustment < 1):
+            raise ValueError("band and adjustment must be between 0 and 1")
+        self.initial_rate = initial_rate
+        self.band = band
+        self.adjustment = adjustment
+        self.skip_inflation_after_loss = skip_inflation_after_loss
+
+    def start(self, balance):
+        return {"amount": self.initial_rate * balance, "price": np.ones(balance.shape)}
+
+    def withdraw(self, year, grown, rate, price, state):
+        amount = state["amount"]
+        if year > 0:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                inflate = price / state["price"]
+                if self.skip_inflation_after_loss:
+                    inflate = np.where((rate < 0) & (amount > self.initial_rate * grown), 1.0, inflate)
+                amount = amount * inflate
+                current = amount / grown
+            amount = np.where(current > self.initial_rate * (1 + self.band), amount * (1 - self.adjustment), amount)
+            amount = np.where(current < self.initial_rate * (1 - self.band), amount * (1 + self.adjustment), amount)
+        state["amount"], state["price"] = amount, price
+        return amount
+
+
+STRATEGIES = {
+    "constant": ConstantWithdrawal,
+    "inflation-indexed": InflationIndexedWithdrawal,
+    "percentage": PercentageWithdrawal,
+    "floor-ceiling": FloorCeilingWithdrawal,
+    "guardrails": GuardrailsWithdrawal,
+}
+
+# --- Engine ---
+
+def simulate_withdrawals(balance, rate_paths, strategy: WithdrawalStrategy, inflation=0.0) -> WithdrawalResult:
+    """
+    Runs `strategy` over every scenario's rate path.
+
+    Parameters:
+        balance (array_like): Starting balance per scenario (scalars broadcast).
+        rate_paths (array_like): (scenarios, years) annual rates; a single
+            path (years,) is shared by every scenario.
+        strategy (WithdrawalStrategy): Withdrawal rule.
+        inflation (array_like): Annual inflation, scalar, per year (years,)
+            or per scenario and year (scenarios, years).
+
+    Returns:
+        WithdrawalResult: Years lasted, depletion mask, final balances and
+        the (scenarios, years) withdrawal stream.
+    """
+    rate_paths = np.atleast_2d(np.asarray(rate_paths, dtype=float))
+    balance = np.asarray(balance, dtype=float)
+    n_paths = np.broadcast_shapes(balance.reshape(-1).shape, rate_paths.shape[:1])[0]
+    n_years = rate_paths.shape[1]
+    rate_paths = np.broadcast_to(rate_paths, (n_paths, n_years))
+    inflation = np.broadcast_to(np.asarray(inflation, dtype=float), (n_paths, n_years))
+    current = np.array(np.broadcast_to(balance.reshape(-1), (n_paths,)))
+
+    withdrawals = np.zeros((n_paths, n_years))
+    years = np.zeros(n_paths, dtype=np.int64)
+    active = current > 0
+    price = np.ones(n_paths)
+    state = strategy.start(current.copy())
+
+    for year in range(n_years):
+        if not active.any():
+            break
+        if year > 0:
+            price = price * (1 + inflation[:, year - 1])
+        rate = rate_paths[:, year]
+        with np.errstate(over="ignore", invalid="ignore"):
+            grown = current * (1 + rate)
+            amount = strategy.withdraw(year, grown, rate, price, state)
+            remaining = grown - amount
+        withdrawals[:, year] = np.where(active, np.minimum(amount, np.maximum(grown, 0.0)), 0.0)
+        current = np.where(active, remaining, current)
+        years += active
+        active &= ~(remaining < DEPLETION_THRESHOLD)
+
+    depleted = current < DEPLETION_THRESHOLD
+    return WithdrawalResult(years, depleted, np.where(depleted, 0.0, current), withdrawals)
+
+# End of withdrawal_strategies.py